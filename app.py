@@ -6,7 +6,7 @@ import base64
 import math
 import json
 from PyQt6.QtWidgets import QWidget, QApplication, QVBoxLayout
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QImage, qGray, QPainterPath
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QImage, QPainterPath
 from PyQt6.QtCore import (
     Qt, QPropertyAnimation, pyqtProperty, QEasingCurve, QSequentialAnimationGroup,
     QThread, pyqtSignal, QByteArray, QRectF, QAbstractAnimation
@@ -15,6 +15,8 @@ from PyQt6.QtCore import (
 start_application_func = None
 APP_DATA_PATH = os.path.join(os.getenv('APPDATA'), "MIMM")
 CONFIG_PATH = os.path.join(APP_DATA_PATH, "config.json")
+WAVE_SAMPLES = 48
+WAVE_FREQUENCY = 2.5
 
 def load_splash_config():
     if not os.path.exists(CONFIG_PATH): return {}
@@ -38,19 +40,10 @@ class AnimatedIconWidget(QWidget):
         super().__init__(parent)
         self.color_pixmap = color_pixmap
         source_image = self.color_pixmap.toImage().convertToFormat(QImage.Format.Format_ARGB32)
-        grayscale_image = QImage(source_image.size(), QImage.Format.Format_ARGB32)
-        grayscale_image.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(grayscale_image)
-        for x in range(source_image.width()):
-            for y in range(source_image.height()):
-                pixel_color = source_image.pixelColor(x, y)
-                gray_value = qGray(pixel_color.rgb())
-                alpha_value = pixel_color.alpha()
-                new_grayscale_color = QColor(gray_value, gray_value, gray_value, alpha_value)
-                painter.setPen(new_grayscale_color)
-                painter.drawPoint(x, y)
-        painter.end()
+        grayscale_image = source_image.convertToFormat(QImage.Format.Format_Grayscale8).convertToFormat(QImage.Format.Format_ARGB32)
+        grayscale_image.setAlphaChannel(source_image.convertToFormat(QImage.Format.Format_Alpha8))
         self.grayscale_pixmap = QPixmap.fromImage(grayscale_image)
+        self._wave_table = [(i / WAVE_SAMPLES, (i / WAVE_SAMPLES) * WAVE_FREQUENCY * 2 * math.pi, (i / WAVE_SAMPLES) * WAVE_FREQUENCY * 3.5 * math.pi, (i / WAVE_SAMPLES) * WAVE_FREQUENCY * 8.0 * math.pi) for i in range(WAVE_SAMPLES + 1)]
 
         self.setFixedSize(int(self.color_pixmap.width() * 1.2), int(self.color_pixmap.height() * 1.2))
 
@@ -176,15 +169,13 @@ class AnimatedIconWidget(QWidget):
             wave_y_base = target_draw_rect.bottom() - (target_draw_rect.height() * self._progress)
             
             amplitude = self._wave_agitation * (1 - self._progress * 0.5) 
-            frequency = 2.5
-            clip_path.moveTo(target_draw_rect.left() - 1, target_draw_rect.bottom() + 1)
-            clip_path.lineTo(target_draw_rect.left() - 1, wave_y_base)
-            for x in range(int(target_draw_rect.left()), int(target_draw_rect.right()) + 2):
-                y_wave = wave_y_base
-                y_wave += amplitude * math.sin((x / scaled_width) * frequency * 2 * math.pi + self._wave_phase)
-                y_wave += (amplitude * 0.3) * math.sin((x / scaled_width) * frequency * 3.5 * math.pi + self._wave_phase * 2.2)
-                y_wave += (amplitude * 0.15) * math.sin((x / scaled_width) * frequency * 8.0 * math.pi + self._wave_phase * 1.5)
-                clip_path.lineTo(x, y_wave)
+            phase_1, phase_2, phase_3 = self._wave_phase, self._wave_phase * 2.2, self._wave_phase * 1.5
+            left, width = target_draw_rect.left() - 1, target_draw_rect.width() + 2
+            clip_path.moveTo(left, target_draw_rect.bottom() + 1)
+            clip_path.lineTo(left, wave_y_base)
+            for t, angle_1, angle_2, angle_3 in self._wave_table:
+                y_wave = wave_y_base + amplitude * (math.sin(angle_1 + phase_1) + 0.3 * math.sin(angle_2 + phase_2) + 0.15 * math.sin(angle_3 + phase_3))
+                clip_path.lineTo(left + t * width, y_wave)
             clip_path.lineTo(target_draw_rect.right() + 1, target_draw_rect.bottom() + 1)
             clip_path.closeSubpath()
             painter.setClipPath(clip_path)
@@ -0,0 +1,170 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from lib.http_client import get_http_client, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from lib.paths import APP_DATA_PATH
+
+API_CACHE_PATH = os.path.join(APP_DATA_PATH, "api_cache")
+MAX_MEMORY_ENTRIES = 256
+MAX_DISK_ENTRIES = 2000
+
+ENDPOINT_TTLS = [
+    (re.compile(r"/Mod/Categories"), 24 * 3600, 14 * 24 * 3600),
+    (re.compile(r"/Mod/(ByCategory|ByName)"), 5 * 60, 3600),
+    (re.compile(r"/Mod/\d+"), 10 * 60, 24 * 3600),
+    (re.compile(r"/Game/\d+/Subfeed"), 5 * 60, 3600),
+    (re.compile(r"api\.github\.com"), 3600, 7 * 24 * 3600),
+]
+DEFAULT_TTL = (5 * 60, 3600)
+MIN_STALE_TTL = min([stale_ttl for _, _, stale_ttl in ENDPOINT_TTLS] + [DEFAULT_TTL[1]])
+
+class ApiResponseCache:
+    def __init__(self, cache_path=API_CACHE_PATH, max_memory_entries=MAX_MEMORY_ENTRIES):
+        self.cache_path = cache_path
+        os.makedirs(self.cache_path, exist_ok=True)
+        self.max_memory_entries = max_memory_entries
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._in_flight = {}
+        threading.Thread(target=self.prune_disk, daemon=True).start()
+
+    def _make_key(self, url, params):
+        items = params.items() if isinstance(params, dict) else (params or [])
+        return get_http_client().resolve_url(url) + "?" + "&".join(f"{k}={v}" for k, v in sorted(items))
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_path, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json")
+
+    def _ttls_for(self, url):
+        for pattern, ttl, stale_ttl in ENDPOINT_TTLS:
+            if pattern.search(url): return ttl, stale_ttl
+        return DEFAULT_TTL
+
+    def _is_expired(self, path, now):
+        try:
+            with open(path, 'r', encoding='utf-8') as f: entry = json.load(f)
+        except (OSError, json.JSONDecodeError): return True
+        return now - entry.get('fetched_at', 0) >= self._ttls_for(entry.get('url', ''))[1]
+
+    def prune_disk(self):
+        now, removed, entries = time.time(), 0, []
+        try:
+            with os.scandir(self.cache_path) as it:
+                for entry in it:
+                    if entry.is_file(): entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            return
+        entries.sort(reverse=True)
+        for index, (mtime, path) in enumerate(entries):
+            if index < MAX_DISK_ENTRIES and (now - mtime < MIN_STALE_TTL or (path.endswith(".json") and not self._is_expired(path, now))): continue
+            try: os.remove(path); removed += 1
+            except OSError: pass
+        if removed: print(f"Caché de la API: {removed} respuestas caducadas eliminadas del disco.")
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries: self._memory.popitem(last=False)
+
+    def _load_entry(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f: entry = json.load(f)
+        except (OSError, json.JSONDecodeError): return None
+        self._remember(key, entry)
+        return entry
+
+    def _store_entry(self, key, entry):
+        self._remember(key, entry)
+        temp_path = self._entry_path(key) + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f: json.dump(entry, f)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError as e:
+            print(f"No se pudo guardar la respuesta en la caché de la API: {e}")
+
+    def _fetch(self, key, url, params, entry, timeout, priority):
+        headers = {}
+        if entry:
+            if entry.get('etag'): headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'): headers['If-Modified-Since'] = entry['last_modified']
+        response = get_http_client().get(url, params=params, headers=headers, timeout=timeout, priority=priority)
+        if response.status_code == 304 and entry:
+            entry = dict(entry, fetched_at=time.time())
+            self._store_entry(key, entry)
+            return entry['data']
+        response.raise_for_status()
+        data = response.json()
+        self._store_entry(key, {
+            "url": url, "params": params if isinstance(params, dict) else list(params or []), "fetched_at": time.time(), "data": data,
+            "etag": response.headers.get('ETag'), "last_modified": response.headers.get('Last-Modified')
+        })
+        return data
+
+    def _single_flight(self, key, url, params, entry, timeout, priority=PRIORITY_INTERACTIVE):
+        with self._lock:
+            flight = self._in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = {"event": threading.Event(), "result": None, "error": None}
+                self._in_flight[key] = flight
+        if not is_leader:
+            flight["event"].wait()
+            if flight["error"]: raise flight["error"]
+            return flight["result"]
+        try:
+            flight["result"] = self._fetch(key, url, params, entry, timeout, priority)
+            return flight["result"]
+        except Exception as e:
+            flight["error"] = e
+            raise
+        finally:
+            with self._lock: self._in_flight.pop(key, None)
+            flight["event"].set()
+
+    def _revalidate_in_background(self, key, url, params, entry, timeout):
+        with self._lock:
+            if key in self._in_flight: return
+        def revalidate():
+            try: self._single_flight(key, url, params, entry, timeout, PRIORITY_BACKGROUND)
+            except Exception as e: print(f"No se pudo revalidar '{url}' en segundo plano: {e}")
+        threading.Thread(target=revalidate, daemon=True).start()
+
+    def get_json(self, url, params=None, ttl=None, force_refresh=False, timeout=None, priority=PRIORITY_INTERACTIVE):
+        key = self._make_key(url, params)
+        fresh_ttl, stale_ttl = self._ttls_for(url)
+        if ttl is not None: fresh_ttl = ttl
+        entry = self._load_entry(key)
+        if entry and not force_refresh:
+            age = time.time() - entry.get('fetched_at', 0)
+            if age < fresh_ttl:
+                get_http_client().record_cache_hit(url)
+                return entry['data']
+            if age < stale_ttl:
+                get_http_client().record_cache_hit(url)
+                self._revalidate_in_background(key, url, params, entry, timeout)
+                return entry['data']
+        return self._single_flight(key, url, params, entry, timeout, priority)
+
+    def invalidate(self, url, params=None):
+        key = self._make_key(url, params)
+        with self._lock: self._memory.pop(key, None)
+        try: os.remove(self._entry_path(key))
+        except OSError: pass
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_api_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None: _cache = ApiResponseCache()
+        return _cache
@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lib.api_cache import get_api_cache
+from lib.http_client import PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+
+CATEGORIES_URL = "https://gamebanana.com/apiv11/Mod/Categories"
+EXCLUDED_SUBCATEGORIES = {"NPCs & Entities"}
+REFRESH_INTERVAL = 24 * 3600
+MISS_REFRESH_INTERVAL = 600
+
+class CategoryIndex:
+    def __init__(self, app_data_path, game_data):
+        self.index_path = os.path.join(app_data_path, "category_index.json")
+        self.game_data = game_data
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self._resolving = {}
+        self.index = self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f: return json.load(f)
+        except (OSError, json.JSONDecodeError): return {}
+
+    def _save(self):
+        with self._lock: data = json.dumps(self.index, indent=4, ensure_ascii=False)
+        temp_path = self.index_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f: f.write(data)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"No se pudo guardar el índice de categorías: {e}")
+
+    def _indexable_categories(self, game_name):
+        for key, data in self.game_data.get(game_name, {}).get("categories", {}).items():
+            if data.get("type") == "direct_management": continue
+            category_api_id = data.get("id") or data.get("api_id")
+            if category_api_id: yield key, category_api_id
+
+    def _category_key_for_id(self, game_name, category_api_id):
+        return next((key for key, api_id in self._indexable_categories(game_name) if str(api_id) == str(category_api_id)), None)
+
+    def record_category(self, game_name, category_api_id, subcategories, save=True):
+        category_key = self._category_key_for_id(game_name, category_api_id)
+        if not category_key: return
+        with self._lock:
+            game_index = self.index.setdefault(game_name, {"names": {}, "ids": {}, "updated_at": 0})
+            game_index.setdefault("fetched", {})[str(category_api_id)] = time.time()
+            for entry in subcategories:
+                name, subcategory_id = entry.get("name"), entry.get("id")
+                if not name or name.strip() in EXCLUDED_SUBCATEGORIES: continue
+                game_index["names"][name] = [category_key, category_api_id, subcategory_id]
+                if subcategory_id: game_index["ids"][str(subcategory_id)] = [category_key, category_api_id, name]
+        if save: self._save()
+
+    def lookup(self, game_name, subcategory_name=None, subcategory_id=None):
+        with self._lock:
+            game_index = self.index.get(game_name)
+            if not game_index: return None
+            entry = game_index["ids"].get(str(subcategory_id)) if subcategory_id else None
+            if not entry and subcategory_name: entry = game_index["names"].get(subcategory_name)
+            return entry[0] if entry else None
+
+    def _fetch_category(self, category_api_id, force_refresh=False, priority=PRIORITY_INTERACTIVE):
+        data = get_api_cache().get_json(CATEGORIES_URL, params={"_idCategoryRow": category_api_id, "_sSort": "a_to_z"}, force_refresh=force_refresh, timeout=15, priority=priority)
+        return [{"name": item.get('_sName'), "id": item.get('_idRow')} for item in data if item.get('_sName')]
+
+    def _fetched_at(self, game_name, category_api_id):
+        with self._lock: return self.index.get(game_name, {}).get("fetched", {}).get(str(category_api_id), 0)
+
+    def refresh_game(self, game_name, force_refresh=False, priority=PRIORITY_INTERACTIVE, skip_fresher_than=0):
+        categories = [(key, api_id) for key, api_id in self._indexable_categories(game_name) if time.time() - self._fetched_at(game_name, api_id) >= skip_fresher_than]
+        if not categories: return
+        with ThreadPoolExecutor(max_workers=min(4, len(categories))) as executor:
+            futures = {executor.submit(self._fetch_category, api_id, force_refresh, priority): api_id for _, api_id in categories}
+            for future, api_id in futures.items():
+                try: self.record_category(game_name, api_id, future.result(), save=False)
+                except Exception as e: print(f"No se pudo indexar la categoría {api_id} de '{game_name}': {e}")
+        with self._lock: self.index.setdefault(game_name, {"names": {}, "ids": {}})["updated_at"] = time.time()
+        self._save()
+
+    def find_category(self, game_name, subcategory_name, subcategory_id, on_resolved):
+        category_key = self.lookup(game_name, subcategory_name, subcategory_id)
+        if category_key:
+            on_resolved(category_key)
+            return
+        with self._lock:
+            waiting = self._resolving.get(game_name)
+            if waiting is not None:
+                waiting.append((subcategory_name, subcategory_id, on_resolved))
+                return
+            self._resolving[game_name] = [(subcategory_name, subcategory_id, on_resolved)]
+        def resolve():
+            try: self.refresh_game(game_name, force_refresh=True, skip_fresher_than=MISS_REFRESH_INTERVAL)
+            except Exception as e: print(f"No se pudo actualizar el índice de categorías de '{game_name}': {e}")
+            with self._lock: waiting = self._resolving.pop(game_name, [])
+            for name, subcategory_id, callback in waiting:
+                try: callback(self.lookup(game_name, name, subcategory_id))
+                except Exception as e: print(f"No se pudo entregar la categoría de '{name}': {e}")
+        threading.Thread(target=resolve, daemon=True).start()
+
+    def refresh_in_background(self):
+        if self._refresh_thread and self._refresh_thread.is_alive(): return
+        with self._lock:
+            stale_games = [game for game in self.game_data if time.time() - self.index.get(game, {}).get("updated_at", 0) > REFRESH_INTERVAL]
+        if not stale_games: return
+        def refresh():
+            for game_name in stale_games: self.refresh_game(game_name, priority=PRIORITY_BACKGROUND)
+            print(f"Índice de categorías actualizado para {len(stale_games)} juegos.")
+        self._refresh_thread = threading.Thread(target=refresh, daemon=True)
+        self._refresh_thread.start()
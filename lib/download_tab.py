@@ -2,13 +2,13 @@ import sys
 import os
 import time
 import json
-import requests
 import tempfile
 import shutil
 import patoolib
 import re
 import base64
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 try:
     import win32api
     import win32con
@@ -23,13 +23,19 @@ from PyQt6.QtWidgets import (
     QProgressBar, QListView, QMessageBox, QFrame,
 )
 from PyQt6.QtCore import (
-    Qt, QSize, QUrl, QTimer, pyqtSignal, QThreadPool, QRectF, QObject, QRunnable, QEvent, pyqtProperty, QPropertyAnimation, QByteArray, QEasingCurve, QSequentialAnimationGroup
+    Qt, QSize, QTimer, pyqtSignal, QThreadPool, QRectF, QObject, QRunnable, QEvent, pyqtProperty, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup
 )
 from PyQt6.QtGui import (
     QPixmap, QIcon, QAction, QColor, QPalette, QPainter, QBrush, QPainterPath, QCursor
 )
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PyQt6.QtSvg import QSvgRenderer
+from lib.http_client import get_http_client, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from lib.api_cache import get_api_cache
+from lib.mod_index import get_mod_index
+from lib.icon_factory import get_icon_factory
+from lib.icon_metadata import get_icon_metadata
+from lib.thumbnail_cache import get_preview_url
+from lib.icon_loader import PRIORITY_NORMAL, PRIORITY_VISIBLE
 
 class LogoLoadingWidget(QWidget):
     GAMEBANANA_LOGO_B64 = "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAABP0lEQVRYhWNkoD74j0OcEZsgEw0cQBKgmQN8HPgYfBz4Bs4BxAKs8UIlQFRaGP4h8OuhDYRz/zUDAwMDA7vDTRS7BzwEWOht4c8d3AwMDAwM7B5f/zMwDNMQ+M/AwMDw+002hPP1Il7FAx4Cow4YdQA1c8F/BgYGhj8fJkA4f24TpWlIhgDWWu7P5yUQyZ/HIfSfxxCJN1/wGjYoQgBXvY0VwHzK8PcNijjM5wz/f0Dop48g3M/fIfwfTxgYGBgYPn/7jaJvwEOAkQFWb581gIhIy0EkmEWhKjiw64T5FMZ9dBaVj+ZzGGD3+Ips98CHADwXwFzMCIs7kXdkGYjL56/e/8KqfsBDALlN+J+BgYHh5wF1ykzE4XPZSHjqH/ytYpRyAdaGIxbA8rlIEEacD86+ITH9ApJKShLNHvgQAACCt2baH3vA9wAAAABJRU5ErkJggg=="
@@ -54,17 +60,7 @@ class LogoLoadingWidget(QWidget):
     opacity = pyqtProperty(float, get_opacity, set_opacity)
 
     def _update_pixmap(self, color):
-        image_data = QByteArray(base64.b64decode(self.GAMEBANANA_LOGO_B64))
-        source_pixmap = QPixmap()
-        source_pixmap.loadFromData(image_data, "PNG")
-        target_pixmap = QPixmap(source_pixmap.size())
-        target_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(target_pixmap)
-        painter.drawPixmap(0, 0, source_pixmap.mask())
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        painter.fillRect(target_pixmap.rect(), color)
-        painter.end()
-        self._pixmap = target_pixmap
+        self._pixmap = get_icon_factory().tinted(get_icon_factory().base64_pixmap(self.GAMEBANANA_LOGO_B64), color)
 
     def paintEvent(self, event):
         if not self._pixmap: return
@@ -191,15 +187,20 @@ class DownloadProgressDialog(QDialog):
         self.info_label.setText(text)
 
 
+CARD_IMAGE_SIZE = QSize(264, 148)
+
 class ApiModCardWidget(QWidget):
     download_requested = pyqtSignal(dict)
 
-    def __init__(self, mod_data, manager, image_manager, parent=None):
+    def __init__(self, mod_data, manager, thumbnail_cache, parent=None):
         super().__init__(parent)
         self.mod_data = mod_data
         self.manager = manager
         self.translator = manager.translator
-        self.image_manager = image_manager
+        self.thumbnail_cache = thumbnail_cache
+        self.thumbnail_key = None
+        self.image_pending = False
+        self.image_done = False
         self.is_hovered = False
         self.setFixedSize(290, 290)
         self.setMouseTracking(True)
@@ -209,14 +210,13 @@ class ApiModCardWidget(QWidget):
         layout.setContentsMargins(8, 8, 8, 8); layout.setSpacing(5)
 
         self.image_label = QLabel()
-        self.image_label.setFixedSize(264, 148)
+        self.image_label.setFixedSize(CARD_IMAGE_SIZE)
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setStyleSheet("background-color: rgba(0,0,0,0.1); border-radius: 4px; outline: none;")
     
         self.loading_spinner = ArcLoadingWidget(self.image_label)
         
         layout.addWidget(self.image_label)
-        self.load_image()
 
         name = mod_data.get('_sName', self.translator.translate("api_card_unknown_name"))
         creator = mod_data.get('_aSubmitter', {}).get('_sName', self.translator.translate("api_card_unknown_creator"))
@@ -246,29 +246,35 @@ class ApiModCardWidget(QWidget):
         text_label = QLabel(text); layout.addWidget(icon_label); layout.addWidget(text_label); widget.setToolTip(tooltip)
         return widget
 
-    def load_image(self):
-        previews = self.mod_data.get('_aPreviewMedia', [])
-        if isinstance(previews, list) and previews:
-            img_info = previews[0]; file_key = '_sFile670' if '_sFile670' in img_info else '_sFile'
-            if img_info.get('_sBaseUrl') and img_info.get(file_key):
-                img_url = img_info['_sBaseUrl'] + '/' + img_info[file_key]
-                self.loading_spinner.start_animation()
-                reply = self.image_manager.get(QNetworkRequest(QUrl(img_url)))
-                reply.finished.connect(self.on_image_loaded)
-            else: self.image_label.setText(self.translator.translate("api_card_invalid_image_url"))
-        else: self.image_label.setText(self.translator.translate("api_card_no_image"))
-
-    def on_image_loaded(self):
-        reply = self.sender()
-        if not reply: return
-        self.loading_spinner.stop_animation()
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            pixmap = QPixmap(); pixmap.loadFromData(reply.readAll().data())
-            self.image_label.setPixmap(pixmap.scaled(self.image_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        else:
-            print(self.translator.translate("log_image_download_error", error=reply.errorString()))
-            self.image_label.setText(self.translator.translate("api_card_load_error"))
-        reply.deleteLater()
+    def load_image(self, priority=PRIORITY_NORMAL):
+        if self.image_done: return
+        dpr = self.devicePixelRatioF()
+        img_url = get_preview_url(self.mod_data, CARD_IMAGE_SIZE.width() * dpr, CARD_IMAGE_SIZE.height() * dpr)
+        if img_url is None: self.image_done = True; self.image_label.setText(self.translator.translate("api_card_no_image")); return
+        if not img_url: self.image_done = True; self.image_label.setText(self.translator.translate("api_card_invalid_image_url")); return
+        self.thumbnail_key, pixmap = self.thumbnail_cache.request(img_url, CARD_IMAGE_SIZE, dpr, owner=self, priority=priority)
+        if pixmap is not None: self.release_image(); self.image_done = True; self.image_label.setPixmap(pixmap); return
+        if self.image_pending: return
+        self.image_pending = True; self.loading_spinner.start_animation()
+        self.thumbnail_cache.thumbnail_ready.connect(self.on_image_loaded); self.thumbnail_cache.thumbnail_failed.connect(self.on_image_failed)
+
+    def release_image(self):
+        if self.image_pending: self._disconnect_thumbnail_signals(); self.loading_spinner.stop_animation(); self.image_pending = False
+        self.thumbnail_cache.release(self)
+
+    def on_image_loaded(self, key, pixmap):
+        if key != self.thumbnail_key: return
+        self.release_image(); self.image_done = True; self.image_label.setPixmap(pixmap)
+
+    def on_image_failed(self, key):
+        if key != self.thumbnail_key: return
+        self.release_image(); self.image_done = True
+        print(self.translator.translate("log_image_download_error", error=key[0]))
+        self.image_label.setText(self.translator.translate("api_card_load_error"))
+
+    def _disconnect_thumbnail_signals(self):
+        try: self.thumbnail_cache.thumbnail_ready.disconnect(self.on_image_loaded); self.thumbnail_cache.thumbnail_failed.disconnect(self.on_image_failed)
+        except TypeError: pass
 
     def paintEvent(self, event):
         super().paintEvent(event)
@@ -336,12 +342,16 @@ class FileSelectionDialog(QDialog):
 class DownloadTab(QWidget):
     BASE_API_URL = "https://gamebanana.com/apiv6/Mod/ByCategory"
     MODS_PER_PAGE = 20
+    PAGE_FETCH_BATCH = 4
+    PAGE_OFFSETS_TTL = 300
+    PAGE_CACHE_TTL = 120
+    PREFETCH_THUMBNAILS = 6
 
     def __init__(self, profile_name, category_id, manager, parent=None):
         super().__init__(parent)
         self.profile_name, self.category_id, self.manager, self.translator = profile_name, category_id, manager, manager.translator
         self.current_page, self.is_loading, self.can_go_next = 1, False, True
-        self.threadpool = QThreadPool(); self.image_manager = QNetworkAccessManager(self); self.is_first_load = True
+        self.threadpool = QThreadPool(); self.thumbnail_cache = manager.thumbnail_cache; self.is_first_load = True; self.page_offsets = {}; self.page_cache = {}
         self.setup_ui()
         self.list_container.installEventFilter(self)
         self.retranslate_ui()
@@ -375,6 +385,7 @@ class DownloadTab(QWidget):
         self.nsfw_check = QCheckBox(); show_nsfw = self.manager.config.get('download_tab_show_nsfw', False); self.nsfw_check.setChecked(show_nsfw); self.nsfw_check.stateChanged.connect(self.on_filter_changed); self.nsfw_check.stateChanged.connect(self._save_nsfw_state); self.nsfw_check.setStyleSheet(checkbox_stylesheet); controls_layout.addWidget(self.nsfw_check); main_layout.addLayout(controls_layout)
         self.list_container = QWidget(); container_layout = QVBoxLayout(self.list_container); container_layout.setContentsMargins(0, 0, 0, 0)
         self.mods_list_widget = QListWidget(); self.mods_list_widget.setViewMode(QListView.ViewMode.IconMode); self.mods_list_widget.setResizeMode(QListView.ResizeMode.Adjust); self.mods_list_widget.setMovement(QListView.Movement.Static); self.mods_list_widget.setUniformItemSizes(True); self.mods_list_widget.setGridSize(QSize(295, 310)); self.mods_list_widget.setStyleSheet("QListWidget { border: none; outline: none; background-color: transparent; } QListWidget::item { border: none; } QListWidget::item:selected { background-color: transparent; }")
+        self.mods_list_widget.verticalScrollBar().valueChanged.connect(self._request_visible_thumbnails)
         container_layout.addWidget(self.mods_list_widget)
         self.main_loading_animation = LogoLoadingWidget(self.list_container, size=120)
         main_layout.addWidget(self.list_container)
@@ -392,52 +403,23 @@ class DownloadTab(QWidget):
     def eventFilter(self, source, event):
         if source is self.list_container and event.type() == QEvent.Type.Resize:
             self.main_loading_animation.recenter_in_parent()
+            QTimer.singleShot(0, self._request_visible_thumbnails)
         return super().eventFilter(source, event)
     
     def _save_nsfw_state(self):
         self.manager.config['download_tab_show_nsfw'] = self.nsfw_check.isChecked()
         self.manager.save_config()
     
-    def _is_strictly_dark_grayscale(self, image):
-        if image.isNull(): return False
-
-        DARKNESS_THRESHOLD = 120
-        COLOR_TOLERANCE = 15
-
-        scaled_image = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio)
-
-        has_visible_pixels = False
-        for y in range(scaled_image.height()):
-            for x in range(scaled_image.width()):
-                color = QColor(scaled_image.pixel(x, y))
-                if color.alpha() < 50: continue
-                has_visible_pixels = True
-
-                r, g, b = color.red(), color.green(), color.blue()
-                if r > DARKNESS_THRESHOLD or g > DARKNESS_THRESHOLD or b > DARKNESS_THRESHOLD: return False
-                if (max(r, g, b) - min(r, g, b)) > COLOR_TOLERANCE: return False
-
-        return has_visible_pixels
-
     def _create_processed_icon(self, icon_path):
         if not icon_path or not os.path.exists(icon_path):
             return QIcon()
 
-        original_pixmap = QPixmap(icon_path)
+        original_pixmap = get_icon_factory().pixmap(icon_path)
         if original_pixmap.isNull():
             return QIcon()
 
-        if self._is_strictly_dark_grayscale(original_pixmap.toImage()):
-            target_color = self.palette().color(QPalette.ColorRole.Text)
-            
-            recolored_pixmap = QPixmap(original_pixmap.size())
-            recolored_pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(recolored_pixmap)
-            painter.drawPixmap(0, 0, original_pixmap)
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-            painter.fillRect(recolored_pixmap.rect(), target_color)
-            painter.end()
-            return QIcon(recolored_pixmap)
+        if get_icon_metadata().is_dark_grayscale(icon_path):
+            return QIcon(get_icon_factory().tinted(original_pixmap, self.palette().color(QPalette.ColorRole.Text)))
 
         return QIcon(original_pixmap)
     
@@ -455,35 +437,139 @@ class DownloadTab(QWidget):
 
     def fetch_mods(self):
         if self.is_loading: return
-        self.is_loading = True; self.can_go_next = False; self.mods_list_widget.clear(); self.update_navigation_controls()
+        self.is_loading = True; self.can_go_next = False; self.local_results = []; self._clear_cards(keep_prefetch=True); self.update_navigation_controls()
         self.page_label.setText(self.translator.translate("download_tab_searching"))
         self.main_loading_animation.start_animation()
+        query = self._current_query(); cached_result = self._get_cached_page(query, self.current_page)
+        if cached_result is not None: self.on_fetch_result(cached_result, query, self.current_page); self.on_fetch_finished(); return
+        self.local_results = self._search_local_index(query, self.current_page)
+        if self.local_results: self.populate_list(self.local_results)
+        worker = Worker(self._fetch_and_filter_mods_paginated, page_to_display=self.current_page, offsets=self._get_page_offsets(query), **query)
+        worker.signals.result.connect(lambda result, query=query, page=self.current_page: self.on_fetch_result(result, query, page)); worker.signals.error.connect(self.on_fetch_error); worker.signals.finished.connect(self.on_fetch_finished); self.threadpool.start(worker)
+
+    def _current_query(self):
         effective_category_id = self.subcategory_combo.currentData() if self.subcategory_combo else self.category_id
-        worker = Worker(self._fetch_and_filter_mods_paginated, page_to_display=self.current_page, search_text=self.search_bar.text().strip(), category_id=effective_category_id, sort_order=self.sort_combo.currentData(), show_nsfw=self.nsfw_check.isChecked())
-        worker.signals.result.connect(self.on_fetch_result); worker.signals.error.connect(self.on_fetch_error); worker.signals.finished.connect(self.on_fetch_finished); self.threadpool.start(worker)
-
-    def _fetch_and_filter_mods_paginated(self, page_to_display, search_text, category_id, sort_order, show_nsfw, progress_callback):
-        mods_for_page, num_to_skip, skipped_count, api_page, can_fetch_more = [], (page_to_display - 1) * self.MODS_PER_PAGE, 0, 1, True; game_id = self.manager.game_data[self.manager.current_game].get("game_id"); common_properties = "_idRow,_sName,_sProfileUrl,_aSubmitter,_tsDateUpdated,_tsDateAdded,_aPreviewMedia,_nViewCount,_nLikeCount,_nDownloadCount,_aFiles,_bIsNsfw,_aCategory"
+        return {"search_text": self.search_bar.text().strip(), "category_id": effective_category_id, "sort_order": self.sort_combo.currentData(), "show_nsfw": self.nsfw_check.isChecked()}
+
+    def _search_local_index(self, query, page):
+        if not query["search_text"]: return []
+        game_id = self.manager.game_data[self.manager.current_game].get("game_id")
+        return get_mod_index().search(game_id, query["search_text"], query["category_id"], query["show_nsfw"], query["sort_order"], self.MODS_PER_PAGE, (page - 1) * self.MODS_PER_PAGE)
+
+    def _page_cache_key(self, query, page):
+        return (self.manager.current_game, query["category_id"], query["search_text"], query["sort_order"], query["show_nsfw"], page)
+
+    def _get_cached_page(self, query, page):
+        entry = self.page_cache.get(self._page_cache_key(query, page))
+        if entry and time.time() - entry[0] < self.PAGE_CACHE_TTL: return entry[1]
+        return None
+
+    def _store_page(self, query, page, result):
+        now = time.time(); self.page_cache = {k: v for k, v in self.page_cache.items() if now - v[0] < self.PAGE_CACHE_TTL}
+        self.page_cache[self._page_cache_key(query, page)] = (now, result)
+
+    def _prefetch_next_page(self, query, page):
+        if not self.can_go_next: return
+        next_result = self._get_cached_page(query, page + 1)
+        if next_result is not None: self._prefetch_thumbnails(next_result["mods"]); return
+        worker = Worker(self._fetch_and_filter_mods_paginated, page_to_display=page + 1, offsets=self._get_page_offsets(query), priority=PRIORITY_BACKGROUND, **query)
+        worker.signals.result.connect(lambda result, query=query, page=page + 1: self._on_prefetch_result(result, query, page)); self.threadpool.start(worker)
+
+    def _on_prefetch_result(self, result, query, page):
+        self._merge_page_offsets(query, result["offsets"])
+        if not result["mods"]: return
+        self._store_page(query, page, result); self._prefetch_thumbnails(result["mods"])
+
+    def _prefetch_thumbnails(self, mods):
+        self.thumbnail_cache.release(self); dpr = self.devicePixelRatioF()
+        for mod_info in mods[:self.PREFETCH_THUMBNAILS]:
+            img_url = get_preview_url(mod_info, CARD_IMAGE_SIZE.width() * dpr, CARD_IMAGE_SIZE.height() * dpr)
+            if img_url: self.thumbnail_cache.prefetch(img_url, CARD_IMAGE_SIZE, dpr, owner=self)
+
+    def _request_visible_thumbnails(self):
+        viewport_rect = self.mods_list_widget.viewport().rect()
+        for row in range(self.mods_list_widget.count()):
+            item = self.mods_list_widget.item(row); card = self.mods_list_widget.itemWidget(item)
+            if isinstance(card, ApiModCardWidget): card.load_image(PRIORITY_VISIBLE if self.mods_list_widget.visualItemRect(item).intersects(viewport_rect) else PRIORITY_NORMAL)
+
+    def _clear_cards(self, keep_prefetch=False):
+        for row in range(self.mods_list_widget.count()):
+            card = self.mods_list_widget.itemWidget(self.mods_list_widget.item(row))
+            if isinstance(card, ApiModCardWidget): card.release_image()
+        if not keep_prefetch: self.thumbnail_cache.release(self)
+        self.mods_list_widget.clear()
+
+    def _build_listing_query(self, search_text, category_id, sort_order, show_nsfw):
+        game_id = self.manager.game_data[self.manager.current_game].get("game_id"); common_properties = "_idRow,_sName,_sProfileUrl,_aSubmitter,_tsDateUpdated,_tsDateAdded,_aPreviewMedia,_nViewCount,_nLikeCount,_nDownloadCount,_aFiles,_bIsNsfw,_aCategory"
         if search_text: base_url, base_params = "https://gamebanana.com/apiv6/Mod/ByName", [("_csvProperties", common_properties), ("_nPerpage", str(self.MODS_PER_PAGE)), ("_sName", f"*{search_text}*"), ("_idGameRow", str(game_id))]
         else: base_url, base_params = self.BASE_API_URL, [("_csvProperties", common_properties), ("_nPerpage", str(self.MODS_PER_PAGE)), ("_sOrderBy", sort_order), ("_aCategoryRowIds[]", str(category_id))]
-        while len(mods_for_page) < self.MODS_PER_PAGE and can_fetch_more:
-            params = base_params + [("_nPage", str(api_page))]
-            if not show_nsfw: params.append(("_aArgs[]", "_sbIsNsfw = false"))
-            try:
-                response = requests.get(base_url, params=params, timeout=20, headers={'User-Agent': 'MIMM/1.0'}); response.raise_for_status(); mods_from_api = response.json()
-                if not mods_from_api: can_fetch_more = False; continue
-                for mod in mods_from_api:
-                    if not show_nsfw and mod.get('_bIsNsfw', False): continue
-                    if search_text and mod.get('_aCategory', {}).get('_idRow') != int(category_id): continue
-                    if skipped_count < num_to_skip: skipped_count += 1; continue
-                    mods_for_page.append(mod)
-                    if len(mods_for_page) >= self.MODS_PER_PAGE: can_fetch_more = False; break
-                api_page += 1
-            except Exception as e: print(f"Error en la página API {api_page}: {e}"); can_fetch_more = False
-        return mods_for_page
-
-    def on_fetch_result(self, mods_data): self.populate_list(mods_data)
-    def on_fetch_error(self, error_tuple): print(f"Error en hilo API: {error_tuple}"); self.show_message(self.translator.translate("error_title"), self.translator.translate("generic_error_message", error=error_tuple[1]), "critical"); self.can_go_next = False
+        if not show_nsfw: base_params.append(("_aArgs[]", "_sbIsNsfw = false"))
+        return base_url, base_params
+
+    def _fetch_api_pages(self, base_url, base_params, api_pages, priority=PRIORITY_INTERACTIVE):
+        if len(api_pages) == 1: return [get_api_cache().get_json(base_url, params=base_params + [("_nPage", str(api_pages[0]))], timeout=20, priority=priority) or []]
+        with ThreadPoolExecutor(max_workers=len(api_pages)) as executor:
+            return list(executor.map(lambda api_page: get_api_cache().get_json(base_url, params=base_params + [("_nPage", str(api_page))], timeout=20, priority=priority) or [], api_pages))
+
+    def _page_offsets_entry(self, query):
+        base_url, base_params = self._build_listing_query(**query); query_key = (self.manager.current_game, base_url, tuple(base_params))
+        entry = self.page_offsets.get(query_key)
+        if not entry or time.time() - entry["created"] > self.PAGE_OFFSETS_TTL: entry = self.page_offsets[query_key] = {"created": time.time(), "pages": {1: (1, 0)}}
+        return entry
+
+    def _get_page_offsets(self, query):
+        return dict(self._page_offsets_entry(query)["pages"])
+
+    def _merge_page_offsets(self, query, offsets):
+        if offsets: self._page_offsets_entry(query)["pages"].update(offsets)
+
+    def _filter_page(self, mods_from_api, search_text, category_id, show_nsfw):
+        return [mod for mod in mods_from_api if (show_nsfw or not mod.get('_bIsNsfw', False)) and not (search_text and mod.get('_aCategory', {}).get('_idRow') != int(category_id))]
+
+    def _fetch_and_filter_mods_paginated(self, page_to_display, search_text, category_id, sort_order, show_nsfw, offsets=None, priority=PRIORITY_INTERACTIVE, progress_callback=None):
+        base_url, base_params = self._build_listing_query(search_text, category_id, sort_order, show_nsfw); game_id = self.manager.game_data[self.manager.current_game].get("game_id")
+        if not search_text:
+            mods_from_api = self._fetch_api_pages(base_url, base_params, [page_to_display], priority)[0]; get_mod_index().add_records(mods_from_api, game_id)
+            return {"mods": self._filter_page(mods_from_api, search_text, category_id, show_nsfw), "offsets": {}, "has_more": len(mods_from_api) == self.MODS_PER_PAGE}
+        offsets = dict(offsets or {1: (1, 0)}); found_offsets = {}
+        display_page = max(p for p in offsets if p <= page_to_display); api_page, start_index = offsets[display_page]; mods_for_page = []
+        while True:
+            api_pages = list(range(api_page, api_page + max(1, min(self.PAGE_FETCH_BATCH, page_to_display - display_page + 2))))
+            try: results = self._fetch_api_pages(base_url, base_params, api_pages, priority); get_mod_index().add_records([mod for mods in results for mod in mods], game_id)
+            except Exception as e:
+                print(f"Error en las páginas API {api_pages} tras los reintentos: {e}")
+                if display_page == page_to_display and mods_for_page: break
+                raise
+            for current_api_page, mods_from_api in zip(api_pages, results):
+                if not mods_from_api: return {"mods": mods_for_page if display_page == page_to_display else [], "offsets": found_offsets, "has_more": False}
+                for index in range(start_index, len(mods_from_api)):
+                    if not self._filter_page([mods_from_api[index]], search_text, category_id, show_nsfw): continue
+                    mods_for_page.append(mods_from_api[index])
+                    if len(mods_for_page) >= self.MODS_PER_PAGE:
+                        found_offsets[display_page + 1] = (current_api_page, index + 1)
+                        if display_page == page_to_display: return {"mods": mods_for_page, "offsets": found_offsets, "has_more": True}
+                        display_page += 1; mods_for_page = []
+                start_index = 0
+            api_page = api_pages[-1] + 1
+        return {"mods": mods_for_page if display_page == page_to_display else [], "offsets": found_offsets, "has_more": False}
+
+    def on_fetch_result(self, result, query=None, page=None):
+        mods_data = result["mods"]
+        if query is not None:
+            self._merge_page_offsets(query, result["offsets"])
+            if mods_data: self._store_page(query, page, result)
+        if self.local_results and mods_data: self._reconcile_list(mods_data)
+        else:
+            if self.local_results: self._clear_cards(keep_prefetch=True)
+            self.populate_list(mods_data)
+        self.can_go_next = result["has_more"]; self.local_results = []
+        if query is not None: self._prefetch_next_page(query, page)
+    def on_fetch_error(self, error_tuple):
+        print(f"Error en hilo API: {error_tuple}")
+        if self.local_results:
+            print("Sin conexión con GameBanana; se muestran los resultados del índice local.")
+            self.can_go_next = len(self.local_results) == self.MODS_PER_PAGE; self.local_results = []; return
+        self.show_message(self.translator.translate("error_title"), self.translator.translate("generic_error_message", error=error_tuple[1]), "critical"); self.can_go_next = False
     
     def on_fetch_finished(self):
         self.main_loading_animation.stop_animation()
@@ -495,16 +581,40 @@ class DownloadTab(QWidget):
         if not mods_data and self.current_page == 1:
             placeholder = QWidget(); layout = QVBoxLayout(placeholder); layout.setAlignment(Qt.AlignmentFlag.AlignCenter); label = QLabel(self.translator.translate("download_tab_no_mods_found")); label.setStyleSheet("outline: none; font-size: 14px; color: grey;"); layout.addWidget(label); item = QListWidgetItem(); item.setSizeHint(QSize(self.mods_list_widget.width() - 30, 100)); self.mods_list_widget.addItem(item); self.mods_list_widget.setItemWidget(item, placeholder)
         else:
-            for mod_info in mods_data:
-                item = QListWidgetItem(); card = ApiModCardWidget(mod_info, self.manager, self.image_manager); card.download_requested.connect(self.on_download_request); item.setSizeHint(card.sizeHint()); self.mods_list_widget.addItem(item); self.mods_list_widget.setItemWidget(item, card)
+            for mod_info in mods_data: self._insert_card(self.mods_list_widget.count(), mod_info)
+            self._request_visible_thumbnails()
+
+    def _insert_card(self, row, mod_info):
+        item = QListWidgetItem(); card = ApiModCardWidget(mod_info, self.manager, self.thumbnail_cache); card.download_requested.connect(self.on_download_request); item.setSizeHint(card.sizeHint()); self.mods_list_widget.insertItem(row, item); self.mods_list_widget.setItemWidget(item, card)
+
+    def _card_at(self, row):
+        card = self.mods_list_widget.itemWidget(self.mods_list_widget.item(row))
+        return card if isinstance(card, ApiModCardWidget) else None
+
+    def _remove_card(self, row):
+        card = self._card_at(row)
+        if card: card.release_image()
+        self.mods_list_widget.takeItem(row)
+
+    def _reconcile_list(self, mods_data):
+        wanted = {mod.get('_idRow') for mod in mods_data}
+        for row in range(self.mods_list_widget.count() - 1, -1, -1):
+            card = self._card_at(row)
+            if card is None or card.mod_data.get('_idRow') not in wanted: self._remove_card(row)
+        for row, mod_info in enumerate(mods_data):
+            card = self._card_at(row)
+            if card is not None and card.mod_data.get('_idRow') == mod_info.get('_idRow'): card.mod_data = mod_info
+            else: self._insert_card(row, mod_info)
+        for row in range(self.mods_list_widget.count() - 1, len(mods_data) - 1, -1): self._remove_card(row)
+        self._request_visible_thumbnails()
 
     def update_navigation_controls(self): self.page_label.setText(self.translator.translate("download_tab_nav_page", page=self.current_page)); self.prev_button.setEnabled(self.current_page > 1 and not self.is_loading); self.next_button.setEnabled(self.can_go_next and not self.is_loading)
     def next_page(self):
-        if not self.is_loading: self.current_page += 1; self.mods_list_widget.clear(); self.fetch_mods()
+        if not self.is_loading: self.current_page += 1; self._clear_cards(keep_prefetch=True); self.fetch_mods()
     def previous_page(self):
-        if not self.is_loading and self.current_page > 1: self.current_page -= 1; self.mods_list_widget.clear(); self.fetch_mods()
+        if not self.is_loading and self.current_page > 1: self.current_page -= 1; self._clear_cards(); self.fetch_mods()
     def on_filter_changed(self):
-        if not self.is_loading: self.current_page = 1; self.mods_list_widget.clear(); self.fetch_mods()
+        if not self.is_loading: self.current_page = 1; self._clear_cards(); self.fetch_mods()
 
     def on_download_request(self, mod_data):
         files = mod_data.get('_aFiles', [])
@@ -535,30 +645,27 @@ class DownloadTab(QWidget):
         archive_path = None
         try:
             with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                archive_path = tmp_file.name; response = requests.get(download_url, stream=True, headers={'User-Agent': 'MIMM/1.0'}); response.raise_for_status()
-                total_size = int(response.headers.get('content-length', 0)); downloaded_size = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp_file.write(chunk); downloaded_size += len(chunk)
-                    if total_size > 0: progress_callback.emit(int((downloaded_size / total_size) * 100))
+                archive_path = tmp_file.name
+                get_http_client().download(download_url, tmp_file, on_chunk=lambda downloaded, total: progress_callback.emit(int((downloaded / total) * 100)) if total > 0 else None)
             progress_callback.emit(100)
             category_type = self.manager.category_widgets[self.manager.current_category]['type']
-            if category_type == 'direct_management': return self._install_direct_mod_from_api(profile_name, mod_data, archive_path)
-            else: return self._install_managed_mod_from_api(profile_name, mod_data, archive_path)
+            if category_type == 'direct_management': return self._install_direct_mod_from_api(profile_name, mod_data, archive_path, file_data)
+            else: return self._install_managed_mod_from_api(profile_name, mod_data, archive_path, file_data)
         finally:
             if archive_path and os.path.exists(archive_path): os.remove(archive_path)
 
-    def _install_direct_mod_from_api(self, profile_name, mod_data, archive_path):
+    def _install_direct_mod_from_api(self, profile_name, mod_data, archive_path, file_data=None):
         mod_folder_name = self.manager._sanitize_filename(mod_data.get('_sName'))
         mod_dest_path = os.path.join(self.manager.get_game_mods_path(self.manager.current_game), mod_folder_name)
         if os.path.exists(mod_dest_path): raise FileExistsError(self.translator.translate("error_mod_exists_direct", name=mod_folder_name))
         self._extract_and_copy_mod(archive_path, mod_dest_path)
         profile = self.manager.profiles[self.manager.current_game][self.manager.current_category][profile_name]
         icon_path = self._download_and_save_mod_icon(mod_data, profile_name, mod_folder_name)
-        new_mod_info = {"name": mod_folder_name, "folder_name": mod_folder_name, "display_name": mod_data.get('_sName'), "creator": mod_data.get('_aSubmitter', {}).get('_sName'), "url": mod_data.get('_sProfileUrl'), "profile_url": mod_data.get('_sProfileUrl'), "icon": icon_path}
+        new_mod_info = {"name": mod_folder_name, "folder_name": mod_folder_name, "display_name": mod_data.get('_sName'), "creator": mod_data.get('_aSubmitter', {}).get('_sName'), "url": mod_data.get('_sProfileUrl'), "profile_url": mod_data.get('_sProfileUrl'), "icon": icon_path, **self.manager._get_api_mod_ids(mod_data, file_data)}
         profile["mods"].append(new_mod_info); self.manager.save_profiles(); self._simulate_f10_press()
         return self.translator.translate("success_mod_installed", name=mod_folder_name)
 
-    def _install_managed_mod_from_api(self, profile_name, mod_data, archive_path):
+    def _install_managed_mod_from_api(self, profile_name, mod_data, archive_path, file_data=None):
         mod_name = self.manager._sanitize_filename(mod_data.get('_sName'))
         profile = self.manager.profiles[self.manager.current_game][self.manager.current_category][profile_name]
         if any(m.get('name') == mod_name for m in profile.get("mods", [])): 
@@ -580,7 +687,8 @@ class DownloadTab(QWidget):
             "creator": mod_data.get('_aSubmitter', {}).get('_sName'), 
             "url": mod_data.get('_sProfileUrl'), 
             "profile_url": mod_data.get('_sProfileUrl'), 
-            "icon": icon_path
+            "icon": icon_path,
+            **self.manager._get_api_mod_ids(mod_data, file_data)
         }
         profile["mods"].append(new_mod_info)
         self.manager._rewrite_profile_ini(profile_name, profile)
@@ -610,13 +718,10 @@ class DownloadTab(QWidget):
         if not (isinstance(img_info, dict) and img_info.get('_sBaseUrl') and img_info.get(file_key)): return None
         img_url = img_info['_sBaseUrl'] + '/' + img_info[file_key]
         try:
-            response = requests.get(img_url, timeout=15, headers={'User-Agent': 'MIMM/1.0'}); response.raise_for_status()
+            response = get_http_client().get(img_url, timeout=15); response.raise_for_status()
             image_content = response.content;
             if not QPixmap().loadFromData(image_content): return None
-            final_name = self.manager._sanitize_filename(f"mod_{profile_name}_{mod_name}_{int(time.time() * 1000)}.png")
-            final_path = os.path.join(self.manager.icons_cache_path, final_name)
-            with open(final_path, 'wb') as f: f.write(image_content)
-            return final_path
+            return self.manager.icon_store.put_bytes(image_content, ".png")
         except Exception as e: print(f"No se pudo descargar el icono del mod: {e}"); return None
 
     def start_install_from_data(self, mod_data):
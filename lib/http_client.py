@@ -0,0 +1,238 @@
+import os
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+USER_AGENT = 'MIMM/1.0'
+DEFAULT_TIMEOUT = (6, 20)
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_RETRIES = 3
+PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND = 0, 1
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+MAX_RETRY_AFTER = 120.0
+INTERACTIVE_RETRIES = 1
+INTERACTIVE_MAX_DELAY = 1.0
+HOST_RATE_LIMITS = {
+    "gamebanana.com": (5.0, 10),
+    "api.github.com": (1.0, 5),
+}
+DEFAULT_RATE_LIMIT = (8.0, 16)
+MOCK_BASE_URL_ENV = "MIMM_GAMEBANANA_BASE_URL"
+MOCKED_HOSTS = ("gamebanana.com", "files.gamebanana.com", "images.gamebanana.com")
+
+class _HostLimiter:
+    def __init__(self, max_concurrent, rate, burst):
+        self.max_concurrent, self.rate, self.burst = max_concurrent, rate, burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.active = 0
+        self.waiting = [0, 0]
+        self._cond = threading.Condition()
+
+    def _reserve(self, priority):
+        return 1 if priority == PRIORITY_BACKGROUND and self.max_concurrent > 1 and self.burst > 1 else 0
+
+    def _can_start(self, priority, now):
+        if (priority == PRIORITY_BACKGROUND and now < self.paused_until) or any(self.waiting[lane] for lane in range(priority)): return False
+        reserve = self._reserve(priority)
+        return self.active < self.max_concurrent - reserve and self.tokens >= 1 + reserve
+
+    def acquire(self, priority=PRIORITY_INTERACTIVE):
+        with self._cond:
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self._can_start(priority, now):
+                        self.tokens -= 1
+                        self.active += 1
+                        return
+                    timeout = max(self.paused_until - now if priority == PRIORITY_BACKGROUND else 0.0, (1 + self._reserve(priority) - self.tokens) / self.rate)
+                    self._cond.wait(min(1.0, max(0.01, timeout)) if timeout > 0 else 1.0)
+            finally:
+                self.waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def release(self):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        with self._cond:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+class HttpClient:
+    def __init__(self, max_per_host=DEFAULT_MAX_PER_HOST, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, base_url_override=None):
+        self.max_per_host = max_per_host
+        self.base_url_override = (base_url_override or os.getenv(MOCK_BASE_URL_ENV) or "").rstrip('/') or None
+        if self.base_url_override: print(f"[HTTP] Peticiones a GameBanana redirigidas a {self.base_url_override}")
+        self.timeout = timeout
+        self.retries = retries
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._limiters = {}
+        self._metrics = {}
+
+    def _host(self, url):
+        return urlsplit(url).netloc.lower()
+
+    def resolve_url(self, url):
+        if not self.base_url_override: return url
+        parts = urlsplit(url)
+        if parts.netloc.lower() not in MOCKED_HOSTS: return url
+        return f"{self.base_url_override}/{parts.netloc.lower()}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_per_host)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+        return session
+
+    def _get_session_and_limiter(self, host):
+        with self._lock:
+            if host not in self._sessions:
+                rate, burst = next((limits for suffix, limits in HOST_RATE_LIMITS.items() if host == suffix or host.endswith("." + suffix)), DEFAULT_RATE_LIMIT)
+                self._sessions[host] = self._new_session()
+                self._limiters[host] = _HostLimiter(self.max_per_host, rate, burst)
+            return self._sessions[host], self._limiters[host]
+
+    def _retry_delay(self, response, attempt):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try: return min(MAX_RETRY_AFTER, max(0.0, float(retry_after))), True
+            except ValueError: pass
+            try: return min(MAX_RETRY_AFTER, max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())), True
+            except (TypeError, ValueError): pass
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt))), False
+
+    def _fails_fast(self, priority):
+        return priority == PRIORITY_INTERACTIVE and threading.current_thread() is threading.main_thread()
+
+    def _max_retries(self, priority):
+        return min(self.retries, INTERACTIVE_RETRIES) if self._fails_fast(priority) else self.retries
+
+    def _wait_before_retry(self, url, limiter, response, attempt, priority, error=None):
+        delay, from_server = self._retry_delay(response, attempt)
+        if from_server: limiter.pause(delay)
+        if self._fails_fast(priority):
+            if delay > INTERACTIVE_MAX_DELAY or (requests and isinstance(error, requests.Timeout)): return False
+        reason = f"HTTP {response.status_code}" if response is not None else error
+        print(f"Reintentando '{url}' en {delay:.1f} s ({reason}, intento {attempt + 1} de {self._max_retries(priority)})")
+        time.sleep(delay)
+        return True
+
+    def _host_metrics(self, host):
+        return self._metrics.setdefault(host, {"requests": 0, "errors": 0, "bytes": 0, "latency_total": 0.0, "cache_hits": 0})
+
+    def record_request(self, url, latency, num_bytes, ok=True):
+        with self._lock:
+            metrics = self._host_metrics(self._host(url))
+            metrics["requests"] += 1
+            metrics["bytes"] += num_bytes
+            metrics["latency_total"] += latency
+            if not ok: metrics["errors"] += 1
+
+    def record_cache_hit(self, url):
+        with self._lock:
+            self._host_metrics(self._host(url))["cache_hits"] += 1
+
+    def get(self, url, params=None, headers=None, timeout=None, priority=PRIORITY_INTERACTIVE, **kwargs):
+        if not requests: raise ImportError("El módulo 'requests' no está disponible.")
+        session, limiter = self._get_session_and_limiter(self._host(url))
+        retries = self._max_retries(priority)
+        for attempt in range(retries + 1):
+            started, response, error = time.monotonic(), None, None
+            limiter.acquire(priority)
+            try:
+                response = session.get(self.resolve_url(url), params=params, headers=headers, timeout=timeout or self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            finally:
+                limiter.release()
+                num_bytes = len(response.content) if response is not None and not kwargs.get('stream') else 0
+                self.record_request(url, time.monotonic() - started, num_bytes, response is not None and response.ok)
+            if response is not None and response.status_code not in RETRY_STATUSES: return response
+            if attempt == retries or not self._wait_before_retry(url, limiter, response, attempt, priority, error):
+                if response is not None: return response
+                raise error
+            if response is not None: response.close()
+
+    def get_json(self, url, params=None, headers=None, timeout=None, priority=PRIORITY_INTERACTIVE):
+        response = self.get(url, params=params, headers=headers, timeout=timeout, priority=priority)
+        response.raise_for_status()
+        return response.json()
+
+    def download(self, url, file_obj, on_chunk=None, chunk_size=65536, timeout=None, priority=PRIORITY_INTERACTIVE):
+        if not requests: raise ImportError("El módulo 'requests' no está disponible.")
+        session, limiter = self._get_session_and_limiter(self._host(url))
+        retries = self._max_retries(priority)
+        for attempt in range(retries + 1):
+            started, downloaded, ok, response = time.monotonic(), 0, False, None
+            limiter.acquire(priority)
+            try:
+                with session.get(self.resolve_url(url), stream=True, timeout=timeout or self.timeout) as response:
+                    if response.status_code in RETRY_STATUSES and attempt < retries:
+                        retry_response = response
+                    else:
+                        retry_response = None
+                        response.raise_for_status()
+                        total_size = int(response.headers.get('content-length', 0))
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            file_obj.write(chunk); downloaded += len(chunk)
+                            if on_chunk and on_chunk(downloaded, total_size) is False: return downloaded
+                        ok = True
+                        return downloaded
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if downloaded or attempt == retries: raise
+                retry_response, error = None, e
+            else:
+                error = None
+            finally:
+                limiter.release()
+                self.record_request(url, time.monotonic() - started, downloaded, ok)
+            if not self._wait_before_retry(url, limiter, retry_response, attempt, priority, error):
+                if error is not None: raise error
+                raise requests.HTTPError(f"HTTP {retry_response.status_code}", response=retry_response)
+
+    def metrics_snapshot(self):
+        with self._lock:
+            snapshot = {}
+            for host, metrics in self._metrics.items():
+                data = dict(metrics)
+                data["avg_latency_ms"] = round(metrics["latency_total"] / metrics["requests"] * 1000, 1) if metrics["requests"] else 0.0
+                snapshot[host] = data
+            return snapshot
+
+    def log_metrics(self):
+        for host, data in self.metrics_snapshot().items():
+            print(f"[HTTP] {host}: {data['requests']} peticiones, {data['errors']} errores, {data['bytes'] // 1024} KB, {data['avg_latency_ms']} ms de media, {data['cache_hits']} aciertos de caché")
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values(): session.close()
+            self._sessions.clear()
+            self._limiters.clear()
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_http_client():
+    global _client
+    with _client_lock:
+        if _client is None: _client = HttpClient()
+        return _client
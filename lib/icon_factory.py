@@ -0,0 +1,120 @@
+import os
+import base64
+import threading
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QObject, QEvent, QByteArray, QSize
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QGuiApplication
+from PyQt6.QtSvg import QSvgRenderer
+
+class IconFactory(QObject):
+    def __init__(self, parent=None, max_items=512):
+        super().__init__(parent)
+        self.max_items = max_items
+        self._svg_icons = {}
+        self._pixmaps = OrderedDict()
+        style_hints = QGuiApplication.styleHints() if QGuiApplication.instance() else None
+        if style_hints is not None and hasattr(style_hints, 'colorSchemeChanged'):
+            style_hints.colorSchemeChanged.connect(self.invalidate)
+
+    def watch_theme(self, widget):
+        widget.installEventFilter(self)
+
+    def eventFilter(self, source, event):
+        if event.type() in (QEvent.Type.ApplicationPaletteChange, QEvent.Type.StyleChange):
+            self.invalidate()
+        return super().eventFilter(source, event)
+
+    def invalidate(self, *args):
+        self._svg_icons.clear()
+        self._pixmaps.clear()
+
+    def _remember(self, key, pixmap):
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self.max_items: self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def _recall(self, key):
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None: self._pixmaps.move_to_end(key)
+        return pixmap
+
+    @staticmethod
+    def _size_key(size):
+        if size is None: return None
+        if isinstance(size, QSize): return (size.width(), size.height())
+        return (int(size), int(size))
+
+    @staticmethod
+    def _device_pixel_ratio(dpr):
+        if dpr: return float(dpr)
+        screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+        return screen.devicePixelRatio() if screen else 1.0
+
+    def svg_icon(self, base64_svg, color, size=None, dpr=None):
+        size_key, dpr = self._size_key(size), self._device_pixel_ratio(dpr)
+        key = (base64_svg, QColor(color).rgba(), size_key, dpr)
+        icon = self._svg_icons.get(key)
+        if icon is None:
+            svg_str = base64.b64decode(base64_svg).decode('utf-8').replace('currentColor', QColor(color).name())
+            renderer = QSvgRenderer(QByteArray(svg_str.encode('utf-8')))
+            width, height = size_key or (renderer.defaultSize().width(), renderer.defaultSize().height())
+            pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
+            pixmap.setDevicePixelRatio(dpr)
+            icon = self._svg_icons[key] = QIcon(pixmap)
+        return icon
+
+    def base64_pixmap(self, base64_data, image_format="PNG"):
+        key = ("base64", base64_data)
+        pixmap = self._recall(key)
+        if pixmap is None:
+            pixmap = QPixmap()
+            pixmap.loadFromData(QByteArray(base64.b64decode(base64_data)), image_format)
+            self._remember(key, pixmap)
+        return pixmap
+
+    def pixmap(self, path, size=None, dpr=None):
+        if not path: return QPixmap()
+        try: mtime = os.path.getmtime(path)
+        except OSError: return QPixmap()
+        size_key = self._size_key(size)
+        dpr = self._device_pixel_ratio(dpr) if size_key is not None else 1.0
+        key = ("file", path, mtime, size_key, dpr)
+        pixmap = self._recall(key)
+        if pixmap is None:
+            pixmap = self._recall(("file", path, mtime, None, 1.0))
+            if pixmap is None: pixmap = QPixmap(path)
+            if size_key is not None and not pixmap.isNull():
+                pixmap = pixmap.scaled(max(1, round(size_key[0] * dpr)), max(1, round(size_key[1] * dpr)), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                pixmap.setDevicePixelRatio(dpr)
+            self._remember(key, pixmap)
+        return pixmap
+
+    def tinted(self, source, color):
+        source_pixmap = self.pixmap(source) if isinstance(source, str) else source
+        if source_pixmap.isNull(): return QPixmap()
+        key = ("tint", source_pixmap.cacheKey(), QColor(color).rgba())
+        pixmap = self._recall(key)
+        if pixmap is None:
+            pixmap = QPixmap(source_pixmap.size())
+            pixmap.setDevicePixelRatio(source_pixmap.devicePixelRatio())
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.drawPixmap(0, 0, source_pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(pixmap.rect(), QColor(color))
+            painter.end()
+            self._remember(key, pixmap)
+        return pixmap
+
+_factory = None
+_factory_lock = threading.Lock()
+
+def get_icon_factory():
+    global _factory
+    with _factory_lock:
+        if _factory is None: _factory = IconFactory()
+        return _factory
@@ -0,0 +1,78 @@
+import os
+import threading
+from PyQt6.QtCore import QObject, QFileSystemWatcher, pyqtSignal
+
+ICON_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+GAME_ICON_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+class IconPathIndex(QObject):
+    watch_requested = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._folders = {}
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self.invalidate)
+        self.watch_requested.connect(self._watch)
+
+    def _watch(self, folder):
+        if os.path.isdir(folder) and folder not in self._watcher.directories(): self._watcher.addPath(folder)
+
+    def _folder_key(self, folder):
+        return os.path.normcase(os.path.abspath(folder))
+
+    def _scan(self, folder):
+        entries = {}
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_file(): entries[entry.name.casefold()] = entry.path
+        except OSError:
+            pass
+        return entries
+
+    def _entries(self, folder):
+        key = self._folder_key(folder)
+        with self._lock:
+            entries = self._folders.get(key)
+        if entries is not None: return entries
+        entries = self._scan(folder)
+        with self._lock:
+            self._folders[key] = entries
+        self.watch_requested.emit(folder)
+        return entries
+
+    def find(self, folder, stem, extensions=ICON_EXTENSIONS):
+        if not stem: return None
+        entries = self._entries(folder)
+        for ext in extensions:
+            path = entries.get(f"{stem}{ext}".casefold())
+            if path: return path
+        for ext in extensions:
+            path = os.path.join(folder, f"{stem}{ext}")
+            if os.path.exists(path):
+                self.invalidate(folder)
+                return path
+        return None
+
+    def exists(self, path):
+        if not path: return False
+        if os.path.basename(path).casefold() in self._entries(os.path.dirname(path)): return True
+        if not os.path.exists(path): return False
+        self.invalidate(os.path.dirname(path))
+        return True
+
+    def invalidate(self, folder=None):
+        with self._lock:
+            if folder is None: self._folders.clear()
+            else: self._folders.pop(self._folder_key(folder), None)
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_icon_index():
+    global _index
+    with _index_lock:
+        if _index is None: _index = IconPathIndex()
+        return _index
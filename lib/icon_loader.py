@@ -0,0 +1,162 @@
+import os
+import threading
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+from lib.icon_metadata import get_icon_metadata
+
+MAX_DECODE_THREADS = 4
+MAX_FETCH_THREADS = 4
+PRIORITY_PREFETCH, PRIORITY_NORMAL, PRIORITY_VISIBLE = 0, 1, 2
+REMOTE_VERSION = "remote"
+
+class _IconSignals(QObject):
+    loaded = pyqtSignal(object, object, object)
+
+class _IconTask(QRunnable):
+    def __init__(self, key, priority, pool, fetch=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key, self.priority = key, priority
+        self.pool, self.fetch = pool, fetch
+        self.cancelled = False
+        self.signals = _IconSignals()
+
+    def _decode(self, source, width, height):
+        if self.fetch is not None:
+            data = self.fetch(lambda: self.cancelled, self.priority)
+            return QImage.fromData(data) if data and not self.cancelled else QImage()
+        reader = QImageReader(source)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid(): reader.setScaledSize(source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+        return reader.read()
+
+    def run(self):
+        source, _, width, height, _ = self.key
+        image, metadata = None, None
+        try:
+            decoded = QImage() if self.cancelled else self._decode(source, width, height)
+            if not decoded.isNull():
+                image = decoded if decoded.width() <= width and decoded.height() <= height else decoded.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                if self.fetch is None: metadata = get_icon_metadata().get(source)
+        except Exception as e:
+            print(f"No se pudo decodificar el icono '{source}': {e}")
+        self.signals.loaded.emit(self, image, metadata)
+
+class IconLoader(QObject):
+    icon_ready = pyqtSignal(object, QPixmap, object)
+    icon_failed = pyqtSignal(object)
+
+    def __init__(self, parent=None, max_memory_items=800):
+        super().__init__(parent)
+        self.max_memory_items = max_memory_items
+        self.memory = OrderedDict()
+        self.pending = {}
+        self.waiters = {}
+        self.owner_keys = {}
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(MAX_DECODE_THREADS)
+        self.fetch_pool = QThreadPool(self)
+        self.fetch_pool.setMaxThreadCount(MAX_FETCH_THREADS)
+
+    @staticmethod
+    def _pixel_size(size, dpr):
+        if isinstance(size, int): size = QSize(size, size)
+        return max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr))
+
+    def make_key(self, path, size, dpr=1.0):
+        try: mtime = os.path.getmtime(path)
+        except OSError: mtime = None
+        return (path, mtime, *self._pixel_size(size, dpr), dpr)
+
+    def make_remote_key(self, url, size, dpr=1.0):
+        return (url, REMOTE_VERSION, *self._pixel_size(size, dpr), dpr)
+
+    def get_cached(self, key):
+        entry = self.memory.get(key)
+        if entry is not None: self.memory.move_to_end(key)
+        return entry
+
+    def request(self, path, size, dpr=1.0, owner=None, priority=PRIORITY_NORMAL):
+        return self.request_key(self.make_key(path, size, dpr), owner, priority)
+
+    def request_key(self, key, owner=None, priority=PRIORITY_NORMAL, fetch=None):
+        entry = self.get_cached(key)
+        if entry is not None: return key, entry[0], entry[1]
+        if key[1] is None: return key, QPixmap(), None
+        if owner is not None: self._add_waiter(key, owner, priority)
+        task = self.pending.get(key)
+        if task is None or task.cancelled:
+            task = _IconTask(key, self._effective_priority(key, priority), self.fetch_pool if fetch else self.pool, fetch)
+            task.signals.loaded.connect(self._on_loaded)
+            self.pending[key] = task
+            task.pool.start(task, task.priority)
+        else:
+            self._reprioritize(task, self._effective_priority(key, priority))
+        return key, None, None
+
+    def _add_waiter(self, key, owner, priority):
+        owner_id = id(owner)
+        if owner_id not in self.owner_keys:
+            self.owner_keys[owner_id] = set()
+            if isinstance(owner, QObject): owner.destroyed.connect(lambda _=None, owner_id=owner_id: self._release_owner_id(owner_id))
+        self.owner_keys[owner_id].add(key)
+        self.waiters.setdefault(key, {})[owner_id] = priority
+
+    def _effective_priority(self, key, default):
+        return max(self.waiters.get(key, {}).values(), default=default)
+
+    def _reprioritize(self, task, priority):
+        if priority == task.priority or not task.pool.tryTake(task): return
+        task.priority = priority
+        task.pool.start(task, priority)
+
+    def release(self, owner):
+        self._release_owner_id(id(owner))
+
+    def _release_owner_id(self, owner_id):
+        for key in self.owner_keys.pop(owner_id, ()):
+            owners = self.waiters.get(key, {})
+            owners.pop(owner_id, None)
+            task = self.pending.get(key)
+            if owners:
+                if task: self._reprioritize(task, self._effective_priority(key, task.priority))
+                continue
+            self.waiters.pop(key, None)
+            if task is None: continue
+            if task.pool.tryTake(task): self.pending.pop(key, None)
+            else: task.cancelled = True
+
+    def _forget_waiters(self, key):
+        for owner_id in self.waiters.pop(key, {}):
+            keys = self.owner_keys.get(owner_id)
+            if keys is not None: keys.discard(key)
+
+    def _on_loaded(self, task, image, metadata):
+        key = task.key
+        if self.pending.get(key) is task: self.pending.pop(key)
+        if task.cancelled: return
+        self._forget_waiters(key)
+        if image is None or image.isNull():
+            self.icon_failed.emit(key); return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[4])
+        self.memory[key] = (pixmap, metadata)
+        while len(self.memory) > self.max_memory_items: self.memory.popitem(last=False)
+        self.icon_ready.emit(key, pixmap, metadata)
+
+    def shutdown(self):
+        for task in list(self.pending.values()):
+            if not task.pool.tryTake(task): task.cancelled = True
+        self.pending.clear(); self.waiters.clear(); self.owner_keys.clear()
+        self.pool.waitForDone(2000); self.fetch_pool.waitForDone(2000)
+
+_loader = None
+_loader_lock = threading.Lock()
+
+def get_icon_loader():
+    global _loader
+    with _loader_lock:
+        if _loader is None: _loader = IconLoader()
+        return _loader
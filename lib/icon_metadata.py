@@ -0,0 +1,128 @@
+import os
+import json
+import hashlib
+import threading
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage
+from lib.paths import APP_DATA_PATH
+
+ICON_METADATA_PATH = os.path.join(APP_DATA_PATH, "icon_metadata.json")
+SAMPLE_SIZE = 16
+DARKNESS_THRESHOLD = 120
+COLOR_TOLERANCE = 15
+MONOCHROME_DARKNESS = 35
+MONOCHROME_SATURATION = 25
+MONOCHROME_RATIO = 0.7
+SAVE_DELAY = 2.0
+METADATA_VERSION = 2
+
+def _sample_pixels(image):
+    sample = image.scaled(SAMPLE_SIZE, SAMPLE_SIZE, Qt.AspectRatioMode.IgnoreAspectRatio).convertToFormat(QImage.Format.Format_ARGB32)
+    row_bytes, data = sample.bytesPerLine(), sample.constBits().asstring(sample.sizeInBytes())
+    for y in range(sample.height()):
+        row = data[y * row_bytes:y * row_bytes + sample.width() * 4]
+        for x in range(0, len(row), 4):
+            yield row[x + 2], row[x + 1], row[x]
+
+def is_strictly_dark_grayscale(image):
+    if image.isNull(): return False
+    for r, g, b in _sample_pixels(image):
+        if r > DARKNESS_THRESHOLD or g > DARKNESS_THRESHOLD or b > DARKNESS_THRESHOLD: return False
+        if max(r, g, b) - min(r, g, b) > COLOR_TOLERANCE: return False
+    return True
+
+def is_dark_and_monochromatic(image):
+    if image.isNull(): return False
+    dark_pixels = 0
+    for r, g, b in _sample_pixels(image):
+        max_c = max(r, g, b)
+        saturation = (max_c - min(r, g, b)) * 255 // max_c if max_c else 0
+        if saturation < MONOCHROME_SATURATION and r + g + b < MONOCHROME_DARKNESS * 3: dark_pixels += 1
+    return dark_pixels / (SAMPLE_SIZE * SAMPLE_SIZE) > MONOCHROME_RATIO
+
+class IconMetadataIndex:
+    def __init__(self, index_path=ICON_METADATA_PATH):
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._save_timer = None
+        self._write_lock = threading.Lock()
+        self.records = self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f: return json.load(f)
+        except (OSError, json.JSONDecodeError): return {}
+
+    def save(self):
+        with self._lock:
+            self._save_timer = None
+            data = json.dumps(self.records, ensure_ascii=False)
+        temp_path = self.index_path + ".tmp"
+        with self._write_lock:
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f: f.write(data)
+                os.replace(temp_path, self.index_path)
+            except OSError as e:
+                print(f"No se pudieron guardar los metadatos de iconos: {e}")
+
+    def flush(self):
+        with self._lock:
+            if self._save_timer is None: return
+            self._save_timer.cancel()
+        self.save()
+
+    def _schedule_save(self):
+        if self._save_timer is not None: return
+        self._save_timer = threading.Timer(SAVE_DELAY, self.save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _compute(self, path, stat):
+        with open(path, 'rb') as f: content = f.read()
+        image = QImage.fromData(content)
+        return {
+            "version": METADATA_VERSION, "size": stat.st_size, "mtime": stat.st_mtime, "sha1": hashlib.sha1(content).hexdigest(),
+            "width": image.width(), "height": image.height(),
+            "dark_grayscale": is_strictly_dark_grayscale(image), "dark_monochrome": is_dark_and_monochromatic(image)
+        }
+
+    def get(self, path):
+        if not path: return None
+        key = os.path.normcase(os.path.abspath(path))
+        try: stat = os.stat(path)
+        except OSError: return None
+        with self._lock:
+            record = self.records.get(key)
+        if record and record.get("version") == METADATA_VERSION and record.get("size") == stat.st_size and record.get("mtime") == stat.st_mtime: return record
+        try: record = self._compute(path, stat)
+        except OSError as e:
+            print(f"No se pudieron leer los metadatos del icono '{path}': {e}")
+            return None
+        with self._lock:
+            self.records[key] = record
+            self._schedule_save()
+        return record
+
+    def ensure(self, paths):
+        for path in ([paths] if isinstance(paths, str) else paths): self.get(path)
+
+    def forget(self, path):
+        with self._lock:
+            if self.records.pop(os.path.normcase(os.path.abspath(path)), None) is not None: self._schedule_save()
+
+    def is_dark_grayscale(self, path):
+        record = self.get(path)
+        return bool(record and record["dark_grayscale"])
+
+    def is_dark_monochrome(self, path):
+        record = self.get(path)
+        return bool(record and record["dark_monochrome"])
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_icon_metadata():
+    global _index
+    with _index_lock:
+        if _index is None: _index = IconMetadataIndex()
+        return _index
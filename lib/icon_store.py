@@ -0,0 +1,135 @@
+import os
+import re
+import time
+import hashlib
+import threading
+from lib.icon_index import get_icon_index
+from lib.icon_metadata import get_icon_metadata
+from lib.icon_thumbnails import THUMBNAILS_PATH, iter_icon_records, get_thumbnail_service
+
+CONTENT_NAME_PATTERN = re.compile(r"^[0-9a-f]{32}\.\w+$")
+GC_DELAY = 5.0
+GC_GRACE_SECONDS = 600
+
+def reference_counts(profiles):
+    counts = {}
+    for record in iter_icon_records(profiles):
+        paths = [record.get("icon")] + [path for key, path in (record.get("thumbnails") or {}).items() if key not in ("source", "source_id")]
+        for path in filter(None, paths):
+            key = os.path.normcase(os.path.abspath(path))
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+class IconStore:
+    def __init__(self, cache_path, quota_bytes=0):
+        self.cache_path = cache_path
+        self.quota_bytes = quota_bytes
+        self._lock = threading.Lock()
+        self._gc_timer = None
+        self._pending_counts = None
+        os.makedirs(self.cache_path, exist_ok=True)
+
+    def _is_content_addressed(self, path):
+        return os.path.normcase(os.path.dirname(os.path.abspath(path))) == os.path.normcase(os.path.abspath(self.cache_path)) and bool(CONTENT_NAME_PATTERN.match(os.path.basename(path)))
+
+    def put_bytes(self, content, ext=".png"):
+        if not content: return None
+        ext = (ext or ".png").lower()
+        final_path = os.path.join(self.cache_path, hashlib.sha256(content).hexdigest()[:32] + ext)
+        with self._lock:
+            if os.path.exists(final_path):
+                os.utime(final_path)
+            else:
+                temp_path = f"{final_path}.{threading.get_ident()}.tmp"
+                with open(temp_path, 'wb') as f: f.write(content)
+                os.replace(temp_path, final_path)
+                get_icon_index().invalidate(self.cache_path)
+        get_thumbnail_service().request(final_path)
+        return final_path
+
+    def put_file(self, source_path):
+        if not source_path or not os.path.exists(source_path): return None
+        if self._is_content_addressed(source_path): return source_path
+        with open(source_path, 'rb') as f: content = f.read()
+        return self.put_bytes(content, os.path.splitext(source_path)[1] or ".png")
+
+    def adopt(self, profiles):
+        adopted = 0
+        for record in iter_icon_records(profiles):
+            icon_path = record.get("icon")
+            if not icon_path or self._is_content_addressed(icon_path): continue
+            if os.path.normcase(os.path.dirname(os.path.abspath(icon_path))) != os.path.normcase(os.path.abspath(self.cache_path)): continue
+            try: new_path = self.put_file(icon_path)
+            except OSError as e:
+                print(f"No se pudo migrar el icono '{icon_path}' a la caché por contenido: {e}")
+                continue
+            if new_path and new_path != icon_path:
+                record["icon"] = new_path
+                adopted += 1
+        if adopted: print(f"{adopted} iconos migrados a la caché por contenido.")
+        return adopted > 0
+
+    def schedule_collect(self, profiles):
+        counts = reference_counts(profiles)
+        with self._lock:
+            self._pending_counts = counts
+            if self._gc_timer is not None: return
+            self._gc_timer = threading.Timer(GC_DELAY, self._run_collect)
+            self._gc_timer.daemon = True
+            self._gc_timer.start()
+
+    def _run_collect(self):
+        with self._lock:
+            counts, self._pending_counts = self._pending_counts, None
+            self._gc_timer = None
+        if counts is not None: self.collect_garbage(counts)
+
+    def _scan(self):
+        entries = []
+        for folder in (self.cache_path, THUMBNAILS_PATH):
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if not entry.is_file(): continue
+                        stat = entry.stat()
+                        entries.append((os.path.normcase(os.path.abspath(entry.path)), entry.path, stat.st_size, max(stat.st_atime, stat.st_mtime)))
+            except OSError:
+                pass
+        return entries
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            get_icon_metadata().forget(path)
+            return True
+        except OSError as e:
+            print(f"No se pudo eliminar '{path}' de la caché de iconos: {e}")
+            return False
+
+    def _remove_if_untouched(self, path, used_at):
+        with self._lock:
+            try: stat = os.stat(path)
+            except OSError: return False
+            if max(stat.st_atime, stat.st_mtime) > used_at: return False
+            return self._remove(path)
+
+    def collect_garbage(self, counts):
+        now, removed, freed, kept = time.time(), 0, 0, []
+        for key, path, size, used_at in self._scan():
+            if counts.get(key, 0) == 0 and now - used_at > GC_GRACE_SECONDS:
+                if self._remove_if_untouched(path, used_at): removed += 1; freed += size
+                continue
+            kept.append((key, path, size, used_at))
+        total = sum(entry[2] for entry in kept)
+        if self.quota_bytes and total > self.quota_bytes:
+            evictable = sorted((entry for entry in kept if counts.get(entry[0], 0) == 0), key=lambda entry: entry[3])
+            for key, path, size, used_at in evictable:
+                if total <= self.quota_bytes: break
+                if self._remove_if_untouched(path, used_at): removed += 1; freed += size; total -= size
+            if total > self.quota_bytes:
+                print(f"La caché de iconos ({total // 1024} KB) supera la cuota; el resto de iconos está en uso.")
+        if removed:
+            get_icon_index().invalidate(self.cache_path)
+            get_icon_index().invalidate(THUMBNAILS_PATH)
+            print(f"Caché de iconos: {removed} archivos eliminados ({freed // 1024} KB liberados).")
+        return removed
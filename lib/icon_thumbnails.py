@@ -0,0 +1,136 @@
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+from lib.paths import APP_DATA_PATH
+from lib.icon_index import get_icon_index
+
+THUMBNAILS_PATH = os.path.join(APP_DATA_PATH, "icons_cache", "thumbnails")
+THUMBNAIL_SIZES = {"card": (220, 120), "overlay": (200, 108), "overlay_profile": (140, 140)}
+THUMBNAIL_SCALES = (1, 2)
+MAX_THUMBNAIL_THREADS = 2
+
+def _thumbnail_key(name, scale):
+    return f"{name}@{scale}x"
+
+def _source_id(icon_path):
+    stat = os.stat(icon_path)
+    return hashlib.sha1(f"{os.path.normcase(os.path.abspath(icon_path))}|{stat.st_size}|{stat.st_mtime}".encode('utf-8')).hexdigest()[:16]
+
+def iter_icon_records(profiles):
+    for categories in profiles.values():
+        for category_profiles in categories.values():
+            for profile in category_profiles.values():
+                if not isinstance(profile, dict): continue
+                yield profile
+                for mod in profile.get("mods", []):
+                    if isinstance(mod, dict): yield mod
+
+def generate_thumbnails(icon_path):
+    try: source_id = _source_id(icon_path)
+    except OSError: return {}
+    os.makedirs(THUMBNAILS_PATH, exist_ok=True)
+    image, thumbnails = None, {}
+    for name, (width, height) in THUMBNAIL_SIZES.items():
+        aspect_mode = Qt.AspectRatioMode.IgnoreAspectRatio if width == height else Qt.AspectRatioMode.KeepAspectRatio
+        for scale in THUMBNAIL_SCALES:
+            key = _thumbnail_key(name, scale)
+            path = os.path.join(THUMBNAILS_PATH, f"{source_id}_{key}.png")
+            if not os.path.exists(path):
+                if image is None: image = QImage(icon_path)
+                if image.isNull():
+                    print(f"No se pudo leer el icono para generar miniaturas: {icon_path}")
+                    return {}
+                temp_path = path + ".tmp"
+                if not image.scaled(width * scale, height * scale, aspect_mode, Qt.TransformationMode.SmoothTransformation).save(temp_path, "PNG"):
+                    print(f"No se pudo guardar la miniatura: {path}")
+                    continue
+                os.replace(temp_path, path)
+            thumbnails[key] = path
+    get_icon_index().invalidate(THUMBNAILS_PATH)
+    return {"source": icon_path, "source_id": source_id, **thumbnails} if thumbnails else {}
+
+def _is_current(icon_path, thumbnails):
+    if not isinstance(thumbnails, dict) or thumbnails.get("source") != icon_path: return False
+    try:
+        if thumbnails.get("source_id") != _source_id(icon_path): return False
+    except OSError:
+        return False
+    return all(get_icon_index().exists(path) for key, path in thumbnails.items() if key not in ("source", "source_id"))
+
+def apply_thumbnails(profiles, icon_path, thumbnails):
+    changed = False
+    for record in iter_icon_records(profiles):
+        if (record.get("icon") or "") != icon_path or record.get("thumbnails") == (thumbnails or None): continue
+        if thumbnails: record["thumbnails"] = dict(thumbnails)
+        else: record.pop("thumbnails", None)
+        changed = True
+    return changed
+
+class ThumbnailService(QObject):
+    thumbnails_ready = pyqtSignal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=MAX_THUMBNAIL_THREADS, thread_name_prefix="thumbnails")
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._backfill_snapshot = None
+
+    def request(self, icon_path):
+        if not icon_path: return
+        with self._lock:
+            if icon_path in self._pending: return
+            self._pending.add(icon_path)
+        self._executor.submit(self._generate, icon_path)
+
+    def _generate(self, icon_path):
+        try: thumbnails = generate_thumbnails(icon_path)
+        except Exception as e:
+            print(f"No se pudieron generar las miniaturas de '{icon_path}': {e}")
+            thumbnails = {}
+        finally:
+            with self._lock: self._pending.discard(icon_path)
+        self.thumbnails_ready.emit(icon_path, thumbnails)
+
+    def schedule_backfill(self, profiles):
+        snapshot = {}
+        for record in iter_icon_records(profiles):
+            icon_path = record.get("icon")
+            if icon_path: snapshot.setdefault(icon_path, []).append(record.get("thumbnails"))
+            elif record.get("thumbnails"): snapshot.setdefault("", []).append(record.get("thumbnails"))
+        with self._lock:
+            queued, self._backfill_snapshot = self._backfill_snapshot is not None, snapshot
+        if not queued: self._executor.submit(self._backfill)
+
+    def _backfill(self):
+        with self._lock:
+            snapshot, self._backfill_snapshot = self._backfill_snapshot, None
+        for icon_path, recorded in (snapshot or {}).items():
+            if not icon_path or not get_icon_index().exists(icon_path):
+                if any(recorded): self.thumbnails_ready.emit(icon_path, {})
+                continue
+            if all(_is_current(icon_path, thumbnails) for thumbnails in recorded): continue
+            self._generate(icon_path)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_thumbnail_service():
+    global _service
+    with _service_lock:
+        if _service is None: _service = ThumbnailService()
+        return _service
+
+def thumbnail_path(record, name, device_pixel_ratio=1.0):
+    thumbnails = record.get("thumbnails")
+    if not isinstance(thumbnails, dict) or thumbnails.get("source") != record.get("icon"): return None, 1
+    scale = next((s for s in THUMBNAIL_SCALES if s >= device_pixel_ratio), THUMBNAIL_SCALES[-1])
+    path = thumbnails.get(_thumbnail_key(name, scale))
+    if path and get_icon_index().exists(path): return path, scale
+    return None, 1
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import argparse
+from lib.http_client import MOCK_BASE_URL_ENV, HttpClient
+from lib.mock_gamebanana import DEFAULT_FIXTURES_PATH, MockSettings, start_in_background
+from lib.mock_fixtures import fixture_requests, encode_body, endpoint_of
+
+def run(client, rounds):
+    timings, failures = {}, []
+    for _ in range(rounds):
+        for url, params, body, _ in fixture_requests():
+            endpoint = endpoint_of(url)
+            started = time.monotonic()
+            try:
+                response = client.get(url, params=params)
+                ok = response.status_code == 200 and response.content == encode_body(body)
+                if not ok: failures.append(f"{endpoint}: HTTP {response.status_code}, {len(response.content)} bytes")
+            except Exception as e:
+                failures.append(f"{endpoint}: {e}")
+            timings.setdefault(endpoint, []).append(time.monotonic() - started)
+    return timings, failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduce las peticiones de MIMM contra el servidor simulado de GameBanana y mide sus tiempos.")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_PATH)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--bandwidth-kbps", type=int, default=0, help="0 = sin límite.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probabilidad (0-1) de devolver un error inyectado.")
+    args = parser.parse_args()
+    server = start_in_background(args.fixtures, MockSettings(args.latency_ms, args.jitter_ms, args.bandwidth_kbps, args.error_rate))
+    os.environ[MOCK_BASE_URL_ENV] = server.base_url
+    client = HttpClient()
+    try:
+        timings, failures = run(client, args.rounds)
+    finally:
+        client.close()
+        server.shutdown(); server.server_close()
+    for endpoint, samples in sorted(timings.items()):
+        samples.sort()
+        print(f"[Bench] {endpoint}: {len(samples)} peticiones, mediana {samples[len(samples) // 2] * 1000:.1f} ms, máximo {samples[-1] * 1000:.1f} ms")
+    client.log_metrics(); server.stats.log()
+    for failure in failures: print(f"[Bench] Fallo: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import io
+import json
+import zipfile
+import argparse
+from urllib.parse import urlsplit, urlencode
+from lib.mock_gamebanana import DEFAULT_FIXTURES_PATH, FixtureStore, classify
+
+GAME_ID = 8552
+CATEGORY_ID = 18140
+SUBCATEGORY_ID, SUBCATEGORY_NAME = 18141, "Sample Character"
+MOD_ID, FILE_ID = 1000001, 2000001
+MOD_NAME = "MIMM Sample Mod"
+DATE_ADDED = 1700000000
+PER_PAGE = "20"
+DEFAULT_SORT = "_tsDateUpdated,DESC"
+NSFW_FILTER = ("_aArgs[]", "_sbIsNsfw = false")
+LISTING_PROPERTIES = "_idRow,_sName,_sProfileUrl,_aSubmitter,_tsDateUpdated,_tsDateAdded,_aPreviewMedia,_nViewCount,_nLikeCount,_nDownloadCount,_aFiles,_bIsNsfw,_aCategory"
+UPDATE_PROPERTIES = "_idRow,_sName,_aSubmitter,_sProfileUrl,_aFiles"
+
+def _archive():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        entry = zipfile.ZipInfo("MIMM Sample Mod/mod.ini", date_time=(2024, 1, 1, 0, 0, 0))
+        archive.writestr(entry, "[Constants]\nglobal $active = 0\n")
+    return buffer.getvalue()
+
+def _file_record(archive):
+    return {"_idRow": FILE_ID, "_sFile": "mimm_sample_mod_v1.zip", "_nFilesize": len(archive), "_sDescription": "", "_tsDateAdded": DATE_ADDED, "_nDownloadCount": 0, "_sDownloadUrl": f"https://gamebanana.com/dl/{FILE_ID}"}
+
+def _mod_record(archive):
+    return {"_idRow": MOD_ID, "_sModelName": "Mod", "_sName": MOD_NAME, "_sProfileUrl": f"https://gamebanana.com/mods/{MOD_ID}", "_aSubmitter": {"_idRow": 1, "_sName": "MIMM"}, "_tsDateAdded": DATE_ADDED, "_tsDateUpdated": DATE_ADDED, "_aPreviewMedia": [], "_nViewCount": 0, "_nLikeCount": 0, "_nDownloadCount": 0, "_bIsNsfw": False, "_aCategory": {"_idRow": SUBCATEGORY_ID, "_sName": SUBCATEGORY_NAME}, "_aFiles": [_file_record(archive)]}
+
+def fixture_requests():
+    archive = _archive(); mod = _mod_record(archive)
+    listing = [("_csvProperties", LISTING_PROPERTIES), ("_nPerpage", PER_PAGE)]
+    return [
+        ("https://gamebanana.com/apiv6/Mod/ByCategory", listing + [("_sOrderBy", DEFAULT_SORT), ("_aCategoryRowIds[]", str(CATEGORY_ID)), NSFW_FILTER, ("_nPage", "1")], [mod], "application/json"),
+        ("https://gamebanana.com/apiv6/Mod/ByName", listing + [("_sName", "*sample*"), ("_idGameRow", str(GAME_ID)), NSFW_FILTER, ("_nPage", "1")], [mod], "application/json"),
+        ("https://gamebanana.com/apiv11/Mod/Categories", [("_idCategoryRow", str(CATEGORY_ID)), ("_sSort", "a_to_z")], [{"_idRow": SUBCATEGORY_ID, "_sName": SUBCATEGORY_NAME}], "application/json"),
+        (f"https://gamebanana.com/apiv11/Game/{GAME_ID}/Subfeed", [("_nPage", "1"), ("_sSort", "new"), ("_sName", MOD_NAME)], {"_aRecords": [mod]}, "application/json"),
+        (f"https://gamebanana.com/apiv11/Mod/{MOD_ID}", [("_csvProperties", UPDATE_PROPERTIES)], {key: mod[key] for key in UPDATE_PROPERTIES.split(",")}, "application/json"),
+        (f"https://gamebanana.com/apiv11/Mod/{MOD_ID}", [("_csvProperties", "_aFiles")], {"_aFiles": mod["_aFiles"]}, "application/json"),
+        (f"https://gamebanana.com/dl/{FILE_ID}", [], archive, "application/zip"),
+    ]
+
+def encode_body(body):
+    return body if isinstance(body, bytes) else json.dumps(body, indent=4).encode('utf-8')
+
+def endpoint_of(url):
+    parts = urlsplit(url)
+    return classify(parts.netloc, parts.path)[0]
+
+def build(fixtures_path=DEFAULT_FIXTURES_PATH):
+    store = FixtureStore(fixtures_path)
+    for url, params, body, content_type in fixture_requests():
+        parts = urlsplit(url)
+        store.save(parts.netloc, parts.path, urlencode(params), 200, content_type, encode_body(body))
+        print(f"[Mock] Fixture generada: {endpoint_of(url)} -> {url}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera el conjunto mínimo de respuestas grabadas para el servidor simulado de GameBanana.")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_PATH, help="Carpeta donde se escriben las respuestas grabadas.")
+    build(parser.parse_args().fixtures)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl, urlencode
+try:
+    import requests
+except ImportError:
+    requests = None
+from lib.http_client import MOCKED_HOSTS, MOCK_BASE_URL_ENV, USER_AGENT
+
+DEFAULT_PORT = 8765
+DEFAULT_FIXTURES_PATH = "gamebanana_fixtures"
+CHUNK_SIZE = 16384
+
+ENDPOINTS = [
+    (re.compile(r"^/apiv\d+/Mod/ByCategory$"), "Mod/ByCategory", True),
+    (re.compile(r"^/apiv\d+/Mod/ByName$"), "Mod/ByName", True),
+    (re.compile(r"^/apiv\d+/Mod/Categories$"), "Mod/Categories", True),
+    (re.compile(r"^/apiv\d+/Game/\d+/Subfeed$"), "Game/Subfeed", False),
+    (re.compile(r"^/apiv\d+/Mod/\d+$"), "Mod/{id}", False),
+    (re.compile(r"^/(dl|mmdl)/\d+"), "download", False),
+]
+
+def fixture_key(host, path, query):
+    normalized_query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return hashlib.sha1(f"{host}{path}?{normalized_query}".encode('utf-8')).hexdigest()
+
+def classify(host, path):
+    if host != "gamebanana.com": return "file", False
+    for pattern, name, is_listing in ENDPOINTS:
+        if pattern.search(path): return name, is_listing
+    return "other", False
+
+class FixtureStore:
+    def __init__(self, fixtures_path):
+        self.fixtures_path = fixtures_path
+        self._lock = threading.Lock()
+
+    def _paths(self, host, key):
+        folder = os.path.join(self.fixtures_path, host)
+        return os.path.join(folder, key + ".json"), os.path.join(folder, key + ".body")
+
+    def load(self, host, path, query):
+        meta_path, body_path = self._paths(host, fixture_key(host, path, query))
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f: meta = json.load(f)
+            with open(body_path, 'rb') as f: body = f.read()
+        except (OSError, json.JSONDecodeError):
+            return None
+        return meta, body
+
+    def save(self, host, path, query, status, content_type, body):
+        meta_path, body_path = self._paths(host, fixture_key(host, path, query))
+        meta = {"url": f"https://{host}{path}" + (f"?{query}" if query else ""), "status": status, "content_type": content_type, "etag": '"' + hashlib.sha1(body).hexdigest() + '"', "recorded_at": time.time()}
+        with self._lock:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            with open(body_path, 'wb') as f: f.write(body)
+            with open(meta_path, 'w', encoding='utf-8') as f: json.dump(meta, f, indent=4)
+        return meta
+
+class MockSettings:
+    def __init__(self, latency_ms=0, jitter_ms=0, bandwidth_kbps=0, error_rate=0.0, error_status=503, retry_after=1, record=False):
+        self.latency_ms, self.jitter_ms = latency_ms, jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.error_rate, self.error_status, self.retry_after = error_rate, error_status, retry_after
+        self.record = record
+
+class MockStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {}
+
+    def add(self, endpoint, outcome):
+        with self._lock:
+            endpoint_counts = self.counts.setdefault(endpoint, {})
+            endpoint_counts[outcome] = endpoint_counts.get(outcome, 0) + 1
+
+    def log(self):
+        with self._lock:
+            for endpoint, outcomes in sorted(self.counts.items()):
+                print(f"[Mock] {endpoint}: " + ", ".join(f"{outcome}={count}" for outcome, count in sorted(outcomes.items())))
+
+class MockGameBananaHandler(BaseHTTPRequestHandler):
+    server_version = "MIMM-Mock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose: super().log_message(format, *args)
+
+    def do_GET(self):
+        settings, stats = self.server.settings, self.server.stats
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip('/').partition('/')
+        host, path = host.lower(), '/' + path
+        if host not in MOCKED_HOSTS:
+            self._send_json(400, {"_sErrorCode": "unknown_host", "_sErrorMessage": f"Host no simulado: {host}"}); return
+        endpoint, is_listing = classify(host, path)
+
+        delay = settings.latency_ms + random.uniform(0, settings.jitter_ms)
+        if delay: time.sleep(delay / 1000)
+        if settings.error_rate and random.random() < settings.error_rate:
+            stats.add(endpoint, f"error_{settings.error_status}")
+            headers = {"Retry-After": str(settings.retry_after)} if settings.error_status in (429, 503) else {}
+            self._send_json(settings.error_status, {"_sErrorCode": "injected_error"}, headers); return
+
+        fixture = self.server.store.load(host, path, parts.query)
+        if fixture is None and settings.record:
+            fixture = self._record(host, path, parts.query)
+        if fixture is None:
+            stats.add(endpoint, "missing")
+            if is_listing: self._send_json(200, [])
+            else: self._send_json(404, {"_sErrorCode": "fixture_not_found", "_sErrorMessage": f"Sin grabación para {host}{path}"})
+            return
+
+        meta, body = fixture
+        if meta.get("etag") and self.headers.get('If-None-Match') == meta["etag"]:
+            stats.add(endpoint, "304")
+            self.send_response(304); self.send_header("ETag", meta["etag"]); self.send_header("Content-Length", "0"); self.end_headers(); return
+        stats.add(endpoint, "hit")
+        self._send_body(meta, body)
+
+    def _record(self, host, path, query):
+        if not requests:
+            print("[Mock] Módulo 'requests' no disponible; no se puede grabar.")
+            return None
+        upstream_url = f"https://{host}{path}" + (f"?{query}" if query else "")
+        try:
+            response = requests.get(upstream_url, headers={'User-Agent': USER_AGENT}, timeout=(6, 60))
+        except requests.RequestException as e:
+            print(f"[Mock] No se pudo grabar '{upstream_url}': {e}")
+            return None
+        if response.status_code != 200:
+            print(f"[Mock] '{upstream_url}' respondió {response.status_code}; no se graba.")
+            return None
+        meta = self.server.store.save(host, path, query, response.status_code, response.headers.get('Content-Type', 'application/octet-stream'), response.content)
+        print(f"[Mock] Grabado: {upstream_url}")
+        return meta, response.content
+
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items(): self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_body(self, meta, body):
+        start, end, status = 0, len(body) - 1, meta.get("status", 200)
+        range_match = re.match(r"bytes=(\d*)-(\d*)$", self.headers.get('Range', ''))
+        if range_match and body:
+            if range_match.group(1): start = int(range_match.group(1)); end = int(range_match.group(2) or end)
+            elif range_match.group(2): start = max(0, len(body) - int(range_match.group(2)))
+            end = min(end, len(body) - 1)
+            if start > end:
+                self.send_response(416); self.send_header("Content-Range", f"bytes */{len(body)}"); self.send_header("Content-Length", "0"); self.end_headers(); return
+            status = 206
+        payload = body[start:end + 1]
+        self.send_response(status)
+        self.send_header("Content-Type", meta.get("content_type", "application/octet-stream"))
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Accept-Ranges", "bytes")
+        if meta.get("etag"): self.send_header("ETag", meta["etag"])
+        if status == 206: self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        self.end_headers()
+        self._write_throttled(payload)
+
+    def _write_throttled(self, payload):
+        bytes_per_second = self.server.settings.bandwidth_kbps * 1024
+        started = time.monotonic()
+        try:
+            for offset in range(0, len(payload), CHUNK_SIZE):
+                chunk = payload[offset:offset + CHUNK_SIZE]
+                if bytes_per_second:
+                    ahead = (offset + len(chunk)) / bytes_per_second - (time.monotonic() - started)
+                    if ahead > 0: time.sleep(ahead)
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+class MockGameBananaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, fixtures_path=DEFAULT_FIXTURES_PATH, settings=None, verbose=False):
+        super().__init__(address, MockGameBananaHandler)
+        self.store = FixtureStore(fixtures_path)
+        self.settings = settings or MockSettings()
+        self.stats = MockStats()
+        self.verbose = verbose
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+def start_in_background(fixtures_path=DEFAULT_FIXTURES_PATH, settings=None, port=0):
+    server = MockGameBananaServer(("127.0.0.1", port), fixtures_path, settings)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que simula la API de GameBanana usada por MIMM a partir de respuestas grabadas.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_PATH, help="Carpeta con las respuestas grabadas.")
+    parser.add_argument("--record", action="store_true", help="Graba desde GameBanana las peticiones que no tengan respuesta guardada.")
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--bandwidth-kbps", type=int, default=0, help="0 = sin límite.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probabilidad (0-1) de devolver un error inyectado.")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    settings = MockSettings(args.latency_ms, args.jitter_ms, args.bandwidth_kbps, args.error_rate, args.error_status, args.retry_after, args.record)
+    server = MockGameBananaServer(("127.0.0.1", args.port), args.fixtures, settings, args.verbose)
+    print(f"[Mock] Sirviendo '{args.fixtures}' en {server.base_url}. Inicia MIMM con {MOCK_BASE_URL_ENV}={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.stats.log()
+
+if __name__ == '__main__':
+    main()
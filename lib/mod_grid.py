@@ -0,0 +1,340 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect, QRectF, QPointF, QTimer, QEvent, pyqtSignal
+from PyQt6.QtGui import QPainter, QPainterPath, QPen, QColor, QPalette, QFont, QFontMetrics, QIcon, QPixmap
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QToolTip
+from lib.icon_factory import get_icon_factory
+from lib.icon_index import get_icon_index
+from lib.icon_loader import get_icon_loader, PRIORITY_VISIBLE
+from lib.icon_thumbnails import thumbnail_path
+
+ACTIVE_ROLE = Qt.ItemDataRole.UserRole + 1
+CARD_SIZE = QSize(280, 220)
+CARD_MARGIN = 8
+CARD_ICON_SIZE = QSize(220, 120)
+CARD_ICON_FRAME = QSize(215, 120)
+CARD_BUTTON_SIZE, CARD_BUTTON_ICON_SIZE, CARD_BUTTON_SPACING = 32, 18, 4
+NONE_ICON_SIZE = 80
+MARQUEE_INTERVAL_MS, MARQUEE_PADDING, MARQUEE_MAX_CHARS = 30, 30, 20
+
+class ModListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mods = []
+        self.active = []
+        self.snapshots = []
+        self.icon_keys = []
+        self.dataChanged.connect(self._invalidate_icon_keys)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.mods)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.mods): return None
+        mod_info = self.mods[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole: return mod_info.get("display_name") or mod_info.get("name", "")
+        if role == ACTIVE_ROLE: return self.active[index.row()]
+        return None
+
+    def mod_at(self, row):
+        return self.mods[row] if 0 <= row < len(self.mods) else None
+
+    @staticmethod
+    def mod_key(mod_info):
+        return mod_info.get("path") or mod_info.get("folder_name")
+
+    def _reset(self, mods, active_flags):
+        self.beginResetModel()
+        self.mods, self.active = list(mods), list(active_flags)
+        self.snapshots = [dict(mod_info) for mod_info in self.mods]
+        self.icon_keys = [None] * len(self.mods)
+        self.endResetModel()
+
+    def set_mods(self, mods, active_flags):
+        keys = [self.mod_key(mod_info) for mod_info in mods]
+        wanted = set(keys)
+        if len(wanted) != len(keys): return self._reset(mods, active_flags)
+        for row in range(len(self.mods) - 1, -1, -1):
+            if self.mod_key(self.mods[row]) in wanted: continue
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.mods[row], self.active[row], self.snapshots[row], self.icon_keys[row]
+            self.endRemoveRows()
+        current = [self.mod_key(mod_info) for mod_info in self.mods]
+        remaining = set(current)
+        if current != [key for key in keys if key in remaining]: return self._reset(mods, active_flags)
+        for row, mod_info in enumerate(mods):
+            if row < len(self.mods) and self.mod_key(self.mods[row]) == keys[row]: continue
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.mods.insert(row, mod_info); self.active.insert(row, active_flags[row]); self.snapshots.insert(row, dict(mod_info)); self.icon_keys.insert(row, None)
+            self.endInsertRows()
+        for row, mod_info in enumerate(mods):
+            self.mods[row] = mod_info
+            if self.snapshots[row] == mod_info and self.active[row] == active_flags[row]: continue
+            self.active[row], self.snapshots[row] = active_flags[row], dict(mod_info)
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def _invalidate_icon_keys(self, top_left, bottom_right, roles=()):
+        if list(roles) == [ACTIVE_ROLE]: return
+        for row in range(top_left.row(), min(bottom_right.row() + 1, len(self.icon_keys))): self.icon_keys[row] = None
+
+    def set_active(self, row, active):
+        if self.active[row] == active: return
+        self.active[row] = active
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [ACTIVE_ROLE])
+
+    def set_active_flags(self, active_flags):
+        for row, active in enumerate(active_flags): self.set_active(row, active)
+
+class ModCardDelegate(QStyledItemDelegate):
+    card_clicked = pyqtSignal(int)
+    edit_requested = pyqtSignal(object)
+    delete_requested = pyqtSignal(object)
+    url_requested = pyqtSignal(str)
+    update_requested = pyqtSignal(object)
+
+    BUTTONS = ("edit", "url", "update", "delete")
+    BUTTON_TOOLTIPS = {"edit": "tooltip_edit_mod_info", "url": "tooltip_open_mod_page", "update": "tooltip_check_for_updates", "delete": "tooltip_delete_this_mod"}
+
+    def __init__(self, view, mod_manager):
+        super().__init__(view)
+        self.view = view
+        self.translator = mod_manager.translator
+        highlight_color = view.palette().color(QPalette.ColorRole.Highlight)
+        self.button_icons = {
+            "edit": mod_manager._create_colored_icon(mod_manager.ICON_EDIT, highlight_color),
+            "url": mod_manager._create_colored_icon(mod_manager.ICON_URL, highlight_color),
+            "update": mod_manager._create_colored_icon(mod_manager.ICON_UPDATE, highlight_color),
+            "delete": mod_manager._create_colored_icon(mod_manager.ICON_REMOVE, highlight_color),
+        }
+        self.none_icon = get_icon_factory().svg_icon(mod_manager.ICON_NONE, highlight_color.darker(120), NONE_ICON_SIZE, view.devicePixelRatioF())
+        self.name_font = QFont(view.font()); self.name_font.setPointSize(11); self.name_font.setBold(True)
+        self.creator_font = QFont(view.font()); self.creator_font.setItalic(True)
+        self.pending_keys, self.failed_keys = set(), set()
+        self.hovered_row, self.hovered_button, self.pressed = -1, None, None
+        self.marquee_offset = 0
+        self.marquee_timer = QTimer(self)
+        self.marquee_timer.timeout.connect(self._scroll_marquee)
+        loader = get_icon_loader()
+        loader.icon_ready.connect(self._on_icon_ready)
+        loader.icon_failed.connect(self._on_icon_failed)
+        for signal in (view.model().modelReset, view.model().rowsInserted, view.model().rowsRemoved):
+            signal.connect(lambda *_: self._set_hover(-1, None))
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    @staticmethod
+    def _is_none_card(mod_info):
+        return mod_info.get("slot_id") == 0 and mod_info.get("path") is None
+
+    def _mod(self, index):
+        return index.model().mod_at(index.row()) if index.isValid() else None
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def _card_rect(self, rect):
+        return QRect(rect.x() + (rect.width() - CARD_SIZE.width()) // 2, rect.y(), CARD_SIZE.width(), CARD_SIZE.height())
+
+    def _icon_rect(self, card_rect):
+        return QRect(card_rect.x() + (card_rect.width() - CARD_ICON_FRAME.width()) // 2, card_rect.y() + CARD_MARGIN, CARD_ICON_FRAME.width(), CARD_ICON_FRAME.height())
+
+    def _name_rect(self, card_rect):
+        fm = QFontMetrics(self.name_font)
+        width = min(card_rect.width() - 2 * CARD_MARGIN, fm.horizontalAdvance("W" * 15) + 5)
+        return QRect(card_rect.x() + (card_rect.width() - width) // 2, self._icon_rect(card_rect).bottom() + 6, width, fm.height())
+
+    def _button_rects(self, card_rect):
+        total_width = len(self.BUTTONS) * (CARD_BUTTON_SIZE + CARD_BUTTON_SPACING) - CARD_BUTTON_SPACING
+        left = card_rect.x() + (card_rect.width() - total_width) // 2
+        top = card_rect.bottom() - CARD_MARGIN - CARD_BUTTON_SIZE + 1
+        return {name: QRect(left + i * (CARD_BUTTON_SIZE + CARD_BUTTON_SPACING), top, CARD_BUTTON_SIZE, CARD_BUTTON_SIZE) for i, name in enumerate(self.BUTTONS)}
+
+    def _button_enabled(self, mod_info, name):
+        if name == "url": return bool(mod_info.get("url"))
+        if name == "update": return bool(mod_info.get("profile_url"))
+        return True
+
+    def _button_at(self, rect, pos, mod_info):
+        if mod_info is None or self._is_none_card(mod_info): return None
+        for name, button_rect in self._button_rects(self._card_rect(rect)).items():
+            if button_rect.contains(pos): return name
+        return None
+
+    def paint(self, painter, option, index):
+        mod_info = self._mod(index)
+        if mod_info is None: return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        card_rect = self._card_rect(option.rect)
+        palette = self.view.palette()
+        highlight_color = palette.color(QPalette.ColorRole.Highlight)
+        is_active = bool(index.data(ACTIVE_ROLE))
+        is_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        if is_hovered and not is_active:
+            hover_color = QColor(highlight_color); hover_color.setAlpha(40)
+            path = QPainterPath(); path.addRoundedRect(QRectF(card_rect), 8, 8)
+            painter.fillPath(path, hover_color)
+        if is_active:
+            painter.setPen(QPen(highlight_color, 3))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(QRectF(card_rect).adjusted(1.5, 1.5, -1.5, -1.5), 8, 8)
+        text_color = highlight_color if is_active else palette.color(QPalette.ColorRole.Text)
+        if self._is_none_card(mod_info): self._paint_none_card(painter, card_rect, text_color)
+        else: self._paint_mod_card(painter, card_rect, mod_info, index.row(), text_color)
+        painter.restore()
+
+    def _paint_none_card(self, painter, card_rect, text_color):
+        icon_rect = QRect(card_rect.x() + (card_rect.width() - NONE_ICON_SIZE) // 2, card_rect.y() + CARD_MARGIN + 20, NONE_ICON_SIZE, NONE_ICON_SIZE)
+        self.none_icon.paint(painter, icon_rect)
+        status_font = QFont(self.creator_font)
+        status_height, name_height = QFontMetrics(status_font).height(), QFontMetrics(self.name_font).height()
+        status_rect = QRect(card_rect.x(), card_rect.bottom() - CARD_MARGIN - 40 - status_height, card_rect.width(), status_height)
+        name_rect = QRect(card_rect.x(), status_rect.y() - 6 - name_height, card_rect.width(), name_height)
+        painter.setPen(text_color)
+        painter.setFont(self.name_font)
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, self.translator.translate("text_none"))
+        painter.setFont(status_font)
+        painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, f"({self.translator.translate('text_deactivated')})")
+
+    def _paint_mod_card(self, painter, card_rect, mod_info, row, text_color):
+        icon_rect = self._icon_rect(card_rect)
+        frame_path = QPainterPath(); frame_path.addRoundedRect(QRectF(icon_rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        painter.fillPath(frame_path, QColor(0, 0, 0, 13))
+        painter.setPen(QPen(QColor("#ddd"), 1)); painter.drawPath(frame_path)
+        pixmap = self._card_pixmap(row, mod_info)
+        if pixmap is not None and not pixmap.isNull():
+            size = pixmap.deviceIndependentSize()
+            painter.drawPixmap(QPointF(icon_rect.x() + (icon_rect.width() - size.width()) / 2, icon_rect.y() + (icon_rect.height() - size.height()) / 2), pixmap)
+        elif pixmap is not None:
+            painter.setPen(text_color)
+            painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, self.translator.translate("text_no_icon"))
+
+        name_rect = self._name_rect(card_rect)
+        display_name = mod_info.get("display_name") or mod_info.get("name", self.translator.translate("text_unknown_name"))
+        painter.setFont(self.name_font)
+        painter.setPen(text_color)
+        if len(display_name) > MARQUEE_MAX_CHARS and row == self.hovered_row and self.marquee_timer.isActive():
+            fm = QFontMetrics(self.name_font)
+            baseline = name_rect.y() + fm.ascent()
+            painter.save(); painter.setClipRect(name_rect)
+            painter.drawText(QPointF(name_rect.x() - self.marquee_offset, baseline), display_name)
+            if self.marquee_offset > 0: painter.drawText(QPointF(name_rect.x() - self.marquee_offset + fm.horizontalAdvance(display_name) + MARQUEE_PADDING, baseline), display_name)
+            painter.restore()
+        elif len(display_name) > MARQUEE_MAX_CHARS:
+            painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, display_name[:MARQUEE_MAX_CHARS] + "...")
+        else:
+            painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, display_name)
+
+        creator = mod_info.get("creator")
+        creator_text = self.translator.translate('text_creator_prefix', creator=creator) if creator else self.translator.translate('text_unknown_creator')
+        button_rects = self._button_rects(card_rect)
+        creator_rect = QRect(card_rect.x() + CARD_MARGIN, name_rect.bottom() + 6, card_rect.width() - 2 * CARD_MARGIN, button_rects["edit"].y() - name_rect.bottom() - 10)
+        painter.setFont(self.creator_font)
+        painter.drawText(creator_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap, creator_text)
+
+        highlight_color = self.view.palette().color(QPalette.ColorRole.Highlight)
+        for name, button_rect in button_rects.items():
+            enabled = self._button_enabled(mod_info, name)
+            if enabled and row == self.hovered_row and name == self.hovered_button:
+                hover_color = QColor(highlight_color); hover_color.setAlpha(80 if self.pressed == (row, name) else 40)
+                painter.setPen(Qt.PenStyle.NoPen); painter.setBrush(hover_color)
+                painter.drawEllipse(QRectF(button_rect))
+            icon_rect = QRect(0, 0, CARD_BUTTON_ICON_SIZE, CARD_BUTTON_ICON_SIZE); icon_rect.moveCenter(button_rect.center())
+            self.button_icons[name].paint(painter, icon_rect, Qt.AlignmentFlag.AlignCenter, QIcon.Mode.Normal if enabled else QIcon.Mode.Disabled)
+
+    def _card_key(self, row, mod_info):
+        model, dpr = self.view.model(), self.view.devicePixelRatioF()
+        cached = model.icon_keys[row]
+        if cached is not None and cached[0] == dpr: return cached[1]
+        icon_path = mod_info.get("icon")
+        thumbnail, _ = thumbnail_path(mod_info, "card", dpr)
+        key = get_icon_loader().make_key(thumbnail or icon_path, CARD_ICON_SIZE, dpr) if thumbnail or (icon_path and get_icon_index().exists(icon_path)) else None
+        model.icon_keys[row] = (dpr, key)
+        return key
+
+    def _card_pixmap(self, row, mod_info):
+        key = self._card_key(row, mod_info)
+        if key is None or key in self.failed_keys: return QPixmap()
+        key, pixmap, _ = get_icon_loader().request_key(key, self, PRIORITY_VISIBLE)
+        if pixmap is not None: return pixmap
+        self.pending_keys.add(key)
+        return None
+
+    def _on_icon_ready(self, key, pixmap, metadata):
+        if key in self.pending_keys:
+            self.pending_keys.discard(key)
+            self.view.viewport().update()
+
+    def _on_icon_failed(self, key):
+        if key in self.pending_keys:
+            self.pending_keys.discard(key)
+            self.failed_keys.add(key)
+            self.view.viewport().update()
+
+    def _update_row(self, row):
+        if row < 0: return
+        self.view.viewport().update(self.view.visualRect(self.view.model().index(row, 0)))
+
+    def _set_hover(self, row, button):
+        if (row, button) == (self.hovered_row, self.hovered_button): return
+        previous_row = self.hovered_row
+        self.hovered_row, self.hovered_button = row, button
+        if row != previous_row:
+            self.marquee_offset = 0
+            mod_info = self.view.model().mod_at(row) if row >= 0 else None
+            display_name = (mod_info.get("display_name") or mod_info.get("name", "")) if mod_info else ""
+            if len(display_name) > MARQUEE_MAX_CHARS: self.marquee_timer.start(MARQUEE_INTERVAL_MS)
+            else: self.marquee_timer.stop()
+            self._update_row(previous_row)
+        self._update_row(row)
+
+    def _scroll_marquee(self):
+        mod_info = self.view.model().mod_at(self.hovered_row)
+        if mod_info is None: self.marquee_timer.stop(); return
+        display_name = mod_info.get("display_name") or mod_info.get("name", "")
+        self.marquee_offset += 1
+        if self.marquee_offset > QFontMetrics(self.name_font).horizontalAdvance(display_name) + MARQUEE_PADDING: self.marquee_offset = 0
+        self._update_row(self.hovered_row)
+
+    def eventFilter(self, source, event):
+        if event.type() == QEvent.Type.MouseMove:
+            index = self.view.indexAt(event.position().toPoint())
+            if index.isValid() and self.view.visualRect(index).contains(event.position().toPoint()):
+                self._set_hover(index.row(), self._button_at(self.view.visualRect(index), event.position().toPoint(), self._mod(index)))
+            else:
+                self._set_hover(-1, None)
+        elif event.type() == QEvent.Type.Leave:
+            self._set_hover(-1, None)
+        return super().eventFilter(source, event)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick, QEvent.Type.MouseButtonRelease): return False
+        if event.button() != Qt.MouseButton.LeftButton: return False
+        mod_info = self._mod(index)
+        button = self._button_at(option.rect, event.position().toPoint(), mod_info)
+        if button and not self._button_enabled(mod_info, button): button = None
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            self.pressed = (index.row(), button)
+            self._update_row(index.row())
+            return True
+        pressed, self.pressed = self.pressed, None
+        self._update_row(index.row())
+        if pressed != (index.row(), button) or mod_info is None: return True
+        if button == "edit": self.edit_requested.emit(mod_info)
+        elif button == "url": self.url_requested.emit(mod_info.get("url", ""))
+        elif button == "update": self.update_requested.emit(mod_info)
+        elif button == "delete": self.delete_requested.emit(mod_info)
+        else: self.card_clicked.emit(index.row())
+        return True
+
+    def helpEvent(self, event, view, option, index):
+        mod_info = self._mod(index)
+        if event.type() == QEvent.Type.ToolTip and mod_info is not None:
+            button = self._button_at(option.rect, event.pos(), mod_info)
+            display_name = mod_info.get("display_name") or mod_info.get("name", "")
+            if button: QToolTip.showText(event.globalPos(), self.translator.translate(self.BUTTON_TOOLTIPS[button]), view)
+            elif len(display_name) > MARQUEE_MAX_CHARS: QToolTip.showText(event.globalPos(), display_name, view)
+            else: QToolTip.hideText()
+            return True
+        return super().helpEvent(event, view, option, index)
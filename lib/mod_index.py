@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from lib.paths import APP_DATA_PATH
+
+MOD_INDEX_PATH = os.path.join(APP_DATA_PATH, "mod_index.sqlite3")
+SORT_COLUMNS = {"_tsDateUpdated,DESC": "date_updated DESC", "_tsDateAdded,DESC": "date_added DESC", "_nLikeCount,DESC": "likes DESC"}
+MIN_TRIGRAM_LENGTH = 3
+
+class ModIndex:
+    def __init__(self, db_path=MOD_INDEX_PATH):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS mods (
+            mod_id INTEGER PRIMARY KEY, game_id INTEGER, category_id INTEGER, name TEXT, submitter TEXT,
+            date_updated INTEGER, date_added INTEGER, likes INTEGER, downloads INTEGER, views INTEGER,
+            is_nsfw INTEGER, data TEXT, seen_at REAL)""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS mods_game_category ON mods (game_id, category_id)")
+        try:
+            self._conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS mods_fts USING fts5(name, submitter, category, files, tokenize='trigram')")
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            print("SQLite sin FTS5 con trigramas; las búsquedas locales usarán LIKE.")
+            self.has_fts = False
+        self._conn.commit()
+
+    def _merge(self, mod_id, record):
+        row = self._conn.execute("SELECT data FROM mods WHERE mod_id = ?", (mod_id,)).fetchone()
+        if not row: return dict(record)
+        try: merged = json.loads(row[0])
+        except (TypeError, json.JSONDecodeError): merged = {}
+        merged.update({key: value for key, value in record.items() if value not in (None, "", [], {})})
+        return merged
+
+    def add_records(self, records, game_id=None):
+        now = time.time()
+        with self._lock:
+            for record in records:
+                if not isinstance(record, dict) or not str(record.get('_idRow', '')).isdigit(): continue
+                mod_id = int(record['_idRow'])
+                data = self._merge(mod_id, record)
+                category = data.get('_aCategory') or {}
+                submitter = (data.get('_aSubmitter') or {}).get('_sName', '')
+                files = " ".join(f.get('_sFile', '') for f in data.get('_aFiles') or [] if isinstance(f, dict))
+                existing_game = self._conn.execute("SELECT game_id FROM mods WHERE mod_id = ?", (mod_id,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (mod_id, game_id or (existing_game[0] if existing_game else None), category.get('_idRow'), data.get('_sName', ''), submitter,
+                     data.get('_tsDateUpdated') or 0, data.get('_tsDateAdded') or 0, data.get('_nLikeCount') or 0, data.get('_nDownloadCount') or 0,
+                     data.get('_nViewCount') or 0, int(bool(data.get('_bIsNsfw'))), json.dumps(data), now)
+                )
+                if self.has_fts:
+                    self._conn.execute("DELETE FROM mods_fts WHERE rowid = ?", (mod_id,))
+                    self._conn.execute("INSERT INTO mods_fts (rowid, name, submitter, category, files) VALUES (?, ?, ?, ?, ?)", (mod_id, data.get('_sName', ''), submitter, category.get('_sName', ''), files))
+            self._conn.commit()
+
+    def search(self, game_id, text, category_id=None, show_nsfw=False, sort_order=None, limit=20, offset=0):
+        text = text.strip()
+        if not text: return []
+        conditions, params = ["m.game_id = ?"], [game_id]
+        if category_id: conditions.append("m.category_id = ?"); params.append(int(category_id))
+        if not show_nsfw: conditions.append("m.is_nsfw = 0")
+        if self.has_fts and len(text) >= MIN_TRIGRAM_LENGTH:
+            source = "mods m JOIN mods_fts f ON f.rowid = m.mod_id"
+            conditions.append("mods_fts MATCH ?"); params.append('"' + text.replace('"', '""') + '"')
+        else:
+            source = "mods m"
+            pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            conditions.append("(m.name LIKE ? ESCAPE '\\' OR m.submitter LIKE ? ESCAPE '\\')"); params.extend([pattern, pattern])
+        order = SORT_COLUMNS.get(sort_order, "date_updated DESC")
+        sql = f"SELECT m.data FROM {source} WHERE {' AND '.join(conditions)} ORDER BY m.{order} LIMIT ? OFFSET ?"
+        with self._lock:
+            try: rows = self._conn.execute(sql, params + [limit, offset]).fetchall()
+            except sqlite3.Error as e: print(f"Error en la búsqueda local: {e}"); return []
+        return [json.loads(row[0]) for row in rows]
+
+    def find_id_by_name(self, game_id, name):
+        with self._lock:
+            row = self._conn.execute("SELECT mod_id FROM mods WHERE game_id = ? AND name = ? ORDER BY seen_at DESC LIMIT 1", (game_id, name)).fetchone()
+        return row[0] if row else None
+
+    def get(self, mod_id):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM mods WHERE mod_id = ?", (int(mod_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self):
+        with self._lock: self._conn.close()
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_mod_index():
+    global _index
+    with _index_lock:
+        if _index is None: _index = ModIndex()
+        return _index
@@ -2,12 +2,20 @@ import requests
 import os
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QComboBox, QPushButton, QMessageBox, QSpacerItem, QSizePolicy, QApplication)
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QPalette, QIcon, QPixmap, QPainter, QColor, QImage
+from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtGui import QPalette, QIcon
+from lib.api_cache import get_api_cache
+from lib.mod_index import get_mod_index
+from lib.icon_factory import get_icon_factory
+from lib.icon_metadata import get_icon_metadata
+from lib.icon_index import get_icon_index, GAME_ICON_EXTENSIONS
 
 class OneClickInstallDialog(QDialog):
+    category_resolved = pyqtSignal(object)
+
     def __init__(self, mod_id, file_id, main_window):
         super().__init__(main_window)
+        self.category_resolved.connect(self._on_category_resolved)
         self.mod_id = mod_id
         self.file_id = file_id
         self.main_window = main_window
@@ -17,7 +25,6 @@ class OneClickInstallDialog(QDialog):
         self.file_api_data = None
         self.selected_game_name = None
         self.selected_category_key = None
-        self.api_category_cache = {}
 
         self.setWindowTitle(self.translator.translate("one_click_title"))
         self.setMinimumWidth(500)
@@ -71,47 +78,17 @@ class OneClickInstallDialog(QDialog):
         
         QTimer.singleShot(100, self.fetch_mod_data)
 
-    def _is_strictly_dark_grayscale(self, image: QImage):
-        if image.isNull(): return False
-
-        DARKNESS_THRESHOLD = 120
-        COLOR_TOLERANCE = 15
-
-        scaled_image = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio)
-        
-        has_visible_pixels = False
-        for y in range(scaled_image.height()):
-            for x in range(scaled_image.width()):
-                color = QColor(scaled_image.pixel(x, y))
-                if color.alpha() < 50: continue
-                has_visible_pixels = True
-
-                r, g, b = color.red(), color.green(), color.blue()
-                if r > DARKNESS_THRESHOLD or g > DARKNESS_THRESHOLD or b > DARKNESS_THRESHOLD: return False
-                if (max(r, g, b) - min(r, g, b)) > COLOR_TOLERANCE: return False
-        
-        return has_visible_pixels
-
     def _create_processed_icon(self, icon_path):
 
-        if not icon_path or not os.path.exists(icon_path):
+        if not get_icon_index().exists(icon_path):
             return QIcon()
 
-        original_pixmap = QPixmap(icon_path)
+        original_pixmap = get_icon_factory().pixmap(icon_path)
         if original_pixmap.isNull():
             return QIcon()
 
-        if self._is_strictly_dark_grayscale(original_pixmap.toImage()):
-            target_color = self.palette().color(QPalette.ColorRole.Text)
-            
-            recolored_pixmap = QPixmap(original_pixmap.size())
-            recolored_pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(recolored_pixmap)
-            painter.drawPixmap(0, 0, original_pixmap)
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-            painter.fillRect(recolored_pixmap.rect(), target_color)
-            painter.end()
-            return QIcon(recolored_pixmap)
+        if get_icon_metadata().is_dark_grayscale(icon_path):
+            return QIcon(get_icon_factory().tinted(original_pixmap, self.palette().color(QPalette.ColorRole.Text)))
         
         return QIcon(original_pixmap)
 
@@ -124,12 +101,15 @@ class OneClickInstallDialog(QDialog):
     def fetch_mod_data(self):
         url = f"https://gamebanana.com/apiv11/Mod/{self.mod_id}?_csvProperties=@gbprofile"
         try:
-            response = requests.get(url, timeout=15, headers={'User-Agent': 'MIMM/1.0'})
-            response.raise_for_status()
-            self.mod_api_data = response.json()
-            
+            self.mod_api_data = dict(get_api_cache().get_json(url, timeout=15))
             files_list = self.mod_api_data.get('_aFiles', [])
             self.file_api_data = next((f for f in files_list if str(f.get('_idRow')) == self.file_id), None)
+            if not self.file_api_data:
+                self.mod_api_data = dict(get_api_cache().get_json(url, force_refresh=True, timeout=15))
+                files_list = self.mod_api_data.get('_aFiles', [])
+                self.file_api_data = next((f for f in files_list if str(f.get('_idRow')) == self.file_id), None)
+            self.mod_api_data.setdefault('_idRow', int(self.mod_id))
+            get_mod_index().add_records([self.mod_api_data], (self.mod_api_data.get('_aGame') or {}).get('_idRow'))
             
             if not self.file_api_data:
                 self.show_error("one_click_err_file_not_found")
@@ -142,26 +122,12 @@ class OneClickInstallDialog(QDialog):
         except Exception as e:
             self.show_error("one_click_err_unexpected", e=e)
             
-    def _find_mod_category(self, game_name, profile_name_to_find):
-        game_categories = self.main_window.game_data[game_name]["categories"]
-        for key, data in game_categories.items():
-            if data.get("type") == "direct_management": continue
-            category_api_id = data.get("id") or data.get("api_id")
-            if not category_api_id: continue
-
-            if category_api_id in self.api_category_cache:
-                profiles_in_category = self.api_category_cache[category_api_id]
-            else:
-                api_profiles = self.main_window.fetch_gamebanana_data(category_api_id)
-                if not api_profiles:
-                    self.api_category_cache[category_api_id] = set()
-                    continue
-                profiles_in_category = {p['name'] for p in api_profiles}
-                self.api_category_cache[category_api_id] = profiles_in_category
-            
-            if profile_name_to_find in profiles_in_category:
-                return key
-        return None
+    def _find_mod_category(self, game_name, profile_name_to_find, subcategory_id=None):
+        try:
+            self.main_window.category_index.find_category(game_name, profile_name_to_find, subcategory_id, self.category_resolved.emit)
+        except Exception as e:
+            print(f"No se pudo resolver la categoría de '{profile_name_to_find}': {e}")
+            self.category_resolved.emit(None)
 
     def _populate_and_verify_ui(self):
         if not self.mod_api_data: return
@@ -176,7 +142,7 @@ class OneClickInstallDialog(QDialog):
         self.game_combo.clear()
         game_icons_path = os.path.join(self.main_window.user_icons_path, "Games")
         for name, data in self.main_window.game_data.items():
-            icon_path = next((os.path.join(game_icons_path, f"{data['short_name']}{ext}") for ext in ['.png', '.jpg', '.jpeg'] if os.path.exists(os.path.join(game_icons_path, f"{data['short_name']}{ext}"))), None)
+            icon_path = get_icon_index().find(game_icons_path, data['short_name'], GAME_ICON_EXTENSIONS)
             icon = self._create_processed_icon(icon_path)
             self.game_combo.addItem(icon, name)
 
@@ -191,9 +157,13 @@ class OneClickInstallDialog(QDialog):
         self._on_game_changed(game_index)
 
         self.info_label.setText(self.translator.translate("one_click_verifying_category"))
-        QApplication.processEvents()
+        self._find_mod_category(api_game_name, api_profile_name, self.mod_api_data.get('_aCategory', {}).get('_idRow'))
 
-        category_key_to_select = self._find_mod_category(api_game_name, api_profile_name)
+    def _on_category_resolved(self, category_key_to_select):
+        if not self.mod_api_data or not self.isVisible(): return
+        mod_name = self.mod_api_data.get('_sName', 'N/A')
+        api_game_name = self.mod_api_data.get('_aGame', {}).get('_sName')
+        api_profile_name = self.mod_api_data.get('_aCategory', {}).get('_sName')
         is_managed_type = True
 
         if not category_key_to_select:
@@ -295,11 +265,7 @@ class OneClickInstallDialog(QDialog):
             cached_icon_path = None
             game_short_name = self.main_window.game_data[self.selected_game_name]['short_name']
             game_icon_folder = os.path.join(self.main_window.user_icons_path, game_short_name)
-            local_icon_path = next((
-                os.path.join(game_icon_folder, f"{profile_name}{ext}") 
-                for ext in ['.png', '.jpg', '.jpeg', '.webp'] 
-                if os.path.exists(os.path.join(game_icon_folder, f"{profile_name}{ext}"))
-            ), None)
+            local_icon_path = get_icon_index().find(game_icon_folder, profile_name)
 
             if local_icon_path:
                 cached_icon_path = self.main_window._copy_icon_to_cache(local_icon_path, profile_name)
@@ -11,12 +11,19 @@ from ctypes import wintypes
 import base64
 from inputs import get_gamepad, UnpluggedError
 from PyQt6.QtWidgets import QApplication, QWidget, QMessageBox
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QPointF, QRectF, QRect
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QPointF, QRectF, QRect, QSize
 from PyQt6.QtGui import QPainter, QPixmap, QColor, QPen, QBrush, QPainterPath, QFont, QFontMetrics, QLinearGradient, QImage
 from lib.icons_base64 import ICONS
+from lib.icon_factory import get_icon_factory
+from lib.icon_metadata import get_icon_metadata
+from lib.icon_index import get_icon_index
+from lib.icon_thumbnails import thumbnail_path
 
 ACTIVATION_HOTKEY = "s"
 PROFILES_PER_PAGE = 10
+PROFILE_ICON_SIZE, SELECTED_PROFILE_ICON_SIZE = 110, 140
+MOD_CARD_WIDTH, MOD_CARD_HEIGHT = 220, 180
+MOD_ICON_SIZE = QSize(MOD_CARD_WIDTH - 20, int(MOD_CARD_HEIGHT * 0.6))
 APP_DATA_PATH = os.path.join(os.getenv('APPDATA'), "MIMM")
 CONFIG_PATH = os.path.join(APP_DATA_PATH, "config.json")
 PROFILES_PATH = os.path.join(APP_DATA_PATH, "mod_manager_profiles.json")
@@ -382,6 +389,70 @@ class WelcomeMessageWidget(QWidget):
         QApplication.restoreOverrideCursor()
         super().closeEvent(event)
 
+class OverlayIconAtlas:
+    def __init__(self, default_icon_path, device_pixel_ratio=1.0):
+        self.default_icon_path = default_icon_path
+        self.device_pixel_ratio = device_pixel_ratio
+        self.profile_pixmaps = {}
+        self.mod_pixmaps = {}
+
+    def prepare(self, categorized_profiles):
+        profiles = [profile for category_profiles in categorized_profiles.values() for profile in category_profiles]
+        mods = [mod for profile in profiles for mod in profile.get('mods', []) if isinstance(mod, dict) and mod.get('icon')]
+        profile_paths = {self._profile_source(profile.get('icon')) for profile in profiles}
+        mod_paths = {mod['icon'] for mod in mods}
+        self.profile_pixmaps = {key: pixmap for key, pixmap in self.profile_pixmaps.items() if key[0] in profile_paths}
+        self.mod_pixmaps = {key: pixmap for key, pixmap in self.mod_pixmaps.items() if key in mod_paths}
+        for profile in profiles:
+            for size in (PROFILE_ICON_SIZE, SELECTED_PROFILE_ICON_SIZE): self.profile(profile, size)
+        for mod in mods: self.mod(mod)
+
+    def _profile_source(self, icon_path):
+        return icon_path if get_icon_index().exists(icon_path) else self.default_icon_path
+
+    def _load(self, record, thumbnail_name, path, width, height, aspect_mode):
+        thumbnail, _ = thumbnail_path(record, thumbnail_name, self.device_pixel_ratio) if record.get('icon') == path else (None, 1)
+        image = QImage(thumbnail or path)
+        if image.isNull(): return None
+        target_width, target_height = int(width * self.device_pixel_ratio), int(height * self.device_pixel_ratio)
+        if aspect_mode == Qt.AspectRatioMode.KeepAspectRatio: fits = image.width() <= target_width and image.height() <= target_height and (image.width() == target_width or image.height() == target_height)
+        else: fits = image.width() == target_width and image.height() == target_height
+        if not fits:
+            image = image.scaled(target_width, target_height, aspect_mode, Qt.TransformationMode.SmoothTransformation)
+        return QPixmap.fromImage(image)
+
+    def profile(self, profile, size):
+        path = self._profile_source(profile.get('icon'))
+        key = (path, size)
+        if key not in self.profile_pixmaps:
+            self.profile_pixmaps[key] = self._build_profile(profile, path, size)
+        return self.profile_pixmaps[key]
+
+    def _build_profile(self, profile, path, size):
+        source = self._load(profile, "overlay_profile", path, size, size, Qt.AspectRatioMode.IgnoreAspectRatio) if path else None
+        if source is None: return None
+        if get_icon_metadata().is_dark_grayscale(path): source = get_icon_factory().tinted(source, QColor("#FFFFFF"))
+        side = int(size * self.device_pixel_ratio)
+        pixmap = QPixmap(side, side)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
+        clip = QPainterPath(); clip.addEllipse(QRectF(pixmap.rect()))
+        painter.setClipPath(clip)
+        painter.drawPixmap(pixmap.rect(), source)
+        painter.end()
+        pixmap.setDevicePixelRatio(self.device_pixel_ratio)
+        return pixmap
+
+    def mod(self, mod_info):
+        icon_path = mod_info.get('icon')
+        if not icon_path: return None
+        if icon_path not in self.mod_pixmaps:
+            pixmap = self._load(mod_info, "overlay", icon_path, MOD_ICON_SIZE.width(), MOD_ICON_SIZE.height(), Qt.AspectRatioMode.KeepAspectRatio) if get_icon_index().exists(icon_path) else None
+            if pixmap is not None: pixmap.setDevicePixelRatio(self.device_pixel_ratio)
+            self.mod_pixmaps[icon_path] = pixmap
+        return self.mod_pixmaps[icon_path]
+
 class OverlayWindow(QWidget):
     kbm_activity_detected = pyqtSignal()
     
@@ -415,6 +486,8 @@ class OverlayWindow(QWidget):
         self.profile_rects = []
         self.nav_arrow_rects = {}
         self.setup_ui()
+        self.icon_atlas = OverlayIconAtlas(self.default_icon_path, QApplication.primaryScreen().devicePixelRatio())
+        self.icon_atlas.prepare(self.categorized_profiles)
         self._load_icons()
         self._update_display_data()
 
@@ -674,55 +747,21 @@ class OverlayWindow(QWidget):
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, category_text)
             x += rect.width() + category_spacing
 
-    def _is_strictly_dark_grayscale(self, image: QImage):
-        if image.isNull():
-            return False
-        DARKNESS_THRESHOLD = 120
-        COLOR_TOLERANCE = 15
-        scaled_image = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio)
-        has_visible_pixels = False
-        for y in range(scaled_image.height()):
-            for x in range(scaled_image.width()):
-                color = QColor(scaled_image.pixel(x, y))
-                if color.alpha() < 50: continue
-                has_visible_pixels = True
-                r, g, b = color.red(), color.green(), color.blue()
-                if r > DARKNESS_THRESHOLD or g > DARKNESS_THRESHOLD or b > DARKNESS_THRESHOLD:
-                    return False 
-                min_c, max_c = min(r, g, b), max(r, g, b)
-                if (max_c - min_c) > COLOR_TOLERANCE:
-                    return False 
-        return has_visible_pixels
-
-    def _create_white_version(self, source_pixmap: QPixmap):
-        if source_pixmap.isNull():
-            return QPixmap()
-        recolored_pixmap = QPixmap(source_pixmap.size())
-        recolored_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(recolored_pixmap)
-        painter.drawPixmap(0, 0, source_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        painter.fillRect(recolored_pixmap.rect(), QColor("#FFFFFF"))
-        painter.end()
-        return recolored_pixmap
-
     def draw_profile_circle(self, painter: QPainter):
         painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
         self.profile_rects.clear()
         content_rect = QRectF(0, self.height() * 0.2, self.width(), self.height() * 0.8)
         center, radius = content_rect.center(), min(content_rect.width(), content_rect.height()) * 0.30
-        icon_size, selected_icon_size, angle_step = 110, 140, 360.0 / PROFILES_PER_PAGE
+        angle_step = 360.0 / PROFILES_PER_PAGE
         highlight_color = self.controller.manager.palette().color(self.controller.manager.palette().ColorRole.Highlight)
         
         for i, profile in enumerate(self.profiles_on_page):
             is_selected = (i == self.selected_profile_index)
-            size = selected_icon_size if is_selected else icon_size
+            size = SELECTED_PROFILE_ICON_SIZE if is_selected else PROFILE_ICON_SIZE
             angle_rad = math.radians(self.rotation_angle + i * angle_step - 90)
             px, py = center.x() + radius * math.cos(angle_rad) - size / 2, center.y() + radius * math.sin(angle_rad) - size
             rect = QRectF(px, py, size, size)
             self.profile_rects.append(rect)
-            path = QPainterPath()
-            path.addEllipse(rect)
 
             if profile.get('type') == 'empty':
                 painter.setPen(QColor(80, 80, 80, 150))
@@ -730,19 +769,9 @@ class OverlayWindow(QWidget):
                 painter.drawEllipse(rect)
                 continue
 
-            icon_path = profile.get('icon')
-            if not icon_path or not os.path.exists(icon_path):
-                icon_path = self.default_icon_path
-            
-            pixmap = QPixmap(icon_path)
-            
-            if not pixmap.isNull() and self._is_strictly_dark_grayscale(pixmap.toImage()):
-                pixmap = self._create_white_version(pixmap)
-
-            if not pixmap.isNull():
-                painter.setClipPath(path)
-                painter.drawPixmap(rect.toRect(), pixmap)
-                painter.setClipping(False)
+            pixmap = self.icon_atlas.profile(profile, size)
+            if pixmap is not None:
+                painter.drawPixmap(rect.topLeft(), pixmap)
             else:
                 painter.setBrush(QColor("#333"))
                 painter.setPen(Qt.PenStyle.NoPen)
@@ -779,7 +808,7 @@ class OverlayWindow(QWidget):
     def draw_mods_view(self, painter):
         font = QFont("Segoe UI", 22, QFont.Weight.Bold); painter.setFont(font); painter.setPen(Qt.GlobalColor.white)
         painter.drawText(self.rect().adjusted(0, 20, 0, 0), Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, self.selected_profile_data.get('original_name'))
-        cols, w, h, p, top_m = 4, 220, 180, 40, 150
+        cols, w, h, p, top_m = 4, MOD_CARD_WIDTH, MOD_CARD_HEIGHT, 40, 150
         grid_w = (w * cols) + (p * (cols - 1)); start_x = (self.width() - grid_w) // 2
         for i, mod in enumerate(self.selected_profile_mods):
             if mod.get('type') != 'empty':
@@ -800,6 +829,7 @@ class OverlayWindow(QWidget):
 
     def update_data_and_refresh_view(self, new_categorized_profiles):
         self.categorized_profiles = new_categorized_profiles
+        self.icon_atlas.prepare(self.categorized_profiles)
         category_name = self.categories[self.current_category_index]
         profiles_in_cat = self.categorized_profiles.get(category_name, [])
         self.total_pages = math.ceil(len(profiles_in_cat) / PROFILES_PER_PAGE) if profiles_in_cat else 1
@@ -862,11 +892,11 @@ class OverlayWindow(QWidget):
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawPath(path)
         icon_rect = QRectF(rect.x() + 10, rect.y() + 10, rect.width() - 20, rect.height() * 0.6)
-        icon_path = mod_info.get("icon")
-        if icon_path and os.path.exists(icon_path):
-            pixmap, target_rect = QPixmap(icon_path), icon_rect.toRect()
-            scaled_pixmap = pixmap.scaled(target_rect.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            draw_x, draw_y = target_rect.x() + (target_rect.width() - scaled_pixmap.width()) / 2, target_rect.y() + (target_rect.height() - scaled_pixmap.height()) / 2
+        scaled_pixmap = self.icon_atlas.mod(mod_info)
+        if scaled_pixmap is not None:
+            target_rect = icon_rect.toRect()
+            logical_size = scaled_pixmap.deviceIndependentSize()
+            draw_x, draw_y = target_rect.x() + (target_rect.width() - logical_size.width()) / 2, target_rect.y() + (target_rect.height() - logical_size.height()) / 2
             painter.drawPixmap(int(draw_x), int(draw_y), scaled_pixmap)
         else:
             font = QFont("Segoe UI", 12); painter.setFont(font); painter.setPen(Qt.GlobalColor.gray)
@@ -986,7 +1016,7 @@ class OverlayWindow(QWidget):
         self.selected_profile_mods.extend([{'type': 'empty'}] * (self.mods_per_page - len(self.selected_profile_mods)))
 
     def handle_mod_click(self, click_pos):
-        cols, w, h, p, top_m = 4, 220, 180, 40, 150; grid_w = (w * cols) + (p * (cols - 1)); start_x = (self.width() - grid_w) // 2
+        cols, w, h, p, top_m = 4, MOD_CARD_WIDTH, MOD_CARD_HEIGHT, 40, 150; grid_w = (w * cols) + (p * (cols - 1)); start_x = (self.width() - grid_w) // 2
         for i, mod in enumerate(self.selected_profile_mods):
             row, col = i // cols, i % cols; rect = QRectF(start_x + col * (w + p), top_m + row * (h + p), w, h)
             if rect.contains(QPointF(click_pos)):
@@ -0,0 +1,3 @@
+import os
+
+APP_DATA_PATH = os.path.join(os.getenv('APPDATA'), "MIMM")
@@ -0,0 +1,160 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect, QRectF
+from PyQt6.QtGui import QPainter, QPainterPath, QColor, QPalette, QPixmap
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from lib.icon_factory import get_icon_factory
+from lib.icon_index import get_icon_index
+from lib.icon_loader import get_icon_loader, PRIORITY_VISIBLE
+
+PROFILE_ITEM_SIZE = QSize(92, 120)
+PROFILE_ICON_SIZE = 80
+PROFILE_ITEM_MARGIN, PROFILE_ITEM_SPACING = 5, 4
+
+def format_profile_name(name):
+    words = name.split()
+    if len(words) <= 1: return name
+    split_index = (len(words) + 1) // 2
+    return f"{' '.join(words[:split_index])}\n{' '.join(words[split_index:])}"
+
+class ProfileListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.profiles = {}
+        self.names = []
+        self.icons = {}
+        self.icon_keys = {}
+        self.selected_name = None
+        self.dataChanged.connect(self._invalidate_icon_keys)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.names): return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole): return self.names[index.row()]
+        return None
+
+    def profile_at(self, row):
+        return self.profiles.get(self.names[row]) if 0 <= row < len(self.names) else None
+
+    def row_of(self, name):
+        try: return self.names.index(name)
+        except ValueError: return -1
+
+    def _icon_of(self, name):
+        profile = self.profiles.get(name)
+        return profile.get('icon') if isinstance(profile, dict) else None
+
+    def _invalidate_icon_keys(self, top_left, bottom_right, roles=()):
+        for name in self.names[top_left.row():bottom_right.row() + 1]: self.icon_keys.pop(name, None)
+
+    def sync(self, category_profiles):
+        names = sorted(category_profiles)
+        if category_profiles is not self.profiles:
+            self.beginResetModel()
+            self.profiles, self.names = category_profiles, names
+            self.icons = {name: self._icon_of(name) for name in names}
+            self.icon_keys = {}
+            self.endResetModel()
+            return True
+        wanted = set(names)
+        for row in range(len(self.names) - 1, -1, -1):
+            if self.names[row] in wanted: continue
+            self.beginRemoveRows(QModelIndex(), row, row)
+            name = self.names.pop(row)
+            self.icons.pop(name, None); self.icon_keys.pop(name, None)
+            self.endRemoveRows()
+        for row, name in enumerate(names):
+            if row < len(self.names) and self.names[row] == name: continue
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.names.insert(row, name); self.icons[name] = self._icon_of(name)
+            self.endInsertRows()
+        for row, name in enumerate(self.names):
+            icon = self._icon_of(name)
+            if self.icons.get(name) == icon: continue
+            self.icons[name] = icon
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        return False
+
+class ProfileItemDelegate(QStyledItemDelegate):
+    def __init__(self, view, default_icon_path):
+        super().__init__(view)
+        self.view = view
+        self.default_icon_path = default_icon_path
+        self.pending_keys, self.failed_keys = set(), set()
+        get_icon_loader().icon_ready.connect(self._on_icon_ready)
+        get_icon_loader().icon_failed.connect(self._on_icon_failed)
+
+    def sizeHint(self, option, index):
+        return PROFILE_ITEM_SIZE
+
+    def _icon_path(self, index):
+        profile = index.model().profile_at(index.row()) or {}
+        icon_path = profile.get('icon') or self.default_icon_path
+        return icon_path if get_icon_index().exists(icon_path) else self.default_icon_path
+
+    def _text_on_highlight(self, palette):
+        highlight_color = palette.color(QPalette.ColorRole.Highlight)
+        luminance = 0.2126 * highlight_color.redF() + 0.7152 * highlight_color.greenF() + 0.0722 * highlight_color.blueF()
+        return QColor("#000000") if luminance > 0.5 else QColor("#FFFFFF")
+
+    def paint(self, painter, option, index):
+        name = index.data(Qt.ItemDataRole.UserRole)
+        if not name: return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        palette = self.view.palette()
+        rect = option.rect
+        is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        is_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        if is_selected or is_hovered:
+            fill_color = QColor(palette.color(QPalette.ColorRole.Highlight))
+            if not is_selected: fill_color.setAlpha(40)
+            path = QPainterPath(); path.addRoundedRect(QRectF(rect), 4, 4)
+            painter.fillPath(path, fill_color)
+
+        text_color = self._text_on_highlight(palette) if is_selected else palette.color(QPalette.ColorRole.Text)
+        icon_frame = QRect(rect.x() + (rect.width() - PROFILE_ICON_SIZE) // 2, rect.y() + PROFILE_ITEM_MARGIN, PROFILE_ICON_SIZE, PROFILE_ICON_SIZE)
+        name_rect = QRect(rect.x() + PROFILE_ITEM_MARGIN, icon_frame.bottom() + 1 + PROFILE_ITEM_SPACING, rect.width() - 2 * PROFILE_ITEM_MARGIN, rect.bottom() - icon_frame.bottom() - PROFILE_ITEM_SPACING - PROFILE_ITEM_MARGIN)
+        formatted_name = format_profile_name(name)
+        icon_size = PROFILE_ICON_SIZE
+        if is_selected or is_hovered:
+            fm = painter.fontMetrics()
+            text_height = fm.boundingRect(name_rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, formatted_name).height()
+            if text_height > fm.height() * 2.2: icon_size = int(PROFILE_ICON_SIZE * 0.75)
+
+        pixmap, metadata = self._icon(index, name, icon_size)
+        if pixmap is not None and not pixmap.isNull():
+            if metadata and metadata.get("dark_grayscale"): pixmap = get_icon_factory().tinted(pixmap, text_color)
+            size = pixmap.deviceIndependentSize()
+            painter.drawPixmap(QRectF(icon_frame.x() + (icon_frame.width() - size.width()) / 2, icon_frame.y(), size.width(), size.height()), pixmap, QRectF(pixmap.rect()))
+
+        if is_selected or is_hovered:
+            painter.setPen(text_color)
+            painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, formatted_name)
+        painter.restore()
+
+    def _icon_key(self, index, name, size):
+        dpr = self.view.devicePixelRatioF()
+        keys = index.model().icon_keys.setdefault(name, {})
+        key = keys.get((size, dpr))
+        if key is None: key = keys[(size, dpr)] = get_icon_loader().make_key(self._icon_path(index), size, dpr)
+        return key
+
+    def _icon(self, index, name, size):
+        key = self._icon_key(index, name, size)
+        if key in self.failed_keys: return QPixmap(), None
+        key, pixmap, metadata = get_icon_loader().request_key(key, self, PRIORITY_VISIBLE)
+        if pixmap is None: self.pending_keys.add(key)
+        return pixmap, metadata
+
+    def _on_icon_ready(self, key, pixmap, metadata):
+        if key in self.pending_keys:
+            self.pending_keys.discard(key)
+            self.view.viewport().update()
+
+    def _on_icon_failed(self, key):
+        if key in self.pending_keys:
+            self.pending_keys.discard(key)
+            self.failed_keys.add(key)
@@ -61,9 +61,13 @@ class SettingsTab(QWidget):
         self.start_minimized_checkbox = QCheckBox()
         self.start_minimized_checkbox.setChecked(self.manager.config.get("start_minimized", False))
         self.start_minimized_checkbox.stateChanged.connect(self.on_start_minimized_changed)
+        self.prestage_updates_checkbox = QCheckBox()
+        self.prestage_updates_checkbox.setChecked(self.manager.config.get("prestage_updates", False))
+        self.prestage_updates_checkbox.stateChanged.connect(self.on_prestage_updates_changed)
         general_layout.addWidget(self.general_group_label)
         general_layout.addLayout(controls_layout)
         general_layout.addWidget(self.start_minimized_checkbox)
+        general_layout.addWidget(self.prestage_updates_checkbox)
         main_layout.addWidget(general_frame)
         main_layout.addStretch()
         self.retranslate_ui()
@@ -79,6 +83,9 @@ class SettingsTab(QWidget):
     def on_start_minimized_changed(self, state):
         is_checked = (state == Qt.CheckState.Checked.value); self.manager.config['start_minimized'] = is_checked; self.manager.save_config()
         
+    def on_prestage_updates_changed(self, state):
+        is_checked = (state == Qt.CheckState.Checked.value); self.manager.config['prestage_updates'] = is_checked; self.manager.save_config(); self.manager.update_stager.apply_config()
+        
     def run_version_fix(self):
         confirm_reply = QMessageBox.question(
             self,
@@ -138,6 +145,10 @@ class SettingsTab(QWidget):
                             mod_info.setdefault('url', None)
                             mod_info.setdefault('icon', None)
                             mod_info.setdefault('profile_url', None)
+                            if not mod_info.get('mod_id'):
+                                mod_info['mod_id'] = self.manager._extract_gamebanana_mod_id(mod_info.get('profile_url') or mod_info.get('url'))
+                            mod_info.setdefault('file_id', None)
+                            mod_info.setdefault('file_date', None)
     
             self.manager.profiles = all_profiles
             self.manager.save_profiles()
@@ -167,6 +178,7 @@ class SettingsTab(QWidget):
         self.general_group_label.setText(self.translator.translate("settings_general_group_title"))
         self.language_label.setText(self.translator.translate("language_label"))
         self.start_minimized_checkbox.setText(self.translator.translate("start_minimized_label"))
+        self.prestage_updates_checkbox.setText(self.translator.translate("prestage_updates_label"))
         self.fix_version_button.setText(self.translator.translate("fix_version_button"))
         self.maintenance_label.setText(self.translator.translate("maintenance_label"))
 
@@ -0,0 +1,101 @@
+import io
+import os
+import hashlib
+import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QPixmap
+from lib.http_client import get_http_client, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from lib.icon_loader import get_icon_loader, REMOTE_VERSION, PRIORITY_PREFETCH, PRIORITY_NORMAL
+
+PREVIEW_VARIANTS = [("_sFile100", 100), ("_sFile220", 220), ("_sFile530", 530), ("_sFile670", 670)]
+
+def get_preview_url(mod_data, min_width=0, min_height=0):
+    previews = mod_data.get('_aPreviewMedia', [])
+    if isinstance(previews, dict): previews = previews.get('_aImages', [])
+    if not (isinstance(previews, list) and previews): return None
+    img_info = previews[0]
+    if not isinstance(img_info, dict) or not img_info.get('_sBaseUrl'): return ""
+    available = [(key, img_info.get('_w' + key[2:]) or width, img_info.get('_h' + key[2:])) for key, width in PREVIEW_VARIANTS if img_info.get(key)]
+    for key, width, height in available:
+        if width >= min_width and (not height or height >= min_height): return img_info['_sBaseUrl'] + '/' + img_info[key]
+    if img_info.get('_sFile'): return img_info['_sBaseUrl'] + '/' + img_info['_sFile']
+    if available: return img_info['_sBaseUrl'] + '/' + img_info[available[-1][0]]
+    return ""
+
+class ThumbnailCache(QObject):
+    thumbnail_ready = pyqtSignal(object, QPixmap)
+    thumbnail_failed = pyqtSignal(object)
+
+    def __init__(self, app_data_path, parent=None, max_disk_mb=200):
+        super().__init__(parent)
+        self.disk_path = os.path.join(app_data_path, "thumbnail_cache")
+        os.makedirs(self.disk_path, exist_ok=True)
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self._writes_since_trim = 0
+        self._disk_lock = threading.Lock()
+        loader = get_icon_loader()
+        loader.icon_ready.connect(self._on_icon_ready)
+        loader.icon_failed.connect(self._on_icon_failed)
+        threading.Thread(target=self._trim_disk, daemon=True).start()
+
+    def make_key(self, url, size, dpr=1.0):
+        return get_icon_loader().make_remote_key(url, size, dpr)
+
+    def _disk_file(self, url):
+        ext = os.path.splitext(url.split('?')[0])[1] or ".jpg"
+        return os.path.join(self.disk_path, hashlib.sha1(url.encode('utf-8')).hexdigest() + ext)
+
+    def _read_or_download(self, url, is_cancelled=None, priority=PRIORITY_INTERACTIVE):
+        path = self._disk_file(url)
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f: data = f.read()
+                os.utime(path, None)
+                get_http_client().record_cache_hit(url)
+                return data
+            except OSError: pass
+        buffer = io.BytesIO()
+        get_http_client().download(url, buffer, on_chunk=lambda *_: not (is_cancelled and is_cancelled()), chunk_size=16384, timeout=15, priority=priority)
+        if is_cancelled and is_cancelled(): return None
+        data = buffer.getvalue()
+        try:
+            with open(path + ".tmp", 'wb') as f: f.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"No se pudo guardar la miniatura en disco: {e}")
+        with self._disk_lock:
+            self._writes_since_trim += 1
+            should_trim = self._writes_since_trim >= 50
+            if should_trim: self._writes_since_trim = 0
+        if should_trim: self._trim_disk()
+        return data
+
+    def _trim_disk(self):
+        with self._disk_lock:
+            try:
+                entries = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in os.scandir(self.disk_path) if e.is_file()]
+            except OSError: return
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_disk_bytes: break
+                try: os.remove(path); total -= size
+                except OSError: pass
+
+    def _fetch(self, url, is_cancelled, priority):
+        return self._read_or_download(url, is_cancelled, PRIORITY_BACKGROUND if priority == PRIORITY_PREFETCH else PRIORITY_INTERACTIVE)
+
+    def request(self, url, size, dpr=1.0, owner=None, priority=PRIORITY_NORMAL):
+        key, pixmap, _ = get_icon_loader().request_key(self.make_key(url, size, dpr), owner, priority, lambda is_cancelled, task_priority: self._fetch(url, is_cancelled, task_priority))
+        return key, pixmap
+
+    def prefetch(self, url, size, dpr=1.0, owner=None):
+        return self.request(url, size, dpr, owner, PRIORITY_PREFETCH)
+
+    def release(self, owner):
+        get_icon_loader().release(owner)
+
+    def _on_icon_ready(self, key, pixmap, metadata):
+        if key[1] == REMOTE_VERSION: self.thumbnail_ready.emit(key, pixmap)
+
+    def _on_icon_failed(self, key):
+        if key[1] == REMOTE_VERSION: self.thumbnail_failed.emit(key)
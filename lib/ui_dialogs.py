@@ -1,188 +1,14 @@
 import os
 from PyQt6.QtWidgets import (
-    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QListWidget, QPushButton, QFileDialog, QFrame, QListWidgetItem
 )
-from PyQt6.QtCore import Qt, QSize, QRectF
-from PyQt6.QtGui import QPixmap, QIcon, QPainter, QPainterPath, QBrush, QColor, QPalette, QImage
-
-class ProfileItemWidget(QWidget):
-    def __init__(self, icon_path, name, icon_size=80, parent=None):
-        super().__init__(parent)
-        self.is_selected = False
-        self.is_hovered = False
-        self.original_icon_size = icon_size
-        self.name = name
-
-        original_pixmap = QPixmap(icon_path)
-        self.original_scaled_pixmap = original_pixmap.scaled(
-            icon_size, icon_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-
-        is_recolorable = self._is_strictly_dark_grayscale(original_pixmap.toImage())
-
-        if is_recolorable:
-            default_text_color = self.palette().color(QPalette.ColorRole.Text)
-            highlight_bg_color = self.palette().color(QPalette.ColorRole.Highlight)
-            luminance = 0.2126 * highlight_bg_color.redF() + 0.7152 * highlight_bg_color.greenF() + 0.0722 * highlight_bg_color.blueF()
-            highlight_text_color = QColor("#000000") if luminance > 0.5 else QColor("#FFFFFF")
-
-            self.default_pixmap = self._create_colored_version(self.original_scaled_pixmap, default_text_color)
-            self.highlight_pixmap = self._create_colored_version(self.original_scaled_pixmap, highlight_text_color)
-        else:
-            self.default_pixmap = self.original_scaled_pixmap
-            self.highlight_pixmap = self.original_scaled_pixmap
-
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(5, 5, 5, 5)
-        self.layout.setSpacing(4)
-        self.layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        self.icon_label = QLabel()
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
-        self.icon_label.setFixedSize(icon_size, icon_size)
-        self.icon_label.setPixmap(self.default_pixmap)
-
-        words = name.split()
-        num_words = len(words)
-        formatted_name = name
-
-        if num_words > 1:
-            split_index = (num_words + 1) // 2
-            first_line = " ".join(words[:split_index])
-            second_line = " ".join(words[split_index:])
-            formatted_name = f"{first_line}\n{second_line}"
-
-        self.name_label = QLabel(formatted_name)
-        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.name_label.setWordWrap(True)
-        self.name_label.hide()
-
-        self.layout.addWidget(self.icon_label)
-        self.layout.addWidget(self.name_label)
-        self.setLayout(self.layout)
-
-        self.setMouseTracking(True)
-
-    def _is_strictly_dark_grayscale(self, image: QImage):
-        if image.isNull():
-            return False
-
-        DARKNESS_THRESHOLD = 120
-        COLOR_TOLERANCE = 15
-        scaled_image = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio)
-        has_visible_pixels = False
-        for y in range(scaled_image.height()):
-            for x in range(scaled_image.width()):
-                color = QColor(scaled_image.pixel(x, y))
-                if color.alpha() < 50: continue
-                has_visible_pixels = True
-                r, g, b = color.red(), color.green(), color.blue()
-                if r > DARKNESS_THRESHOLD or g > DARKNESS_THRESHOLD or b > DARKNESS_THRESHOLD:
-                    return False
-                min_c, max_c = min(r, g, b), max(r, g, b)
-                if (max_c - min_c) > COLOR_TOLERANCE:
-                    return False
-        if not has_visible_pixels:
-            return False
-        return True
-
-    def _create_colored_version(self, source_pixmap: QPixmap, target_color: QColor):
-        if source_pixmap.isNull(): return QPixmap()
-        recolored_pixmap = QPixmap(source_pixmap.size())
-        recolored_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(recolored_pixmap)
-        painter.drawPixmap(0, 0, source_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        painter.fillRect(recolored_pixmap.rect(), target_color)
-        painter.end()
-        return recolored_pixmap
-
-    def _adjust_for_long_name(self, reduce):
-        current_pixmap_size = self.icon_label.pixmap().width()
-        target_size = self.original_icon_size
-
-        if reduce:
-            font_metrics = self.name_label.fontMetrics()
-            text_height = font_metrics.boundingRect(self.name_label.rect(), Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, self.name_label.text()).height()
-            single_line_height = font_metrics.height()
-
-            if text_height > single_line_height * 2.2:
-                target_size = int(self.original_icon_size * 0.75)
-
-        if current_pixmap_size == target_size:
-            return
-
-        scaled_pixmap = self.original_scaled_pixmap.scaled(
-            target_size, target_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-
-        is_recolorable = self._is_strictly_dark_grayscale(self.original_scaled_pixmap.toImage())
-        if is_recolorable:
-            default_text_color = self.palette().color(QPalette.ColorRole.Text)
-            highlight_bg_color = self.palette().color(QPalette.ColorRole.Highlight)
-            luminance = 0.2126 * highlight_bg_color.redF() + 0.7152 * highlight_bg_color.greenF() + 0.0722 * highlight_bg_color.blueF()
-            highlight_text_color = QColor("#000000") if luminance > 0.5 else QColor("#FFFFFF")
-            self.default_pixmap = self._create_colored_version(scaled_pixmap, default_text_color)
-            self.highlight_pixmap = self._create_colored_version(scaled_pixmap, highlight_text_color)
-        else:
-            self.default_pixmap = scaled_pixmap
-            self.highlight_pixmap = scaled_pixmap
-
-        if self.is_selected:
-            self.icon_label.setPixmap(self.highlight_pixmap)
-        else:
-            self.icon_label.setPixmap(self.default_pixmap)
-
-    def set_selected(self, selected):
-        if self.is_selected == selected: return
-        self.is_selected = selected
-
-        if self.is_selected:
-            self.name_label.show()
-            self._adjust_for_long_name(reduce=True)
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            luminance = 0.2126 * highlight_color.redF() + 0.7152 * highlight_color.greenF() + 0.0722 * highlight_color.blueF()
-            text_color_name = "#000000" if luminance > 0.5 else "#FFFFFF"
-            self.name_label.setStyleSheet(f"color: {text_color_name};")
-            self.icon_label.setPixmap(self.highlight_pixmap)
-        else:
-            self._adjust_for_long_name(reduce=False)
-            text_color = self.palette().color(QPalette.ColorRole.Text)
-            self.name_label.setStyleSheet(f"color: {text_color.name()};")
-            if not self.is_hovered:
-                self.name_label.hide()
-            self.icon_label.setPixmap(self.default_pixmap)
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        brush_to_use = None
-        if self.is_selected:
-            brush_to_use = self.palette().brush(QPalette.ColorRole.Highlight)
-        elif self.is_hovered:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            highlight_color.setAlpha(40)
-            brush_to_use = QBrush(highlight_color)
-        if brush_to_use:
-            path = QPainterPath()
-            path.addRoundedRect(QRectF(self.rect()), 4, 4)
-            painter.fillPath(path, brush_to_use)
-
-    def enterEvent(self, event):
-        self.is_hovered = True
-        self.name_label.show()
-        self._adjust_for_long_name(reduce=True)
-        self.update()
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.is_hovered = False
-        if not self.is_selected:
-            self.name_label.hide()
-            self._adjust_for_long_name(reduce=False)
-        self.update()
-        super().leaveEvent(event)
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtGui import QPixmap, QIcon, QColor, QPalette
+from lib.icon_factory import get_icon_factory
+from lib.icon_metadata import get_icon_metadata
+from lib.icon_index import ICON_EXTENSIONS
+from lib.icon_loader import get_icon_loader, PRIORITY_NORMAL, PRIORITY_VISIBLE
 
 class IconBrowserDialog(QDialog):
     def __init__(self, icon_folder, parent=None):
@@ -218,6 +44,11 @@ class IconBrowserDialog(QDialog):
         self.list_widget.setStyleSheet(list_widget_style)
         self.list_widget.itemDoubleClicked.connect(self.accept)
         self.list_widget.currentItemChanged.connect(self.on_selection_changed)
+        self.list_widget.verticalScrollBar().valueChanged.connect(self._request_visible_icons)
+        self.icon_loader = get_icon_loader()
+        self.icon_loader.icon_ready.connect(self._on_icon_ready)
+        self.icon_loader.icon_failed.connect(self._on_icon_failed)
+        self.pending_items = {}
         
         self.populate_icons(icon_folder)
         self.layout.addWidget(self.list_widget)
@@ -240,24 +71,24 @@ class IconBrowserDialog(QDialog):
         self.layout.addLayout(buttons_layout)
         self.retranslate_ui()
 
-    def _is_dark_and_monochromatic(self, image: QImage, threshold=35, saturation_threshold=25):
-        if image.isNull(): return False
-        scaled_image = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio)
-        dark_pixels = sum(1 for y in range(scaled_image.height()) for x in range(scaled_image.width())
-                          if (c := QColor(scaled_image.pixel(x, y))).saturation() < saturation_threshold and
-                          (c.red() + c.green() + c.blue() < threshold * 3))
-        return (dark_pixels / (scaled_image.width() * scaled_image.height())) > 0.7
-
     def _create_colored_pixmap(self, source_pixmap: QPixmap, target_color: QColor):
-        if source_pixmap.isNull(): return QPixmap()
-        recolored_pixmap = QPixmap(source_pixmap.size())
-        recolored_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(recolored_pixmap)
-        painter.drawPixmap(0, 0, source_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        painter.fillRect(recolored_pixmap.rect(), target_color)
-        painter.end()
-        return recolored_pixmap
+        return get_icon_factory().tinted(source_pixmap, target_color)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        QTimer.singleShot(0, self._request_visible_icons)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._request_visible_icons()
+
+    def done(self, result):
+        self.icon_loader.release(self)
+        try:
+            self.icon_loader.icon_ready.disconnect(self._on_icon_ready)
+            self.icon_loader.icon_failed.disconnect(self._on_icon_failed)
+        except TypeError: pass
+        super().done(result)
 
     def retranslate_ui(self):
         self.setWindowTitle(self.translator.translate("icon_browser_title"))
@@ -266,39 +97,59 @@ class IconBrowserDialog(QDialog):
         self.ok_button.setText(self.translator.translate("button_ok"))
 
     def populate_icons(self, icon_folder):
-        image_extensions = ['.png', '.jpg', '.jpeg', '.webp']
         if not os.path.isdir(icon_folder): return
-
-        default_text_color = self.palette().color(QPalette.ColorRole.Text)
-        highlight_bg = self.palette().color(QPalette.ColorRole.Highlight)
-        luminance = 0.2126 * highlight_bg.redF() + 0.7152 * highlight_bg.greenF() + 0.0722 * highlight_bg.blueF()
-        highlight_text_color = QColor("#000000") if luminance > 0.5 else QColor("#FFFFFF")
-
-        for filename in sorted(os.listdir(icon_folder)):
-            if any(filename.lower().endswith(ext) for ext in image_extensions):
-                full_path = os.path.join(icon_folder, filename)
-                name = os.path.splitext(filename)[0]
-                
-                original_pixmap = QPixmap(full_path)
-                final_icon = QIcon()
-
-                if self._is_dark_and_monochromatic(original_pixmap.toImage()):
-                    normal_pixmap = self._create_colored_pixmap(original_pixmap, default_text_color)
-                    selected_pixmap = self._create_colored_pixmap(original_pixmap, highlight_text_color)
-                    final_icon.addPixmap(normal_pixmap, QIcon.Mode.Normal)
-                    final_icon.addPixmap(selected_pixmap, QIcon.Mode.Selected)
-                else:
-                    final_icon.addPixmap(original_pixmap)
-                item = QListWidgetItem(final_icon, name)
-                item.setData(Qt.ItemDataRole.UserRole, full_path)
-                item.setToolTip(name)
-                self.list_widget.addItem(item)
+        try:
+            with os.scandir(icon_folder) as it: filenames = sorted(entry.name for entry in it if entry.is_file() and entry.name.lower().endswith(ICON_EXTENSIONS))
+        except OSError: return
+
+        placeholder = QPixmap(self.list_widget.iconSize())
+        placeholder.fill(Qt.GlobalColor.transparent)
+        placeholder_icon = QIcon(placeholder)
+        dpr = self.devicePixelRatioF()
+        for filename in filenames:
+            full_path = os.path.join(icon_folder, filename)
+            name = os.path.splitext(filename)[0]
+            item = QListWidgetItem(placeholder_icon, name)
+            item.setData(Qt.ItemDataRole.UserRole, full_path)
+            item.setToolTip(name)
+            self.list_widget.addItem(item)
+            key, pixmap, metadata = self.icon_loader.request(full_path, self.list_widget.iconSize(), dpr, self, PRIORITY_NORMAL)
+            if pixmap is not None: self._set_item_icon(item, pixmap, metadata)
+            else: self.pending_items[key] = item
+
+    def _request_visible_icons(self, *args):
+        if not self.pending_items: return
+        viewport_rect = self.list_widget.viewport().rect()
+        dpr = self.devicePixelRatioF()
+        for item in list(self.pending_items.values()):
+            if not item.isHidden() and self.list_widget.visualItemRect(item).intersects(viewport_rect):
+                self.icon_loader.request(item.data(Qt.ItemDataRole.UserRole), self.list_widget.iconSize(), dpr, self, PRIORITY_VISIBLE)
+
+    def _on_icon_ready(self, key, pixmap, metadata):
+        item = self.pending_items.pop(key, None)
+        if item is not None: self._set_item_icon(item, pixmap, metadata)
+
+    def _on_icon_failed(self, key):
+        self.pending_items.pop(key, None)
+
+    def _set_item_icon(self, item, pixmap, metadata):
+        final_icon = QIcon()
+        if metadata and metadata.get("dark_monochrome"):
+            highlight_bg = self.palette().color(QPalette.ColorRole.Highlight)
+            luminance = 0.2126 * highlight_bg.redF() + 0.7152 * highlight_bg.greenF() + 0.0722 * highlight_bg.blueF()
+            highlight_text_color = QColor("#000000") if luminance > 0.5 else QColor("#FFFFFF")
+            final_icon.addPixmap(self._create_colored_pixmap(pixmap, self.palette().color(QPalette.ColorRole.Text)), QIcon.Mode.Normal)
+            final_icon.addPixmap(self._create_colored_pixmap(pixmap, highlight_text_color), QIcon.Mode.Selected)
+        else:
+            final_icon.addPixmap(pixmap)
+        item.setIcon(final_icon)
     
     def filter_icons(self):
         filter_text = self.search_bar.text().lower()
         for i in range(self.list_widget.count()):
             item = self.list_widget.item(i)
             item.setHidden(filter_text not in item.text().lower())
+        self._request_visible_icons()
             
     def on_selection_changed(self, current_item, previous_item):
         self.ok_button.setEnabled(current_item is not None)
@@ -398,26 +249,10 @@ class ProfileDialog(QDialog):
         self.set_icon(current_icon_path)
         self.retranslate_ui()
 
-    def _is_dark_and_monochromatic(self, image: QImage, threshold=35, saturation_threshold=25):
-        if image.isNull(): return False
-        scaled_image = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio)
-        dark_pixels = sum(1 for y in range(scaled_image.height()) for x in range(scaled_image.width())
-                          if (c := QColor(scaled_image.pixel(x, y))).saturation() < saturation_threshold and
-                          (c.red() + c.green() + c.blue() < threshold * 3))
-        return (dark_pixels / (scaled_image.width() * scaled_image.height())) > 0.7
-
-    def _process_icon(self, pixmap: QPixmap):
+    def _process_icon(self, pixmap: QPixmap, path):
         if pixmap.isNull(): return QPixmap()
-        if self._is_dark_and_monochromatic(pixmap.toImage()):
-            target_color = self.palette().color(QPalette.ColorRole.Text)
-            recolored_pixmap = QPixmap(pixmap.size())
-            recolored_pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(recolored_pixmap)
-            painter.drawPixmap(0, 0, pixmap)
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-            painter.fillRect(recolored_pixmap.rect(), target_color)
-            painter.end()
-            return recolored_pixmap
+        if get_icon_metadata().is_dark_monochrome(path):
+            return get_icon_factory().tinted(pixmap, self.palette().color(QPalette.ColorRole.Text))
         return pixmap 
 
     def retranslate_ui(self):
@@ -440,8 +275,8 @@ class ProfileDialog(QDialog):
             icon_to_load = self.app.default_icon_path
         
         if icon_to_load:
-            original_pixmap = QPixmap(icon_to_load)
-            processed_pixmap = self._process_icon(original_pixmap)
+            original_pixmap = get_icon_factory().pixmap(icon_to_load)
+            processed_pixmap = self._process_icon(original_pixmap, icon_to_load)
             self.icon_preview.setPixmap(processed_pixmap.scaled(self.icon_preview.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
             self.icon_preview.setStyleSheet("border: 1px solid #c0c0c0; border-radius: 8px;")
         else:
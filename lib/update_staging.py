@@ -0,0 +1,193 @@
+import os
+import re
+import json
+import time
+import shutil
+import tempfile
+try:
+    import requests
+except ImportError:
+    requests = None
+try:
+    import patoolib
+except ImportError:
+    patoolib = None
+from PyQt6.QtCore import QObject, QThread, QTimer
+from lib.http_client import get_http_client, PRIORITY_BACKGROUND
+
+DEFAULT_BANDWIDTH_KBPS = 512
+DEFAULT_DISK_CAP_MB = 2048
+DEFAULT_CHECK_INTERVAL_MIN = 60
+
+def _folder_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try: total += os.path.getsize(os.path.join(root, file))
+            except OSError: pass
+    return total
+
+def _variant_name(file_name):
+    return re.sub(r'v(?=\d)|[\d._\-\s()\[\]]+', '', os.path.splitext(file_name or "")[0].lower())
+
+def matching_file(files_list, file_id, file_name):
+    if len(files_list) == 1: return files_list[0]
+    same_file = next((f for f in files_list if file_id and f.get('_idRow') == file_id), None)
+    if same_file: return same_file
+    variant = _variant_name(file_name)
+    if not variant: return None
+    matches = [f for f in files_list if _variant_name(f.get('_sFile')) == variant]
+    return max(matches, key=lambda f: f.get('_tsDateAdded') or 0) if matches else None
+
+class UpdateStagingWorker(QThread):
+    def __init__(self, staging_path, candidates, bandwidth_kbps, disk_cap_mb, extract, parent=None):
+        super().__init__(parent)
+        self.staging_path = staging_path
+        self.candidates = candidates
+        self.extract = extract
+        self.bandwidth_bps = max(1, bandwidth_kbps) * 1024
+        self.disk_cap_bytes = max(1, disk_cap_mb) * 1024 * 1024
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        if not requests or not patoolib:
+            print("Pre-descarga de actualizaciones desactivada: faltan 'requests' o 'patoolib'.")
+            return
+        print(f"Buscando actualizaciones en segundo plano para {len(self.candidates)} mods...")
+        for mod_id, installed in self.candidates.items():
+            if self._cancelled: break
+            try:
+                self._check_and_stage(mod_id, *installed)
+            except Exception as e:
+                print(f"No se pudo pre-descargar la actualización del mod {mod_id}: {e}")
+            time.sleep(1)
+        print("Búsqueda de actualizaciones en segundo plano finalizada.")
+
+    def _check_and_stage(self, mod_id, installed_date, file_id, file_name):
+        response = get_http_client().get(f"https://gamebanana.com/apiv11/Mod/{mod_id}", params={"_csvProperties": "_aFiles"}, timeout=20, priority=PRIORITY_BACKGROUND)
+        response.raise_for_status()
+        files_list = [f for f in response.json().get("_aFiles", []) if f.get('_sDownloadUrl')]
+        if not files_list: return
+        newest_file = matching_file(files_list, file_id, file_name)
+        if not newest_file or (newest_file.get('_tsDateAdded') or 0) <= installed_date: return
+
+        entry_path = os.path.join(self.staging_path, f"{mod_id}_{newest_file.get('_idRow')}")
+        if os.path.exists(os.path.join(entry_path, "manifest.json")): return
+
+        expected_size = (newest_file.get('_nFilesize') or 0) * 2
+        if _folder_size(self.staging_path) + expected_size > self.disk_cap_bytes:
+            print(f"Límite de disco de la pre-descarga alcanzado. Se omite el mod {mod_id}.")
+            return
+
+        archive_path = None
+        try:
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
+                archive_path = tmp_file.name
+                self._throttled_download(newest_file['_sDownloadUrl'], tmp_file)
+            if self._cancelled: return
+            shutil.rmtree(entry_path, ignore_errors=True)
+            self.extract(archive_path, os.path.join(entry_path, "files"), lambda: self._cancelled)
+            if self._cancelled: return
+            if _folder_size(self.staging_path) > self.disk_cap_bytes:
+                print(f"La actualización del mod {mod_id} supera el límite de disco. Se descarta.")
+                shutil.rmtree(entry_path, ignore_errors=True)
+                return
+            manifest = {"mod_id": mod_id, "file_id": newest_file.get('_idRow'), "file_date": newest_file.get('_tsDateAdded'), "file_name": newest_file.get('_sFile'), "staged_at": int(time.time())}
+            with open(os.path.join(entry_path, "manifest.json"), 'w', encoding='utf-8') as f: json.dump(manifest, f, indent=4)
+            print(f"Actualización del mod {mod_id} pre-descargada: {newest_file.get('_sFile')}")
+        finally:
+            if archive_path and os.path.exists(archive_path): os.remove(archive_path)
+            if self._cancelled: shutil.rmtree(entry_path, ignore_errors=True)
+
+    def _throttled_download(self, url, tmp_file):
+        started = time.monotonic()
+        def throttle(downloaded, total):
+            if self._cancelled: return False
+            expected_elapsed = downloaded / self.bandwidth_bps
+            actual_elapsed = time.monotonic() - started
+            if expected_elapsed > actual_elapsed: time.sleep(expected_elapsed - actual_elapsed)
+        get_http_client().download(url, tmp_file, on_chunk=throttle, chunk_size=32768, timeout=30, priority=PRIORITY_BACKGROUND)
+
+class UpdateStager(QObject):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.manager = manager
+        self.staging_path = os.path.join(manager.app_data_path, "update_staging")
+        os.makedirs(self.staging_path, exist_ok=True)
+        self.worker = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.run_check)
+
+    def is_enabled(self):
+        return self.manager.config.get("prestage_updates", False)
+
+    def apply_config(self):
+        if self.is_enabled():
+            interval_min = self.manager.config.get("prestage_check_interval_min", DEFAULT_CHECK_INTERVAL_MIN)
+            self.timer.start(max(5, interval_min) * 60 * 1000)
+            QTimer.singleShot(30000, self.run_check)
+        else:
+            self.timer.stop()
+            self.stop()
+
+    def _collect_candidates(self):
+        candidates = {}
+        for categories in self.manager.profiles.values():
+            for profiles in categories.values():
+                for profile_data in profiles.values():
+                    for mod_info in profile_data.get('mods', []):
+                        mod_id, file_date = mod_info.get('mod_id'), mod_info.get('file_date')
+                        if mod_id and file_date and file_date > candidates.get(mod_id, (0,))[0]:
+                            candidates[mod_id] = (file_date, mod_info.get('file_id'), mod_info.get('file_name'))
+        return candidates
+
+    def _prune(self, candidates):
+        for entry in os.listdir(self.staging_path):
+            entry_path = os.path.join(self.staging_path, entry)
+            manifest = self._read_manifest(entry_path)
+            if not manifest or manifest.get('mod_id') not in candidates or (manifest.get('file_date') or 0) <= candidates[manifest['mod_id']][0]:
+                shutil.rmtree(entry_path, ignore_errors=True)
+
+    def run_check(self):
+        if not self.is_enabled() or (self.worker and self.worker.isRunning()): return
+        candidates = self._collect_candidates()
+        self._prune(candidates)
+        if not candidates: return
+        self.worker = UpdateStagingWorker(
+            self.staging_path, candidates,
+            self.manager.config.get("prestage_bandwidth_kbps", DEFAULT_BANDWIDTH_KBPS),
+            self.manager.config.get("prestage_disk_cap_mb", DEFAULT_DISK_CAP_MB),
+            self.manager._extract_and_copy_mod,
+            self
+        )
+        self.worker.start(QThread.Priority.IdlePriority)
+
+    def stop(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+
+    def _read_manifest(self, entry_path):
+        try:
+            with open(os.path.join(entry_path, "manifest.json"), 'r', encoding='utf-8') as f: return json.load(f)
+        except (OSError, json.JSONDecodeError): return None
+
+    def has_staged(self, mod_id, file_id):
+        if not mod_id or not file_id: return False
+        entry_path = os.path.join(self.staging_path, f"{mod_id}_{file_id}")
+        return self._read_manifest(entry_path) is not None and os.path.isdir(os.path.join(entry_path, "files"))
+
+    def take_staged(self, mod_id, file_id, dest_path):
+        if not self.has_staged(mod_id, file_id): return False
+        entry_path = os.path.join(self.staging_path, f"{mod_id}_{file_id}")
+        try:
+            shutil.move(os.path.join(entry_path, "files"), dest_path)
+        except OSError as e:
+            print(f"No se pudo usar la actualización pre-descargada del mod {mod_id}: {e}")
+            return False
+        shutil.rmtree(entry_path, ignore_errors=True)
+        print(f"Actualización pre-descargada aplicada para el mod {mod_id}.")
+        return True
@@ -6,8 +6,10 @@ import shutil
 import re
 import tempfile
 import time
-import base64
 import locale
+import hashlib
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 try:
     import requests
 except ImportError:
@@ -31,14 +33,13 @@ except ImportError:
     winerror = None
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QComboBox, QListWidget, QPushButton, QStackedWidget, QLabel,
+    QComboBox, QPushButton, QStackedWidget, QLabel,
     QTabWidget, QFileDialog, QInputDialog, QMessageBox, QListWidgetItem,
-    QDialog, QButtonGroup, QLineEdit, QListView, QStyle, QFrame, QSpacerItem, QSizePolicy, QStackedLayout, QSystemTrayIcon, QMenu
+    QDialog, QButtonGroup, QLineEdit, QListView, QStyle, QFrame, QStackedLayout, QSystemTrayIcon, QMenu
 )
-from PyQt6.QtCore import Qt, QSize, QRectF, QByteArray, pyqtSignal, QTimer, QPointF, QUrl, QEventLoop, QThread
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QPalette, QPainterPath, QDesktopServices, QCursor, QPen, QFontMetrics, QAction
-from PyQt6.QtSvg import QSvgRenderer
-from lib.ui_dialogs import ProfileItemWidget, ProfileDialog, ApiSelectionDialog, ModInfoDialog
+from PyQt6.QtCore import Qt, QSize, QTimer, QUrl, QEventLoop, QThread
+from PyQt6.QtGui import QIcon, QPixmap, QColor, QPalette, QDesktopServices, QCursor, QAction
+from lib.ui_dialogs import ProfileDialog, ApiSelectionDialog, ModInfoDialog
 from lib.overlay import OverlayController
 from lib.translation import Translator
 import tempfile
@@ -46,6 +47,20 @@ from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
 from lib.download_tab import FileSelectionDialog, DownloadProgressDialog
 import re
 from lib.one_click_dialog import OneClickInstallDialog
+from lib.update_staging import UpdateStager
+from lib.http_client import get_http_client, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from lib.api_cache import get_api_cache
+from lib.mod_index import get_mod_index
+from lib.category_index import CategoryIndex, CATEGORIES_URL
+from lib.thumbnail_cache import ThumbnailCache
+from lib.icon_factory import get_icon_factory
+from lib.icon_metadata import get_icon_metadata
+from lib.icon_index import get_icon_index, GAME_ICON_EXTENSIONS
+from lib.icon_thumbnails import get_thumbnail_service, apply_thumbnails
+from lib.icon_store import IconStore
+from lib.icon_loader import get_icon_loader
+from lib.mod_grid import ModListModel, ModCardDelegate
+from lib.profile_list import ProfileListModel, ProfileItemDelegate
 from collections import OrderedDict
 
 def resource_path(relative_path):
@@ -83,319 +98,60 @@ class SingleInstance:
             win32api.CloseHandle(self.mutex)
             self.mutex = None
 
-class MarqueeLabel(QLabel):
-    def __init__(self, text, parent=None):
-        super().__init__(text, parent)
-        self.offset = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._scroll)
-        self.padding = 30
-
-    def is_overflowing(self):
-        return len(self.text()) > 20
-
-    def start_marquee(self):
-        if self.is_overflowing():
-            self.offset = 0
-            self.timer.start(30)
-
-    def stop_marquee(self):
-        self.timer.stop()
-        self.offset = 0
-        self.update()
-
-    def _scroll(self):
-        self.offset += 1
-        text_width = QFontMetrics(self.font()).horizontalAdvance(self.text())
-        if self.offset > text_width + self.padding:
-            self.offset = 0
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        if self.is_overflowing() and self.timer.isActive():
-            fm = QFontMetrics(self.font())
-            text_width = fm.horizontalAdvance(self.text())
-            y_pos = (self.height() - fm.height()) / 2 + fm.ascent()
-
-            painter.drawText(QPointF(0 - self.offset, y_pos), self.text())
-            if self.offset > 0:
-                 painter.drawText(QPointF(0 - self.offset + text_width + self.padding, y_pos), self.text())
-        else:
-            text_to_draw = self.text()
-            alignment = self.alignment() 
-            if self.is_overflowing():
-                text_to_draw = self.text()[:20] + "..."
-                alignment = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-            painter.drawText(self.rect(), alignment, text_to_draw)
-
-    def setText(self, text):
-        super().setText(text)
-        self.stop_marquee()
-
-class ModCardWidget(QWidget):
-    edit_requested = pyqtSignal()
-    delete_requested = pyqtSignal()
-    url_requested = pyqtSignal(str)
-    update_requested = pyqtSignal()
-
-    def __init__(self, mod_info, parent=None):
-        super().__init__(parent)
-        self.mod_manager = parent
-        self.translator = self.mod_manager.translator
-        self.mod_info = mod_info
-        self.is_active = False
-        self.is_hovered = False
-
-        self.setFixedSize(280, 220)
-        self.setMouseTracking(True) 
-
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(8, 8, 8, 8)
-        main_layout.setSpacing(5)
-        main_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-
-        self.icon_label = QLabel()
-        self.icon_label.setFixedSize(215, 120)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setStyleSheet("border: 1px solid #ddd; border-radius: 4px; background-color: rgba(0,0,0,0.05);")
-        icon_path = self.mod_info.get("icon")
-        if icon_path and os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            self.icon_label.setPixmap(pixmap.scaled(220, 120, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        else:
-            self.icon_label.setText(self.translator.translate("text_no_icon"))
-        main_layout.addWidget(self.icon_label, alignment=Qt.AlignmentFlag.AlignHCenter)
-
-        display_name = self.mod_info.get("display_name") or self.mod_info.get("name", self.translator.translate("text_unknown_name"))
-        self.name_label = MarqueeLabel(display_name, self)
-        self.name_label.setStyleSheet("font-size: 11pt; font-weight: bold;")
-        self.name_label.setWordWrap(False)
-        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        font_metrics = QFontMetrics(self.name_label.font())
-        max_width = font_metrics.horizontalAdvance("W" * 15) + 5 
-        self.name_label.setMaximumWidth(max_width)
-
-        creator = self.mod_info.get("creator")
-        creator_text = f"<i>{self.translator.translate('text_creator_prefix', creator=creator)}</i>" if creator else f"<i>{self.translator.translate('text_unknown_creator')}</i>"
-        creator_label = QLabel(creator_text)
-        creator_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        creator_label.setWordWrap(True)
-        
-        name_layout = QHBoxLayout()
-        name_layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
-        name_layout.addWidget(self.name_label)
-        name_layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
-
-        main_layout.addLayout(name_layout)
-        main_layout.addWidget(creator_label)
-        main_layout.addStretch()
-
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(4)
-        highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-        btn_size, icon_size = 32, 18
-        stylesheet = f"QPushButton {{ background-color: transparent; border-radius: {btn_size//2}px; }} QPushButton:hover {{ background-color: rgba({highlight_color.red()}, {highlight_color.green()}, {highlight_color.blue()}, 40); }} QPushButton:pressed {{ background-color: rgba({highlight_color.red()}, {highlight_color.green()}, {highlight_color.blue()}, 80); }}"
-
-        edit_button = QPushButton()
-        edit_button.setIcon(self.mod_manager._create_colored_icon(self.mod_manager.ICON_EDIT, highlight_color))
-        edit_button.setToolTip(self.translator.translate("tooltip_edit_mod_info")) 
-        edit_button.clicked.connect(self.edit_requested.emit)
-
-        url_button = QPushButton()
-        url_button.setIcon(self.mod_manager._create_colored_icon(self.mod_manager.ICON_URL, highlight_color))
-        url_button.setToolTip(self.translator.translate("tooltip_open_mod_page")) 
-        url_button.clicked.connect(lambda: self.url_requested.emit(self.mod_info.get("url", "")))
-        if not self.mod_info.get("url"): url_button.setEnabled(False)
-
-        update_button = QPushButton()
-        update_button.setIcon(self.mod_manager._create_colored_icon(self.mod_manager.ICON_UPDATE, highlight_color))
-        update_button.setToolTip(self.translator.translate("tooltip_check_for_updates"))
-        update_button.clicked.connect(self.update_requested.emit)
-        is_api_mod = bool(self.mod_info.get("profile_url"))
-        update_button.setEnabled(is_api_mod)
-
-        delete_button = QPushButton()
-        delete_button.setIcon(self.mod_manager._create_colored_icon(self.mod_manager.ICON_REMOVE, highlight_color))
-        delete_button.setToolTip(self.translator.translate("tooltip_delete_this_mod")) 
-        delete_button.clicked.connect(self.delete_requested.emit)
-    
-        for btn in [edit_button, url_button, update_button, delete_button]:
-            btn.setFixedSize(btn_size, btn_size); btn.setIconSize(QSize(icon_size, icon_size)); btn.setStyleSheet(stylesheet); btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            button_layout.addWidget(btn)
-
-        main_layout.addLayout(button_layout)
-
-    def set_active(self, active):
-        if self.is_active != active:
-            self.is_active = active
-            self.update_text_color()
-            self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        if self.is_hovered and not self.is_active:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            highlight_color.setAlpha(40)
-            brush_to_use = QBrush(highlight_color)
-            path = QPainterPath()
-            path.addRoundedRect(QRectF(self.rect()), 8, 8)
-            painter.fillPath(path, brush_to_use)
-        if self.is_active:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            pen = QPen(highlight_color)
-            pen.setWidth(3)
-            painter.setPen(pen)
-            rect = QRectF(self.rect()).adjusted(1.5, 1.5, -1.5, -1.5)
-            painter.drawRoundedRect(rect, 8, 8)
-    
-    def enterEvent(self, event):
-        self.is_hovered = True
-        self.update()
-        self.name_label.start_marquee()
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.is_hovered = False
-        self.update()
-        self.name_label.stop_marquee()
-        super().leaveEvent(event)
-        
-    def update_text_color(self):
-        text_widgets = self.findChildren(QLabel)
-        if self.is_active:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            text_color_name = highlight_color.name()
-            for widget in text_widgets:
-                if not widget.pixmap(): widget.setStyleSheet(f"color: {text_color_name}; background-color: transparent;")
-        else:
-            for widget in text_widgets:
-                if not widget.pixmap():
-                    current_style = widget.styleSheet()
-                    new_style = re.sub(r'color:\s*#[0-9a-fA-F]+;', '', current_style)
-                    widget.setStyleSheet(new_style)
-
-class NoneModCardWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.mod_manager = parent
-        self.translator = self.mod_manager.translator 
-        self.is_active = False
-        self.is_hovered = False
-
-        self.setFixedSize(280, 220)
-        self.setMouseTracking(True)
-
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(8, 8, 8, 8); main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addSpacing(20)
-
-        icon_display_size = 80
-        base64_svg = self.mod_manager.ICON_NONE; svg_data = base64.b64decode(base64_svg); svg_str = svg_data.decode('utf-8')
-        highlight_color = self.palette().color(QPalette.ColorRole.Highlight); color_to_use = highlight_color.darker(120)
-        colored_svg_str = svg_str.replace('currentColor', color_to_use.name()); qt_svg_data = QByteArray(colored_svg_str.encode('utf-8'))
-        renderer = QSvgRenderer(qt_svg_data)
-        target_pixmap = QPixmap(icon_display_size, icon_display_size); target_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(target_pixmap); renderer.render(painter); painter.end()
-        icon_label = QLabel(); icon_label.setFixedSize(icon_display_size, icon_display_size); icon_label.setPixmap(target_pixmap)
-        main_layout.addWidget(icon_label); main_layout.addStretch()
-
-        self.name_label = QLabel(self.translator.translate("text_none"))
-        self.name_label.setStyleSheet("font-size: 11pt; font-weight: bold;"); self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label = QLabel(f"<i>({self.translator.translate('text_deactivated')})</i>") 
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(self.name_label); main_layout.addWidget(self.status_label); main_layout.addSpacing(40)
-    
-    def set_active(self, active):
-        if self.is_active != active:
-            self.is_active = active
-            self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        if self.is_hovered and not self.is_active:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            highlight_color.setAlpha(40) 
-            brush_to_use = QBrush(highlight_color)
-            path = QPainterPath()
-            path.addRoundedRect(QRectF(self.rect()), 8, 8)
-            painter.fillPath(path, brush_to_use)
-        if self.is_active:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            pen = QPen(highlight_color)
-            pen.setWidth(3)
-            painter.setPen(pen)
-            
-            rect = QRectF(self.rect()).adjusted(1.5, 1.5, -1.5, -1.5)
-            painter.drawRoundedRect(rect, 8, 8)
-
-    def enterEvent(self, event):
-        self.is_hovered = True; self.update(); super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.is_hovered = False; self.update(); super().leaveEvent(event)
-        
-    def update_text_color(self):
-        text_widgets = self.findChildren(QLabel)
-        if self.is_active:
-            highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-            text_color_name = highlight_color.name()
-            for widget in text_widgets: widget.setStyleSheet(f"color: {text_color_name}; background-color: transparent;")
-        else:
-            for widget in text_widgets:
-                current_style = widget.styleSheet()
-                new_style = re.sub(r'color:\s*#[0-9a-fA-F]+;', '', current_style)
-                widget.setStyleSheet(new_style)
-
 class IconSyncWorker(QThread):
+    MAX_PARALLEL_DOWNLOADS = 4
+
     def __init__(self, mod_manager_instance, parent=None):
         super().__init__(parent)
         self.mod_manager = mod_manager_instance
 
+    @staticmethod
+    def _git_blob_sha(path):
+        try:
+            with open(path, 'rb') as f: content = f.read()
+        except OSError:
+            return None
+        return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+    def _fetch_icon_tree(self):
+        manager = self.mod_manager
+        tree_url = f"{manager.GITHUB_API_BASE_URL}/{manager.GITHUB_REPO_OWNER}/{manager.GITHUB_REPO_NAME}/git/trees/{manager.GITHUB_BRANCH}"
+        tree_data = get_api_cache().get_json(tree_url, params={"recursive": "1"}, timeout=15, priority=PRIORITY_BACKGROUND)
+        if tree_data.get('truncated'):
+            print("El árbol de íconos de GitHub llegó truncado; algunos íconos podrían no sincronizarse.")
+        return tree_data.get('tree', [])
+
     def run(self):
         if not requests:
             print("Módulo 'requests' no disponible. No se pueden sincronizar los íconos.")
             return
 
         print("Iniciando sincronización de íconos de juegos desde GitHub en segundo plano...")
-        headers = {'User-Agent': 'MIMM/1.0'}
-
-        for game_name, game_info in self.mod_manager.game_data.items():
-            short_name = game_info['short_name']
-            print(f"Procesando íconos para: {game_name} ({short_name})")
-
-            api_url = (
-                f"{self.mod_manager.GITHUB_API_BASE_URL}/{self.mod_manager.GITHUB_REPO_OWNER}/"
-                f"{self.mod_manager.GITHUB_REPO_NAME}/contents/{self.mod_manager.GITHUB_ICONS_PATH}/{short_name}"
-            )
-            
-            try:
-                response = requests.get(api_url, headers=headers, timeout=15)
-                response.raise_for_status()
-                files_data = response.json()
-                
-                if not isinstance(files_data, list):
-                    print(f"Respuesta inesperada de la API para la carpeta '{short_name}': {files_data.get('message')}")
-                    continue
+        manager = self.mod_manager
+        try:
+            tree = self._fetch_icon_tree()
+        except Exception as e:
+            print(f"No se pudo obtener el árbol de íconos de GitHub: {e}. Se omitirá la sincronización.")
+            return
 
-                for file_info in files_data:
-                    if file_info['type'] == 'file':
-                        file_name = file_info['name']
-                        download_url = file_info['download_url']
-                        local_icon_path = os.path.join(self.mod_manager.user_icons_path, short_name, file_name)
-                        
-                        if not os.path.exists(local_icon_path):
-                            print(f"El ícono '{file_name}' no existe localmente. Descargando...")
-                            self.mod_manager._download_icon(download_url, local_icon_path)
+        folders = {game_info['short_name'] for game_info in manager.game_data.values()}
+        pending = []
+        for entry in tree:
+            if entry.get('type') != 'blob': continue
+            parts = entry.get('path', '').split('/')
+            if len(parts) != 3 or parts[0] != manager.GITHUB_ICONS_PATH or parts[1] not in folders: continue
+            local_icon_path = os.path.join(manager.user_icons_path, parts[1], parts[2])
+            if self._git_blob_sha(local_icon_path) == entry.get('sha'): continue
+            download_url = f"https://raw.githubusercontent.com/{manager.GITHUB_REPO_OWNER}/{manager.GITHUB_REPO_NAME}/{manager.GITHUB_BRANCH}/{quote(entry['path'])}"
+            pending.append((download_url, local_icon_path))
+
+        if pending:
+            print(f"Descargando {len(pending)} íconos nuevos o modificados...")
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_DOWNLOADS) as executor:
+                list(executor.map(lambda job: manager._download_icon(*job, priority=PRIORITY_BACKGROUND), pending))
+            get_icon_index().invalidate()
+            get_icon_metadata().ensure(local_path for _, local_path in pending if os.path.exists(local_path))
 
-            except requests.RequestException as e:
-                print(f"No se pudo conectar a la API de GitHub para '{short_name}': {e}. Se omitirá la sincronización para este juego.")
-            except Exception as e:
-                print(f"Ocurrió un error inesperado al procesar '{short_name}': {e}")
-        
         print("Sincronización de íconos de juegos finalizada.")
 
 class ModManager(QMainWindow):
@@ -414,6 +170,7 @@ class ModManager(QMainWindow):
     GITHUB_REPO_OWNER = "RoberthMZ"
     GITHUB_REPO_NAME = "MIMM"
     GITHUB_ICONS_PATH = "icons"
+    GITHUB_BRANCH = "main"
 
     def __init__(self, startup_url=None):
         super().__init__()
@@ -424,6 +181,7 @@ class ModManager(QMainWindow):
         self.startup_url_to_process = startup_url
 
     def initialize_application(self):
+        get_icon_index()
         self._ensure_protocol_is_registered()
         self.app_root_path = os.path.dirname(os.path.abspath(sys.argv[0]))
         translations_path = resource_path(os.path.join("lib", "lang"))
@@ -434,6 +192,7 @@ class ModManager(QMainWindow):
         os.makedirs(self.icons_cache_path, exist_ok=True)
         self.translator = Translator(translations_path)
         self.config = self.load_config()
+        self.icon_store = IconStore(self.icons_cache_path, int(self.config.get("icons_cache_quota_mb", 0)) * 1024 * 1024)
         if "language" not in self.config:
             try:
                 system_lang, _ = locale.getdefaultlocale()
@@ -499,9 +258,27 @@ class ModManager(QMainWindow):
         os.makedirs(os.path.join(self.user_icons_path, "Games"), exist_ok=True)
         self._sync_game_icons_from_github()
         self.profiles = self.load_profiles()
+        self.thumbnail_save_timer = QTimer(self)
+        self.thumbnail_save_timer.setSingleShot(True)
+        self.thumbnail_save_timer.setInterval(500)
+        self.thumbnail_save_timer.timeout.connect(self.save_profiles)
+        get_thumbnail_service().thumbnails_ready.connect(self._on_thumbnails_ready)
+        if self._backfill_gamebanana_ids() | self.icon_store.adopt(self.profiles):
+            self.save_profiles()
+        else:
+            self.icon_store.schedule_collect(self.profiles)
+            get_thumbnail_service().schedule_backfill(self.profiles)
+        self.network_manager = QNetworkAccessManager(self)
+        get_icon_factory().watch_theme(self)
+        self.thumbnail_cache = ThumbnailCache(self.app_data_path, self)
+        self.category_index = CategoryIndex(self.app_data_path, self.game_data)
+        self.category_index.refresh_in_background()
+        self.update_stager = UpdateStager(self)
+        self.update_stager.apply_config()
         self.current_game = ""
         self.current_category = None
         self.category_widgets = {}
+        self.profile_models = {}
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.layout = QHBoxLayout(self.central_widget)
@@ -526,28 +303,48 @@ class ModManager(QMainWindow):
 
     def _sanitize_filename(self, name): return re.sub(r'[\\/*?:"<>|]', "", name)
 
+    def _extract_gamebanana_mod_id(self, url):
+        match = re.search(r'gamebanana\.com/mods/(\d+)', url or "")
+        return int(match.group(1)) if match else None
+
+    def _get_api_mod_ids(self, mod_data, file_data=None):
+        file_data = file_data or {}
+        return {
+            "mod_id": mod_data.get('_idRow') or self._extract_gamebanana_mod_id(mod_data.get('_sProfileUrl')),
+            "file_id": file_data.get('_idRow'),
+            "file_name": file_data.get('_sFile'),
+            "file_date": file_data.get('_tsDateAdded')
+        }
+
+    def _backfill_gamebanana_ids(self):
+        backfilled_count = 0
+        for categories in self.profiles.values():
+            for profiles in categories.values():
+                for profile_data in profiles.values():
+                    for mod_info in profile_data.get('mods', []):
+                        if mod_info.get('mod_id'): continue
+                        mod_id = self._extract_gamebanana_mod_id(mod_info.get('profile_url') or mod_info.get('url'))
+                        if mod_id:
+                            mod_info['mod_id'] = mod_id
+                            backfilled_count += 1
+        if backfilled_count:
+            print(f"IDs de GameBanana recuperados desde las URLs para {backfilled_count} mods.")
+        return backfilled_count > 0
+
     def _create_colored_icon(self, base64_svg, color):
-        svg_data = base64.b64decode(base64_svg)
-        svg_str = svg_data.decode('utf-8')
-        
-        colored_svg_str = svg_str.replace('currentColor', color.name())
-        
-        qt_svg_data = QByteArray(colored_svg_str.encode('utf-8'))
-        pixmap = QPixmap()
-        pixmap.loadFromData(qt_svg_data, 'svg')
-        
-        return QIcon(pixmap)
+        return get_icon_factory().svg_icon(base64_svg, color)
     
-    def _download_icon(self, download_url, local_path):
+    def _download_icon(self, download_url, local_path, priority=PRIORITY_INTERACTIVE):
         try:
             os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            response_icon = requests.get(download_url, timeout=15)
+            response_icon = get_http_client().get(download_url, timeout=15, priority=priority)
             response_icon.raise_for_status()
-            with open(local_path, 'wb') as f:
+            with open(local_path + ".tmp", 'wb') as f:
                 f.write(response_icon.content)
+            os.replace(local_path + ".tmp", local_path)
             print(f"Icono descargado y guardado en: {local_path}")
             return True
-        except requests.RequestException as e:
+        except (requests.RequestException, OSError) as e:
             print(f"Error al descargar el ícono desde {download_url}: {e}")
             return False
 
@@ -605,9 +402,8 @@ class ModManager(QMainWindow):
             for key, action in self.tray_menu_actions.items():
                 action.setText(self.translator.translate(key))
         if self.right_panel.currentWidget():
-            list_widget = self.profile_list_stack.currentWidget()
-            if list_widget and list_widget.currentItem():
-                self.display_profile_mods(list_widget.currentItem())
+            if self.current_profile_name():
+                self.display_profile_mods(self.profile_list_view.currentIndex())
 
     def setup_ui(self):
         self.setAcceptDrops(True)
@@ -650,7 +446,7 @@ class ModManager(QMainWindow):
             button.setToolTip(name)
             button.setCursor(Qt.CursorShape.PointingHandCursor)
             button.setStyleSheet(game_button_style)
-            icon_path = next((os.path.join(game_icons_path, f"{data['short_name']}{ext}") for ext in ['.png', '.jpg', '.jpeg'] if os.path.exists(os.path.join(game_icons_path, f"{data['short_name']}{ext}"))), None)
+            icon_path = get_icon_index().find(game_icons_path, data['short_name'], GAME_ICON_EXTENSIONS)
             if icon_path:
                 button.setIcon(QIcon(icon_path)); button.setIconSize(QSize(50, 50)); button.setFixedSize(QSize(83, 65))
             else:
@@ -672,7 +468,10 @@ class ModManager(QMainWindow):
         self.category_button_group = QButtonGroup(self)
         self.category_button_group.setExclusive(True)
         self.category_button_group.buttonClicked.connect(self.on_category_button_clicked)
-        self.profile_list_stack = QStackedWidget()
+        self.profile_list_view = QListView()
+        self.profile_list_view.setSpacing(15); self.profile_list_view.setViewMode(QListView.ViewMode.IconMode); self.profile_list_view.setMovement(QListView.Movement.Static)
+        self.profile_list_view.setResizeMode(QListView.ResizeMode.Adjust); self.profile_list_view.setUniformItemSizes(True)
+        self.profile_list_view.setItemDelegate(ProfileItemDelegate(self.profile_list_view, self.default_icon_path))
         button_size, icon_size = 50, 34
         hover_color = highlight_color.lighter(130)
         button_stylesheet = f"""
@@ -702,7 +501,7 @@ class ModManager(QMainWindow):
             btn.setStyleSheet(button_stylesheet)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
         left_layout.addWidget(self.category_buttons_widget)
-        left_layout.addWidget(self.profile_list_stack)
+        left_layout.addWidget(self.profile_list_view)
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
         buttons_layout.addWidget(self.add_profile_button)
@@ -716,20 +515,18 @@ class ModManager(QMainWindow):
         self.layout.addWidget(self.right_panel)
 
     def dragEnterEvent(self, event):
-        if self.profile_list_stack.currentWidget() and self.profile_list_stack.currentWidget().currentItem():
+        if self.current_profile_name():
             if event.mimeData().hasUrls():
                 event.acceptProposedAction()
                 return
         event.ignore()
 
     def dropEvent(self, event):
-        list_widget = self.profile_list_stack.currentWidget()
-        current_item = list_widget.currentItem()
-        if not current_item:
+        profile_name = self.current_profile_name()
+        if not profile_name:
             event.ignore()
             return
             
-        profile_name = current_item.data(Qt.ItemDataRole.UserRole)
         category_type = self.category_widgets[self.current_category]['type']
         is_managed_profile = category_type != 'direct_management'
 
@@ -863,8 +660,6 @@ class ModManager(QMainWindow):
         category_key = button.property("category_key")
         if category_key == self.current_category: return
         self.current_category = category_key
-        list_widget = self.category_widgets[category_key]['list']
-        self.profile_list_stack.setCurrentWidget(list_widget)
         self.update_profile_list()
 
     def edit_direct_mod_info(self, profile_name, mod_info):
@@ -879,9 +674,6 @@ class ModManager(QMainWindow):
                     profile["mods"][i]["url"] = details["url"]
                     if details["icon_source_path"] and details["icon_source_path"] != mod_info.get("icon"):
                         new_icon_path = self._copy_icon_to_cache(details["icon_source_path"], f"mod_{profile_name}_{mod_info['folder_name']}")
-                        old_icon = mod_info.get('icon')
-                        if old_icon and os.path.exists(old_icon) and self.icons_cache_path in old_icon:
-                            os.remove(old_icon)
                         profile["mods"][i]["icon"] = new_icon_path
                     break
             self.save_profiles()
@@ -892,10 +684,6 @@ class ModManager(QMainWindow):
         for button in self.category_button_group.buttons():
             self.category_button_group.removeButton(button)
             button.deleteLater()
-        while self.profile_list_stack.count() > 0:
-            widget = self.profile_list_stack.widget(0)
-            self.profile_list_stack.removeWidget(widget)
-            widget.deleteLater()
         self.category_widgets.clear()
         highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
         luminance = 0.2126 * highlight_color.redF() + 0.7152 * highlight_color.greenF() + 0.0722 * highlight_color.blueF()
@@ -919,11 +707,7 @@ class ModManager(QMainWindow):
                 button_to_select = button
             self.category_buttons_layout.addWidget(button)
             self.category_button_group.addButton(button)
-            list_widget = QListWidget()
-            list_widget.setSpacing(15); list_widget.setViewMode(QListView.ViewMode.IconMode); list_widget.setMovement(QListView.Movement.Static)
-            list_widget.setResizeMode(QListView.ResizeMode.Adjust); list_widget.setUniformItemSizes(True); list_widget.currentItemChanged.connect(self.display_profile_mods)
-            self.profile_list_stack.addWidget(list_widget)
-            self.category_widgets[original_name] = {"list": list_widget, "type": data["type"]} 
+            self.category_widgets[original_name] = {"type": data["type"]} 
         self.current_category = None
         if not button_to_select and self.category_button_group.buttons():
             button_to_select = self.category_button_group.buttons()[0]
@@ -931,52 +715,51 @@ class ModManager(QMainWindow):
             button_to_select.setChecked(True)
             self.on_category_button_clicked(button_to_select)
 
+    def _set_profile_list_model(self, model):
+        previous_selection_model = self.profile_list_view.selectionModel()
+        self.profile_list_view.setModel(model)
+        if previous_selection_model: previous_selection_model.deleteLater()
+        self.profile_list_view.selectionModel().currentChanged.connect(lambda current, _: self.display_profile_mods(current))
+
     def update_profile_list(self, select_profile_name=None):
         if not self.current_game or not self.current_category: return
-        list_widget = self.category_widgets[self.current_category]['list']
-        list_widget.blockSignals(True)
-        name_to_select = select_profile_name
-        if not name_to_select and list_widget.currentItem():
-            name_to_select = list_widget.currentItem().data(Qt.ItemDataRole.UserRole)
-        list_widget.clear()
-        while self.right_panel.count() > 0:
-            widget = self.right_panel.widget(0)
-            self.right_panel.removeWidget(widget)
-            widget.deleteLater()
+        model = self.profile_models.get((self.current_game, self.current_category))
+        if model is None:
+            model = self.profile_models[(self.current_game, self.current_category)] = ProfileListModel(self)
+        displayed_name = model.selected_name if self.profile_list_view.model() is model else None
+        name_to_select = select_profile_name or model.selected_name
+        if self.profile_list_view.model() is not model: self._set_profile_list_model(model)
+        selection_model = self.profile_list_view.selectionModel()
+        selection_model.blockSignals(True)
         game_profiles = self.profiles.setdefault(self.current_game, {})
-        category_profiles = game_profiles.setdefault(self.current_category, {})
-        category_type = self.category_widgets[self.current_category]['type']
-        sorted_profiles = sorted(category_profiles.items())
-        item_to_select = None
-        for name, profile_data in sorted_profiles:
-            icon_path = profile_data.get('icon') or self.default_icon_path
-            if not (icon_path and os.path.exists(icon_path)):
-                icon_path = self.default_icon_path
-            profile_widget = ProfileItemWidget(icon_path, name)
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, name) 
-            item.setSizeHint(QSize(92, 120)) 
-            list_widget.addItem(item)
-            list_widget.setItemWidget(item, profile_widget)
-            if name == name_to_select:
-                item_to_select = item
-        list_widget.blockSignals(False)
-        if item_to_select:
-            list_widget.setCurrentItem(item_to_select)
-        elif list_widget.count() > 0:
-            list_widget.setCurrentRow(0)
+        was_reset = model.sync(game_profiles.setdefault(self.current_category, {}))
+        row = model.row_of(name_to_select)
+        if row < 0 and model.rowCount() > 0: row = 0
+        if row >= 0: self.profile_list_view.setCurrentIndex(model.index(row))
+        else: selection_model.clear()
+        selection_model.blockSignals(False)
+        self.profile_list_view.viewport().update()
+        if was_reset or row < 0 or model.names[row] != displayed_name:
+            self.display_profile_mods(model.index(row) if row >= 0 else None)
         else:
-            self.display_profile_mods(None)
+            self.refresh_mods_list(displayed_name)
+
+    def refresh_mods_list(self, profile_name):
+        if self.category_widgets[self.current_category]['type'] == 'direct_management':
+            self.update_direct_mods_list_cards(profile_name)
+        else:
+            self.update_managed_mods_list(profile_name)
+
+    def current_profile_name(self):
+        index = self.profile_list_view.currentIndex()
+        return index.data(Qt.ItemDataRole.UserRole) if index.isValid() else None
 
     def fetch_gamebanana_data(self, category_id):
         if not requests:
             self.show_message(self.translator.translate("title_error"), self.translator.translate("msg_requests_required"), "critical")
             return None
-        url = f"https://gamebanana.com/apiv11/Mod/Categories?&_idCategoryRow={category_id}&_sSort=a_to_z"
-        headers = {'User-Agent': 'MIMM/1.0'}
         try:
-            response = requests.get(url, timeout=15, headers=headers); response.raise_for_status()
-            items, data = [], response.json()
+            items, data = [], get_api_cache().get_json(CATEGORIES_URL, params={"_idCategoryRow": category_id, "_sSort": "a_to_z"}, timeout=15)
             game_short_name = self.game_data[self.current_game]['short_name']
             game_icon_folder = os.path.join(self.user_icons_path, game_short_name)
             name_to_exclude = "NPCs & Entities"
@@ -985,8 +768,9 @@ class ModManager(QMainWindow):
                 if not name: continue
                 if name.strip() == name_to_exclude:
                     continue
-                local_icon_path = next((os.path.join(game_icon_folder, f"{name}{ext}") for ext in ['.png', '.jpg', '.jpeg', '.webp'] if os.path.exists(os.path.join(game_icon_folder, f"{name}{ext}"))), None)
+                local_icon_path = get_icon_index().find(game_icon_folder, name)
                 items.append({ "name": name, "icon_path": local_icon_path, "id": item.get('_idRow') })
+            self.category_index.record_category(self.current_game, category_id, items)
             return items
         except json.JSONDecodeError:
             self.show_message(self.translator.translate("title_api_error"), self.translator.translate("msg_api_invalid_json"), "critical")
@@ -1102,13 +886,10 @@ class ModManager(QMainWindow):
             QApplication.restoreOverrideCursor()
 
     def edit_profile(self):
-        list_widget = self.profile_list_stack.currentWidget()
-        current_item = list_widget.currentItem()
-        if not list_widget or not current_item:
+        name = self.current_profile_name()
+        if not name:
             self.show_message(self.translator.translate("title_no_selection"), self.translator.translate("msg_select_profile_to_edit"))
             return
-        name = current_item.data(Qt.ItemDataRole.UserRole)
-        if not name: return
         category_type = self.category_widgets[self.current_category]['type']
         is_name_editable = category_type in ['manual_icon', 'direct_management']
 
@@ -1162,9 +943,6 @@ class ModManager(QMainWindow):
             if details['icon_source_path']:
                 new_icon_path = self._copy_icon_to_cache(details['icon_source_path'], name) 
                 if new_icon_path and new_icon_path != profile_data.get('icon'):
-                    old_icon = profile_data.get('icon')
-                    if old_icon and os.path.exists(old_icon) and self.icons_cache_path in old_icon:
-                        os.remove(old_icon)
                     profile_data['icon'] = new_icon_path
             self.save_profiles()
             self.update_profile_list(select_profile_name=name)
@@ -1173,12 +951,7 @@ class ModManager(QMainWindow):
         if not image_content:
             return None
         try:
-            ext = ".png" 
-            final_name = self._sanitize_filename(f"mod_{profile_name}_{mod_name}_{int(time.time())}{ext}")
-            final_path = os.path.join(self.icons_cache_path, final_name)
-            with open(final_path, 'wb') as f:
-                f.write(image_content)
-            return final_path
+            return self.icon_store.put_bytes(image_content, ".png")
         except Exception as e:
             print(f"No se pudo guardar el contenido del icono en la caché: {e}")
             return None
@@ -1409,9 +1182,6 @@ class ModManager(QMainWindow):
             category_button_to_select.setChecked(True)
             category_button_to_select.blockSignals(False)
 
-            correct_list_widget = self.category_widgets[category_key]['list']
-            self.profile_list_stack.setCurrentWidget(correct_list_widget)
-
             self.update_profile_list(select_profile_name=profile_name)
 
         QTimer.singleShot(50, force_correct_category_and_profiles)
@@ -1597,9 +1367,7 @@ data = "MIMM - {character_folder_name}"
             f.write(final_string_to_write.lstrip())
             
     def remove_profile(self):
-        list_widget = self.profile_list_stack.currentWidget(); current_item = list_widget.currentItem()
-        if not list_widget or not current_item: return
-        name = current_item.data(Qt.ItemDataRole.UserRole)
+        name = self.current_profile_name()
         if not name: return
         category_type = self.category_widgets[self.current_category]['type']
         
@@ -1614,8 +1382,6 @@ data = "MIMM - {character_folder_name}"
                 print(f"DEBUG: Se ha restablecido el directorio de trabajo a: {os.getcwd()}")
             except Exception as e:
                 print(f"ADVERTENCIA: No se pudo cambiar el directorio de trabajo: {e}")
-            old_icon = profile.get('icon')
-            if old_icon and os.path.exists(old_icon) and self.icons_cache_path in old_icon: os.remove(old_icon)
             if category_type != 'direct_management':
                 management_path = self.get_management_path(self.current_game)
                 profile_path = os.path.join(management_path, profile['folder_name'])
@@ -1647,25 +1413,17 @@ data = "MIMM - {character_folder_name}"
             i += 1
         return i
 
-    def display_profile_mods(self, current_item):
-        list_widget = self.profile_list_stack.currentWidget()
-        if not list_widget: return
-
-        for i in range(list_widget.count()):
-            item = list_widget.item(i)
-            widget = list_widget.itemWidget(item)
-            if widget:
-                widget.set_selected(item == current_item)
+    def display_profile_mods(self, current_index):
+        model = self.profile_list_view.model()
+        if not model: return
+        model.selected_name = current_index.data(Qt.ItemDataRole.UserRole) if current_index is not None and current_index.isValid() else None
 
         while self.right_panel.count() > 0:
             widget = self.right_panel.widget(0)
             self.right_panel.removeWidget(widget)
             widget.deleteLater()
 
-        if not current_item:
-            return
-
-        profile_name = current_item.data(Qt.ItemDataRole.UserRole)
+        profile_name = model.selected_name
         if not profile_name:
             return
         
@@ -1718,46 +1476,8 @@ data = "MIMM - {character_folder_name}"
         except ImportError:
             print("Advertencia: No se pudieron cargar los módulos de pestañas adicionales.")
 
-    def setup_direct_management_ui_cards(self, profile_name):
-        highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
-        search_bar_stylesheet = f"""
-            QLineEdit {{
-                border: 1px solid #cccccc; border-radius: 15px; padding-left: 10px; outline: none;
-                padding-right: 10px; height: 30px;
-            }}
-            QLineEdit:focus {{ border: 1px solid {highlight_color.name()}; }}
-        """
-        self.mod_search_bar = QLineEdit()
-        self.mod_search_bar.setPlaceholderText("Buscar por nombre de mod...")
-        self.mod_search_bar.setStyleSheet(search_bar_stylesheet)
-        self.mod_search_bar.textChanged.connect(self.filter_mods_list)
-        
-        search_icon = self._create_colored_icon(self.ICON_SEARCH, self.palette().color(QPalette.ColorRole.Text))
-        self.mod_search_bar.addAction(QAction(search_icon, "", self.mod_search_bar), QLineEdit.ActionPosition.LeadingPosition)
-        self.mod_search_bar.setClearButtonEnabled(True)
-
-        self.mods_list_widget = QListWidget()
-        self.mods_list_widget.itemClicked.connect(lambda i: self.on_direct_mod_clicked(profile_name, i))
-        self.mods_list_widget.setViewMode(QListView.ViewMode.IconMode)
-        self.mods_list_widget.setResizeMode(QListView.ResizeMode.Adjust)
-        self.mods_list_widget.setMovement(QListView.Movement.Static)
-        self.mods_list_widget.setUniformItemSizes(True)
-        self.mods_list_widget.setGridSize(QSize(290, 245))
-        self.mods_list_widget.setStyleSheet("""
-            QListWidget { padding: 5px; border: none; outline: none; }
-            QListWidget::item { outline: none; margin-top: 25px; margin-left: -4px;}
-            QListWidget::item:hover { background-color: transparent; border: none; }
-            QListWidget::item:selected { background-color: transparent; }
-        """)
-        self._setup_add_mod_button(self.mods_list_widget, lambda: self.import_direct_mod(profile_name))
-        self.update_direct_mods_list_cards(profile_name)
-        return self.mod_search_bar, self.mods_list_widget
-
     def update_direct_mods_list_cards(self, profile_name):
-        if not hasattr(self, 'mods_list_widget'): return
-        
-        self.mods_list_widget.blockSignals(True)
-        self.mods_list_widget.clear()
+        if not hasattr(self, 'mods_list_view'): return
         
         profile = self.profiles[self.current_game][self.current_category].get(profile_name, {})
         mods_path = self.get_game_mods_path(self.current_game)
@@ -1770,33 +1490,13 @@ data = "MIMM - {character_folder_name}"
             synced_mods.append(mod_info)
         profile['mods'] = synced_mods
         self.save_profiles() 
-        for mod_info in sorted(profile.get("mods", []), key=lambda m: m.get('display_name', m.get('name', '')).lower()):
-            item = QListWidgetItem()
-            mod_data_for_card = {
-                "name": mod_info.get("name"),
-                "display_name": mod_info.get("display_name", mod_info.get("name")),
-                "creator": mod_info.get("creator"),
-                "url": mod_info.get("url"),
-                "icon": mod_info.get("icon"),
-                "profile_url": mod_info.get("profile_url") 
-            }
-            item.setData(Qt.ItemDataRole.UserRole, mod_info) 
-            card = ModCardWidget(mod_data_for_card, self)
-            card.set_active(mod_info.get("active", False))
-            card.delete_requested.connect(lambda mod=mod_info: self.remove_direct_mod(profile_name, mod))
-            card.edit_requested.connect(lambda mod=mod_info: self.edit_direct_mod_info(profile_name, mod))
-            card.url_requested.connect(self.open_mod_url)
-            card.update_requested.connect(lambda mod=mod_info: self.update_mod(profile_name, mod))
-            item.setSizeHint(card.sizeHint())
-            self.mods_list_widget.addItem(item)
-            self.mods_list_widget.setItemWidget(item, card)
-        self.mods_list_widget.blockSignals(False)
+        sorted_mods = sorted(profile.get("mods", []), key=lambda m: m.get('display_name', m.get('name', '')).lower())
+        self.mods_model.set_mods(sorted_mods, [mod_info.get("active", False) for mod_info in sorted_mods])
         self.filter_mods_list()
 
-    def on_direct_mod_clicked(self, profile_name, item):
-        mod_info = item.data(Qt.ItemDataRole.UserRole)
-        card_widget = self.mods_list_widget.itemWidget(item)
-        if not mod_info or not card_widget: return
+    def on_direct_mod_clicked(self, profile_name, row):
+        mod_info = self.mods_model.mod_at(row)
+        if not mod_info: return
         mod_path = os.path.join(self.get_game_mods_path(self.current_game), mod_info['folder_name'])
         if not os.path.isdir(mod_path):
             QMessageBox.warning(self, "Error", f"La carpeta del mod '{mod_info['name']}' no fue encontrada.")
@@ -1816,8 +1516,7 @@ data = "MIMM - {character_folder_name}"
                             os.rename(os.path.join(root, file_name), os.path.join(root, file_name[:-9]))
             new_active_state = not is_currently_active
             mod_info['active'] = new_active_state
-            card_widget.set_active(new_active_state)
-            item.setData(Qt.ItemDataRole.UserRole, mod_info)
+            self.mods_model.set_active(row, new_active_state)
             self._simulate_f10_press()
             self.save_profiles()
 
@@ -1835,12 +1534,9 @@ data = "MIMM - {character_folder_name}"
         search_icon = self._create_colored_icon(self.ICON_SEARCH, self.palette().color(QPalette.ColorRole.Text))
         self.mod_search_bar.addAction(QAction(search_icon, "", self.mod_search_bar), QLineEdit.ActionPosition.LeadingPosition)
         self.mod_search_bar.setClearButtonEnabled(True)
-        self.mods_list_widget = QListWidget()
-        self.mods_list_widget.itemClicked.connect(lambda i: self.on_managed_mod_clicked(profile_name, i))
-        self.mods_list_widget.setViewMode(QListView.ViewMode.IconMode); self.mods_list_widget.setResizeMode(QListView.ResizeMode.Adjust); self.mods_list_widget.setMovement(QListView.Movement.Static); self.mods_list_widget.setUniformItemSizes(False); self.mods_list_widget.setGridSize(QSize(290, 245))
-        self.mods_list_widget.setStyleSheet("QListWidget { padding: 5px; border: none; outline: none; } QListWidget::item { outline: none; margin-top: 25px; margin-left: -4px;} QListWidget::item:hover { background-color: transparent; border: none; } QListWidget::item:selected { background-color: transparent; }")
+        self._create_mods_view(profile_name, self.on_managed_mod_clicked, self.edit_managed_mod_info, self.remove_managed_mod)
         self.update_managed_mods_list(profile_name)
-        return self.mod_search_bar, self.mods_list_widget
+        return self.mod_search_bar, self.mods_list_view
 
     def setup_direct_management_ui_cards(self, profile_name):
         highlight_color = self.palette().color(QPalette.ColorRole.Highlight)
@@ -1852,12 +1548,24 @@ data = "MIMM - {character_folder_name}"
         search_icon = self._create_colored_icon(self.ICON_SEARCH, self.palette().color(QPalette.ColorRole.Text))
         self.mod_search_bar.addAction(QAction(search_icon, "", self.mod_search_bar), QLineEdit.ActionPosition.LeadingPosition)
         self.mod_search_bar.setClearButtonEnabled(True)
-        self.mods_list_widget = QListWidget()
-        self.mods_list_widget.itemClicked.connect(lambda i: self.on_direct_mod_clicked(profile_name, i))
-        self.mods_list_widget.setViewMode(QListView.ViewMode.IconMode); self.mods_list_widget.setResizeMode(QListView.ResizeMode.Adjust); self.mods_list_widget.setMovement(QListView.Movement.Static); self.mods_list_widget.setUniformItemSizes(True); self.mods_list_widget.setGridSize(QSize(290, 245))
-        self.mods_list_widget.setStyleSheet("QListWidget { padding: 5px; border: none; outline: none; } QListWidget::item { outline: none; margin-top: 25px; margin-left: -4px;} QListWidget::item:hover { background-color: transparent; border: none; } QListWidget::item:selected { background-color: transparent; }")
+        self._create_mods_view(profile_name, self.on_direct_mod_clicked, self.edit_direct_mod_info, self.remove_direct_mod)
         self.update_direct_mods_list_cards(profile_name)
-        return self.mod_search_bar, self.mods_list_widget
+        return self.mod_search_bar, self.mods_list_view
+
+    def _create_mods_view(self, profile_name, on_clicked, on_edit, on_delete):
+        self.mods_list_view = QListView()
+        self.mods_model = ModListModel(self.mods_list_view)
+        self.mods_list_view.setModel(self.mods_model)
+        delegate = ModCardDelegate(self.mods_list_view, self)
+        self.mods_list_view.setItemDelegate(delegate)
+        delegate.card_clicked.connect(lambda row: on_clicked(profile_name, row))
+        delegate.edit_requested.connect(lambda mod: on_edit(profile_name, mod))
+        delegate.delete_requested.connect(lambda mod: on_delete(profile_name, mod))
+        delegate.url_requested.connect(self.open_mod_url)
+        delegate.update_requested.connect(lambda mod: self.update_mod(profile_name, mod))
+        self.mods_list_view.setViewMode(QListView.ViewMode.IconMode); self.mods_list_view.setResizeMode(QListView.ResizeMode.Adjust); self.mods_list_view.setMovement(QListView.Movement.Static); self.mods_list_view.setUniformItemSizes(True); self.mods_list_view.setGridSize(QSize(290, 245))
+        self.mods_list_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.mods_list_view.setStyleSheet("QListView { padding: 5px; border: none; outline: none; }")
     
     def _reposition_floating_buttons(self):
         if not hasattr(self, 'add_mod_button') or not self.add_mod_button.parentWidget(): return
@@ -1868,7 +1576,7 @@ data = "MIMM - {character_folder_name}"
         margin_right = 20
         margin_bottom = 10
         
-        list_widget_for_scrollbar = parent_widget.findChild(QListWidget)
+        list_widget_for_scrollbar = parent_widget.findChild(QListView)
         if list_widget_for_scrollbar:
             scrollbar = list_widget_for_scrollbar.verticalScrollBar()
             if scrollbar and scrollbar.isVisible():
@@ -1894,20 +1602,15 @@ data = "MIMM - {character_folder_name}"
         QTimer.singleShot(10, self._reposition_floating_buttons)
 
     def filter_mods_list(self):
-        if not hasattr(self, 'mods_list_widget') or not hasattr(self, 'mod_search_bar'):
+        if not hasattr(self, 'mods_list_view') or not hasattr(self, 'mod_search_bar'):
             return
         filter_text = self.mod_search_bar.text().lower()
-        for i in range(self.mods_list_widget.count()):
-            item = self.mods_list_widget.item(i)
-            mod_info = item.data(Qt.ItemDataRole.UserRole)
+        for row, mod_info in enumerate(self.mods_model.mods):
             if mod_info.get("slot_id") == 0:
-                item.setHidden(False)
+                self.mods_list_view.setRowHidden(row, False)
                 continue 
             searchable_name = (mod_info.get("display_name") or mod_info.get("name", "")).lower()
-            if filter_text in searchable_name:
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+            self.mods_list_view.setRowHidden(row, filter_text not in searchable_name)
 
     def import_managed_mod(self, profile_name):
         if not patoolib: 
@@ -1973,32 +1676,12 @@ data = "MIMM - {character_folder_name}"
                 shutil.rmtree(mod_dest_path)
 
     def update_managed_mods_list(self, profile_name):
-        if not hasattr(self, 'mods_list_widget'): return
-        self.mods_list_widget.blockSignals(True)
-        self.mods_list_widget.clear()
+        if not hasattr(self, 'mods_list_view'): return
         profile = self.profiles[self.current_game][self.current_category].get(profile_name, {})
         active_mod_path = profile.get("active_mod")
-        item_none = QListWidgetItem()
-        item_none.setData(Qt.ItemDataRole.UserRole, {"path": None, "slot_id": 0})
-        card_none = NoneModCardWidget(self)
-        card_none.set_active(not active_mod_path)
-        item_none.setSizeHint(QSize(232, 220)) 
-        self.mods_list_widget.addItem(item_none)
-        self.mods_list_widget.setItemWidget(item_none, card_none)
         sorted_mods = sorted(profile.get("mods", []), key=lambda m: m.get('display_name', m.get('name', '')).lower())
-        for mod_info in sorted_mods:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, mod_info)
-            card = ModCardWidget(mod_info, self)
-            card.set_active(active_mod_path == mod_info.get("path"))
-            card.delete_requested.connect(lambda mod=mod_info: self.remove_managed_mod(profile_name, mod))
-            card.edit_requested.connect(lambda mod=mod_info: self.edit_managed_mod_info(profile_name, mod))
-            card.url_requested.connect(self.open_mod_url)
-            card.update_requested.connect(lambda mod=mod_info: self.update_mod(profile_name, mod))
-            item.setSizeHint(QSize(232, 220))
-            self.mods_list_widget.addItem(item)
-            self.mods_list_widget.setItemWidget(item, card)
-        self.mods_list_widget.blockSignals(False)
+        mods = [{"path": None, "slot_id": 0}] + sorted_mods
+        self.mods_model.set_mods(mods, [not active_mod_path] + [active_mod_path == mod_info.get("path") for mod_info in sorted_mods])
         self.filter_mods_list()
 
     def _simulate_f10_press(self):
@@ -2058,10 +1741,6 @@ data = "MIMM - {character_folder_name}"
         if profile.get("active_mod") == mod_info_to_delete['path']:
             profile["active_mod"] = None
             self._activate_mod_via_keypress(profile['profile_id'], 0)
-        
-        old_icon = mod_info_to_delete.get('icon')
-        if old_icon and os.path.exists(old_icon) and self.icons_cache_path in old_icon:
-            os.remove(old_icon)
 
         if not self._safe_remove_directory(mod_info_to_delete['path']):
             self.update_managed_mods_list(profile_name) 
@@ -2084,8 +1763,8 @@ data = "MIMM - {character_folder_name}"
         self._simulate_f10_press()
         
 
-    def on_managed_mod_clicked(self, profile_name, item):
-        mod_info = item.data(Qt.ItemDataRole.UserRole)
+    def on_managed_mod_clicked(self, profile_name, row):
+        mod_info = self.mods_model.mod_at(row)
         if not mod_info: return
         profile = self.profiles[self.current_game][self.current_category][profile_name]
         if mod_info.get("path") == profile.get("active_mod"):
@@ -2093,13 +1772,7 @@ data = "MIMM - {character_folder_name}"
         profile["active_mod"] = mod_info.get("path")
         self.save_profiles()
         self._activate_mod_via_keypress(profile['profile_id'], mod_info['slot_id'])
-        for i in range(self.mods_list_widget.count()):
-            current_item = self.mods_list_widget.item(i)
-            widget = self.mods_list_widget.itemWidget(current_item)
-            if widget and hasattr(widget, 'set_active'):
-                item_data = current_item.data(Qt.ItemDataRole.UserRole)
-                is_this_one_active = (item_data.get("path") == profile["active_mod"])
-                widget.set_active(is_this_one_active)
+        self.mods_model.set_active_flags([item_data.get("path") == profile["active_mod"] for item_data in self.mods_model.mods])
 
     def edit_managed_mod_info(self, profile_name, mod_info):
         dialog = ModInfoDialog(mod_info, self)
@@ -2113,9 +1786,6 @@ data = "MIMM - {character_folder_name}"
                     profile["mods"][i]["url"] = details["url"]
                     if details["icon_source_path"] and details["icon_source_path"] != mod_info.get("icon"):
                         new_icon_path = self._copy_icon_to_cache(details["icon_source_path"], f"mod_{profile_name}_{mod_info['name']}")
-                        old_icon = mod_info.get('icon')
-                        if old_icon and os.path.exists(old_icon) and self.icons_cache_path in old_icon:
-                            os.remove(old_icon)
                         
                         profile["mods"][i]["icon"] = new_icon_path
                     break
@@ -2248,10 +1918,6 @@ data = "MIMM - {character_folder_name}"
             self.update_direct_mods_list_cards(profile_name) 
             return
 
-        old_icon = mod_info_to_delete.get('icon')
-        if old_icon and os.path.exists(old_icon) and self.icons_cache_path in old_icon:
-            os.remove(old_icon)
-        
         profile = self.profiles[self.current_game][self.current_category][profile_name]
         profile['mods'] = [m for m in profile['mods'] if m['folder_name'] != mod_info_to_delete['folder_name']]
         self.save_profiles()
@@ -2367,7 +2033,7 @@ data = "MIMM - {character_folder_name}"
         layout.addWidget(mods_container)
         self._setup_floating_buttons(mods_container, add_callback, scan_callback)
 
-    def _install_direct_mod_from_api(self, profile_name, mod_data, archive_path):
+    def _install_direct_mod_from_api(self, profile_name, mod_data, archive_path, file_data=None):
         mod_folder_name = self._sanitize_filename(mod_data.get('_sName'))
         mods_path = self.get_game_mods_path(self.current_game)
         mod_dest_path = os.path.join(mods_path, mod_folder_name)
@@ -2392,7 +2058,8 @@ data = "MIMM - {character_folder_name}"
             "creator": mod_data.get('_aSubmitter', {}).get('_sName'),
             "url": mod_data.get('_sProfileUrl'),
             "profile_url": mod_data.get('_sProfileUrl'),
-            "icon": icon_path
+            "icon": icon_path,
+            **self._get_api_mod_ids(mod_data, file_data)
         }
         profile["mods"].append(new_mod_info)
         self.save_profiles()
@@ -2407,18 +2074,14 @@ data = "MIMM - {character_folder_name}"
         if not source_path or not os.path.exists(source_path):
             return None
         try:
-            if self.icons_cache_path in os.path.normpath(source_path):
-                return source_path
-            ext = os.path.splitext(source_path)[1] or ".png"
-            final_name = self._sanitize_filename(f"{base_filename}_{int(time.time())}{ext}")
-            final_path = os.path.join(self.icons_cache_path, final_name)
-            shutil.copy(source_path, final_path)
+            final_path = self.icon_store.put_file(source_path)
+            get_icon_metadata().ensure(final_path)
             return final_path
         except Exception as e:
             print(f"No se pudo copiar el icono a la caché: {e}")
             return None
 
-    def _install_managed_mod_from_api(self, profile_name, mod_data, archive_path, forced_slot_id=None):
+    def _install_managed_mod_from_api(self, profile_name, mod_data, archive_path, forced_slot_id=None, file_data=None):
         mod_name = self._sanitize_filename(mod_data.get('_sName'))
         profile = self.profiles[self.current_game][self.current_category][profile_name]
 
@@ -2444,7 +2107,8 @@ data = "MIMM - {character_folder_name}"
             "creator": mod_data.get('_aSubmitter', {}).get('_sName'),
             "url": mod_data.get('_sProfileUrl'),
             "profile_url": mod_data.get('_sProfileUrl'),
-            "icon": icon_path
+            "icon": icon_path,
+            **self._get_api_mod_ids(mod_data, file_data)
         }
         
         profile["mods"].append(new_mod_info)
@@ -2483,7 +2147,7 @@ data = "MIMM - {character_folder_name}"
         img_url = valid_image_info['_sBaseUrl'] + '/' + valid_image_info[file_key]
         
         try:
-            response = requests.get(img_url, timeout=15, headers={'User-Agent': 'MIMM/1.0'})
+            response = get_http_client().get(img_url, timeout=15)
             response.raise_for_status()
             image_content = response.content
 
@@ -2495,11 +2159,7 @@ data = "MIMM - {character_folder_name}"
             ext = os.path.splitext(img_url)[1] or ".jpg" 
             if '?' in ext: ext = ext.split('?')[0] 
             
-            final_name = self._sanitize_filename(f"mod_{profile_name}_{mod_name}_{int(time.time())}{ext}")
-            final_path = os.path.join(self.icons_cache_path, final_name)
-            
-            with open(final_path, 'wb') as f:
-                f.write(image_content)
+            final_path = self.icon_store.put_bytes(image_content, ext)
 
             if os.path.exists(final_path) and os.path.getsize(final_path) > 0:
                 return final_path
@@ -2531,8 +2191,8 @@ data = "MIMM - {character_folder_name}"
             with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
                 archive_path = tmp_file.name
                 
-                qnam = QNetworkAccessManager()
-                reply = qnam.get(QNetworkRequest(QUrl(download_url)))
+                reply = self.network_manager.get(QNetworkRequest(QUrl(get_http_client().resolve_url(download_url))))
+                started = time.monotonic()
                 
                 loop = QEventLoop()
                 reply.finished.connect(loop.quit)
@@ -2541,8 +2201,11 @@ data = "MIMM - {character_folder_name}"
                 )
                 loop.exec()
 
-                if reply.error() == reply.NetworkError.NoError:
-                    tmp_file.write(reply.readAll().data())
+                reply_ok = reply.error() == reply.NetworkError.NoError
+                reply_data = reply.readAll().data() if reply_ok else b""
+                get_http_client().record_request(download_url, time.monotonic() - started, len(reply_data), reply_ok)
+                if reply_ok:
+                    tmp_file.write(reply_data)
                     download_successful = True
                 else:
                     raise requests.RequestException(f"Error de red: {reply.errorString()}")
@@ -2555,9 +2218,9 @@ data = "MIMM - {character_folder_name}"
                 installer_func = self._install_direct_mod_from_api if category_type == 'direct_management' else self._install_managed_mod_from_api
 
                 if category_type == 'direct_management':
-                    installer_func(profile_name, mod_data, archive_path)
+                    installer_func(profile_name, mod_data, archive_path, file_data=file_data)
                 else:
-                    installer_func(profile_name, mod_data, archive_path, forced_slot_id=forced_slot_id)
+                    installer_func(profile_name, mod_data, archive_path, forced_slot_id=forced_slot_id, file_data=file_data)
             
         except requests.RequestException as e:
             self.show_message(self.translator.translate("title_download_error"), self.translator.translate("msg_download_failed", e=e), "critical")
@@ -2574,14 +2237,16 @@ data = "MIMM - {character_folder_name}"
             if archive_path and os.path.exists(archive_path):
                 os.remove(archive_path)
         
-    def _extract_and_copy_mod(self, archive_path, dest_path):
+    def _extract_and_copy_mod(self, archive_path, dest_path, is_cancelled=None):
         with tempfile.TemporaryDirectory() as temp_dir:
             patoolib.extract_archive(archive_path, outdir=temp_dir)
+            if is_cancelled and is_cancelled(): return
             extracted_contents = os.listdir(temp_dir)
             source_folder = temp_dir
             if len(extracted_contents) == 1 and os.path.isdir(os.path.join(temp_dir, extracted_contents[0])):
                 source_folder = os.path.join(temp_dir, extracted_contents[0])
-            shutil.copytree(source_folder, dest_path)
+            copy_function = (lambda src, dst: None if is_cancelled() else shutil.copy2(src, dst)) if is_cancelled else shutil.copy2
+            shutil.copytree(source_folder, dest_path, copy_function=copy_function)
 
     def _download_mod_icon(self, mod_data, profile_name, mod_name):
         previews = mod_data.get('_aPreviewMedia', [])
@@ -2596,7 +2261,7 @@ data = "MIMM - {character_folder_name}"
         img_url = img_info['_sBaseUrl'] + '/' + img_info[file_key]
         
         try:
-            response = requests.get(img_url, timeout=15, headers={'User-Agent': 'MIMM/1.0'})
+            response = get_http_client().get(img_url, timeout=15)
             response.raise_for_status()
             image_content = response.content
             pixmap_validator = QPixmap()
@@ -2663,59 +2328,72 @@ data = "MIMM - {character_folder_name}"
 
         QTimer.singleShot(5, self._reposition_floating_buttons)
 
+    def _find_gamebanana_mod_id_by_name(self, game_id, mod_name):
+        API_BYTE_MAX_LENGTH = 50
+        search_name = mod_name
+        if len(mod_name.encode('utf-8')) > API_BYTE_MAX_LENGTH:
+            truncated_chars = []
+            current_byte_length = 0
+            for char in mod_name:
+                char_bytes = char.encode('utf-8')
+                if current_byte_length + len(char_bytes) > API_BYTE_MAX_LENGTH:
+                    break
+                truncated_chars.append(char)
+                current_byte_length += len(char_bytes)
+            search_name = "".join(truncated_chars)
+        local_mod_id = get_mod_index().find_id_by_name(game_id, mod_name)
+        if local_mod_id:
+            return local_mod_id
+
+        search_url = f"https://gamebanana.com/apiv11/Game/{game_id}/Subfeed"
+        params = {"_nPage": 1, "_sSort": "new", "_sName": search_name}
+        response = get_http_client().get(search_url, params=params, timeout=20)
+        response.raise_for_status()
+        records = [record for record in response.json().get("_aRecords", []) if record.get("_sModelName") == "Mod"]
+        get_mod_index().add_records(records, game_id)
+        for record in records:
+            if record.get("_sName") == mod_name:
+                return record.get("_idRow")
+        return None
+
+    def _place_updated_mod_files(self, mod_id, file_data, archive_path, dest_path):
+        if archive_path is None:
+            if not self.update_stager.take_staged(mod_id, file_data.get('_idRow'), dest_path):
+                raise OSError(f"No se pudo aplicar la actualización pre-descargada del mod {mod_id}")
+            return
+        self._extract_and_copy_mod(archive_path, dest_path)
+
     def update_mod(self, profile_name, mod_info):
         original_mod_name = mod_info.get("name")
         if not original_mod_name:
             self.show_message(self.translator.translate("title_error"), self.translator.translate("msg_update_no_original_name"), "critical")
             return
 
-        game_id = self.game_data[self.current_game].get("game_id")
-        if not game_id:
-            self.show_message(self.translator.translate("title_error"), self.translator.translate("msg_update_no_api_search"), "critical")
-            return
-
         existing_icon_path = mod_info.get("icon")
         old_mod_path = mod_info.get("path")
         old_folder_name = mod_info.get("folder_name")
+        mod_id = mod_info.get("mod_id") or self._extract_gamebanana_mod_id(mod_info.get("profile_url"))
 
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        
-        API_BYTE_MAX_LENGTH = 50
-        search_name = original_mod_name
-        
-        if len(original_mod_name.encode('utf-8')) > API_BYTE_MAX_LENGTH:
-            truncated_chars = []
-            current_byte_length = 0
-            for char in original_mod_name:
-                char_bytes = char.encode('utf-8')
-                if current_byte_length + len(char_bytes) > API_BYTE_MAX_LENGTH:
-                    break
-                truncated_chars.append(char)
-                current_byte_length += len(char_bytes)
-            search_name = "".join(truncated_chars)
-        
         try:
-            search_url = f"https://gamebanana.com/apiv11/Game/{game_id}/Subfeed"
-            params = {"_nPage": 1, "_sSort": "new", "_sName": search_name}
-            response = requests.get(search_url, params=params, timeout=20, headers={'User-Agent': 'MIMM/1.0'})
-            response.raise_for_status()
-            search_data = response.json()
-
-            mod_id, remote_mod_data = None, None
-            for record in search_data.get("_aRecords", []):
-                if record.get("_sModelName") == "Mod" and record.get("_sName") == original_mod_name:
-                    mod_id, remote_mod_data = record.get("_idRow"), record
-                    break
-
             if not mod_id:
-                self.show_message(self.translator.translate("title_not_found"), self.translator.translate("msg_update_no_exact_match", name=original_mod_name))
-                return
+                game_id = self.game_data[self.current_game].get("game_id")
+                if not game_id:
+                    self.show_message(self.translator.translate("title_error"), self.translator.translate("msg_update_no_api_search"), "critical")
+                    return
+                mod_id = self._find_gamebanana_mod_id_by_name(game_id, original_mod_name)
+                if not mod_id:
+                    self.show_message(self.translator.translate("title_not_found"), self.translator.translate("msg_update_no_exact_match", name=original_mod_name))
+                    return
+                mod_info["mod_id"] = mod_id
+                self.save_profiles()
 
-            files_url = f"https://gamebanana.com/apiv11/Mod/{mod_id}"
-            params = {"_csvProperties": "_aFiles"}
-            response = requests.get(files_url, params=params, timeout=20, headers={'User-Agent': 'MIMM/1.0'})
-            response.raise_for_status()
-            files_list = response.json().get("_aFiles", [])
+            mod_url = f"https://gamebanana.com/apiv11/Mod/{mod_id}"
+            params = {"_csvProperties": "_idRow,_sName,_aSubmitter,_sProfileUrl,_aFiles"}
+            remote_mod_data = dict(get_api_cache().get_json(mod_url, params=params, force_refresh=True, timeout=20))
+            remote_mod_data.setdefault('_idRow', mod_id)
+            get_mod_index().add_records([remote_mod_data], self.game_data[self.current_game].get("game_id"))
+            files_list = remote_mod_data.get("_aFiles", [])
 
             if not files_list:
                 self.show_message(self.translator.translate("title_no_files"), self.translator.translate("msg_update_no_downloadable_files"))
@@ -2756,57 +2434,63 @@ data = "MIMM - {character_folder_name}"
                 profile['mods'] = [m for m in profile['mods'] if m.get('path') != old_mod_path]
 
             download_url = file_to_install.get('_sDownloadUrl')
-            if not download_url:
+            is_staged = self.update_stager.has_staged(mod_id, file_to_install.get('_idRow'))
+            if not download_url and not is_staged:
                 self.show_message(self.translator.translate("title_error"), self.translator.translate("error_no_download_url"), "critical")
                 return
 
-            progress_dialog = DownloadProgressDialog(self.translator, self)
-            progress_dialog.show()
-
             archive_path = None
-            download_successful = False
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                    archive_path = tmp_file.name
-                    qnam = QNetworkAccessManager()
-                    reply = qnam.get(QNetworkRequest(QUrl(download_url)))
-                    
-                    loop = QEventLoop()
-                    reply.finished.connect(loop.quit)
-                    reply.downloadProgress.connect(lambda r, t: progress_dialog.update_progress(int(r/t*100)) if t > 0 else None)
-                    loop.exec()
-
-                    if reply.error() == reply.NetworkError.NoError:
-                        tmp_file.write(reply.readAll().data())
-                        download_successful = True
-                    else:
-                        self.show_message(self.translator.translate("title_download_error"), self.translator.translate("msg_download_failed", e=reply.errorString()), "critical")
-                    reply.deleteLater()
-            finally:
-                progress_dialog.close()
+            if not is_staged:
+                progress_dialog = DownloadProgressDialog(self.translator, self)
+                progress_dialog.show()
 
-            if not download_successful:
-                if archive_path and os.path.exists(archive_path): os.remove(archive_path)
-                return
+                download_successful = False
+                try:
+                    with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
+                        archive_path = tmp_file.name
+                        reply = self.network_manager.get(QNetworkRequest(QUrl(get_http_client().resolve_url(download_url))))
+                        started = time.monotonic()
+
+                        loop = QEventLoop()
+                        reply.finished.connect(loop.quit)
+                        reply.downloadProgress.connect(lambda r, t: progress_dialog.update_progress(int(r/t*100)) if t > 0 else None)
+                        loop.exec()
+
+                        reply_ok = reply.error() == reply.NetworkError.NoError
+                        reply_data = reply.readAll().data() if reply_ok else b""
+                        get_http_client().record_request(download_url, time.monotonic() - started, len(reply_data), reply_ok)
+                        if reply_ok:
+                            tmp_file.write(reply_data)
+                            download_successful = True
+                        else:
+                            self.show_message(self.translator.translate("title_download_error"), self.translator.translate("msg_download_failed", e=reply.errorString()), "critical")
+                        reply.deleteLater()
+                finally:
+                    progress_dialog.close()
+
+                if not download_successful:
+                    if archive_path and os.path.exists(archive_path): os.remove(archive_path)
+                    return
             try:
                 sanitized_mod_name = self._sanitize_filename(remote_mod_data.get('_sName'))
                 
                 if category_type == 'direct_management':
                     mod_dest_path = os.path.join(self.get_game_mods_path(self.current_game), sanitized_mod_name)
-                    self._extract_and_copy_mod(archive_path, mod_dest_path)
+                    self._place_updated_mod_files(mod_id, file_to_install, archive_path, mod_dest_path)
                     new_mod_info = {
                         "name": original_mod_name, "folder_name": sanitized_mod_name,
                         "display_name": remote_mod_data.get('_sName'),
                         "creator": remote_mod_data.get('_aSubmitter', {}).get('_sName'),
                         "url": remote_mod_data.get('_sProfileUrl'),
                         "profile_url": remote_mod_data.get('_sProfileUrl'),
-                        "icon": existing_icon_path
+                        "icon": existing_icon_path,
+                        **self._get_api_mod_ids(remote_mod_data, file_to_install)
                     }
                     profile["mods"].append(new_mod_info)
                 else: 
                     profile_folder_name = profile['folder_name']
                     mod_dest_path = os.path.join(self.get_management_path(self.current_game), profile_folder_name, sanitized_mod_name)
-                    self._extract_and_copy_mod(archive_path, mod_dest_path)
+                    self._place_updated_mod_files(mod_id, file_to_install, archive_path, mod_dest_path)
                     for root, _, files in os.walk(mod_dest_path):
                         for file in files:
                             if file.lower().endswith('.ini'):
@@ -2817,7 +2501,8 @@ data = "MIMM - {character_folder_name}"
                         "creator": remote_mod_data.get('_aSubmitter', {}).get('_sName'),
                         "url": remote_mod_data.get('_sProfileUrl'),
                         "profile_url": remote_mod_data.get('_sProfileUrl'),
-                        "icon": existing_icon_path
+                        "icon": existing_icon_path,
+                        **self._get_api_mod_ids(remote_mod_data, file_to_install)
                     }
                     profile["mods"].append(new_mod_info)
                     profile['mods'].sort(key=lambda m: m.get('slot_id', 999))
@@ -2909,14 +2594,9 @@ data = "MIMM - {character_folder_name}"
         
         if (self.current_game == game and
             self.current_category == category and
-            self.profile_list_stack.currentWidget().currentItem() and
-            self.profile_list_stack.currentWidget().currentItem().data(Qt.ItemDataRole.UserRole) == profile_name):
+            self.current_profile_name() == profile_name):
             print("La vista actual coincide. Refrescando la lista de mods...")
-            category_type = self.category_widgets[self.current_category]['type']
-            if category_type == 'direct_management':
-                self.update_direct_mods_list_cards(profile_name)
-            else:
-                self.update_managed_mods_list(profile_name)
+            self.refresh_mods_list(profile_name)
         else:
             print("La vista actual no coincide, no se requiere refresco de UI.")
 
@@ -3049,10 +2729,16 @@ data = "MIMM - {character_folder_name}"
         self.tray_icon.activated.connect(self.on_tray_icon_activated)
         self.tray_icon.show()
 
+    def _on_thumbnails_ready(self, icon_path, thumbnails):
+        if apply_thumbnails(self.profiles, icon_path, thumbnails):
+            self.thumbnail_save_timer.start()
+
     def save_profiles(self):
         path = os.path.join(self.app_data_path, "mod_manager_profiles.json") 
         with open(path, 'w') as f:
             json.dump(self.profiles, f, indent=4)
+        self.icon_store.schedule_collect(self.profiles)
+        get_thumbnail_service().schedule_backfill(self.profiles)
         if hasattr(self, 'overlay_controller'):
             self.overlay_controller.reload_profiles()
 
@@ -3081,6 +2767,13 @@ data = "MIMM - {character_folder_name}"
             self.icon_sync_thread.quit()
             self.icon_sync_thread.wait()
             print("Hilo detenido.")
+        if hasattr(self, 'update_stager'):
+            self.update_stager.stop()
+        get_icon_loader().shutdown()
+        get_thumbnail_service().shutdown()
+        get_icon_metadata().flush()
+        get_http_client().log_metrics()
+        get_http_client().close()
         self.is_quitting = True
         self.close() 
 